@@ -1,17 +1,43 @@
 import os
-from flask import Flask, jsonify
+import time
+import threading
+import redis
+from flask import Flask, Response, g, jsonify, request
 from flasgger import Swagger # type: ignore
 from flask_caching import Cache
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from werkzeug.routing import BaseConverter
 from dotenv import load_dotenv
-from scrapers.ufc_scraper import get_upcoming_ufc_schedule
-from typing import Any, Dict, List, Sequence, Union, Callable, cast
 
-# Load environment variables from .env file
+# Load environment variables from .env file, before the modules below read their settings at import time
 load_dotenv()
 
+from scrapers.ufc_scraper import get_upcoming_ufc_schedule, last_scrape_stats, wiki_mapping_state
+from scrapers.http_client import CircuitOpenError, breaker_stats, request_observers
+from scrapers.http_cache import http_cache, parse_cache
+from event_query import (ALL_FIELDS, BASIC_FIELDS, InvalidQueryError, parse_batch, parse_date_param, parse_fields_param,
+                         parse_int_param, parse_query, project_events)
+from event_index import EventIndex, index_for
+from responses import (dumps, events_payload, projection_key, render, render_snapshot, send_rendered, stream_ndjson,
+                       wants_ndjson)
+from archive import ARCHIVE_DEFAULT_LIMIT, ARCHIVE_MAX_LIMIT, ArchiveStore, sync_if_due
+from fight_cards import EVENT_ID_PATTERN, FIGHT_CARD_KEY, EventNotFoundError, FightCardStore
+from tiered_cache import TieredCache
+from metrics import Metrics
+from profiling import RequestProfiler, phase, record_phase, server_timing_header
+from snapshot import SNAPSHOT_KEY, SnapshotStore, BackgroundRefresher, SnapshotUnavailableError, get_current_snapshot
+from typing import Any, Dict, List, Optional, Sequence, Union, Callable, cast
+
 app = Flask(__name__)
+
+class EventIdConverter(BaseConverter):
+    """
+    UFCStats event ids only, so other segments under /api/events/ (batch, past, typos) never reach get_event
+    """
+    regex = EVENT_ID_PATTERN
+
+app.url_map.converters['event_id'] = EventIdConverter
 swagger = Swagger(app)
 
 # Configure caching
@@ -22,15 +48,222 @@ cache = Cache(app, config={
     'CACHE_DEFAULT_TIMEOUT': int(os.getenv('CACHE_TIMEOUT', 43200))
 })
 
+redis_client = redis.Redis(host=os.getenv('REDIS_HOST', 'localhost'), port=int(os.getenv('REDIS_PORT', 6379)))
+
+# Counters and latency histograms, summed over all workers in Redis and served by /api/metrics
+metrics = Metrics(redis_client)
+metrics.histogram('http_request_duration_seconds', 'Time to handle a request, by endpoint')
+metrics.counter('http_requests_total', 'Requests handled, by endpoint and status')
+metrics.histogram('rate_limit_check_seconds', 'Time spent checking the rate limit (a Redis round-trip)')
+metrics.histogram('scrape_duration_seconds', 'Duration of a full schedule scrape')
+metrics.counter('scrape_events_total', 'Events seen by schedule scrapes, by source (reused from the store or fetched)')
+metrics.counter('upstream_requests_total', 'Upstream HTTP requests, by host and status (0 for no response)')
+metrics.counter('upstream_response_bytes_total', 'Upstream response body bytes, by host')
+metrics.histogram('upstream_request_duration_seconds', 'Upstream request latency, by host')
+metrics.counter('cache_lookups_total', 'Cache lookups, by cache and result')
+
+# Opt-in cProfile of requests (X-Profile-Token or PROFILE_SAMPLE_RATE), written to PROFILE_DIR when slow
+profiler = RequestProfiler()
+
+# Registered before the limiter so its check is part of the measured (and profiled) time
+@app.before_request
+def start_request_timer() -> None:
+    g.request_started = time.perf_counter()
+    profiler.start()
+
 # Configure rate limiting
 default_limits = cast(Any, os.getenv('RATELIMIT_DEFAULT', "200 per day;50 per hour").split(';'))
 limiter = Limiter(
     get_remote_address,
     app=app,
     default_limits=default_limits,
-    storage_uri=f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{os.getenv('REDIS_PORT', 6379)}"
+    storage_uri=os.getenv('RATELIMIT_STORAGE_URI',
+                          f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{os.getenv('REDIS_PORT', 6379)}")
 )
 
+# Runs right after the limiter's check
+@app.before_request
+def record_rate_limit_time() -> None:
+    elapsed = time.perf_counter() - g.request_started
+    metrics.observe('rate_limit_check_seconds', elapsed)
+    record_phase('ratelimit', elapsed)
+
+# In-process copies of the snapshot and fight cards in front of Redis, dropped on pub/sub invalidations
+shared_cache = TieredCache(
+    cache.cache,
+    local=lambda key: key == SNAPSHOT_KEY or key.startswith(f"{FIGHT_CARD_KEY}:"),
+    client=redis_client
+)
+
+metrics.collector('cache_lookups_total', shared_cache.stats, {'cache': 'tiered'}, keys=('l1_hits', 'l2_hits', 'misses'))
+metrics.collector('cache_lookups_total', http_cache.stats, {'cache': 'http'}, keys=('hits', 'misses'))
+metrics.collector('cache_lookups_total', parse_cache.stats, {'cache': 'parse'}, keys=('hits', 'misses'))
+
+def record_upstream_request(host: str, status: int, size: int, elapsed: float) -> None:
+    metrics.inc('upstream_requests_total', {'host': host, 'status': str(status)})
+    metrics.inc('upstream_response_bytes_total', {'host': host}, size)
+    metrics.observe('upstream_request_duration_seconds', elapsed, {'host': host})
+
+request_observers.append(record_upstream_request)
+
+def build_schedule() -> List[Dict[str, Any]]:
+    with metrics.timer('scrape_duration_seconds'):
+        events: List[Dict[str, Any]] = get_upcoming_ufc_schedule()
+    for source, count in last_scrape_stats.items():
+        metrics.inc('scrape_events_total', {'source': source}, count)
+    return events
+
+def describe_schedule() -> Dict[str, Any]:
+    """
+    Stored with each snapshot: whether its Fight Night numbers came from the last known Wikipedia mapping
+    """
+    return {'wiki_mapping': dict(wiki_mapping_state)}
+
+# Schedule snapshot, rebuilt in the background so requests never wait on a scrape
+snapshot_store = SnapshotStore(shared_cache, build_schedule, renderer=render_snapshot, describer=describe_schedule)
+background_refresh = os.getenv('SNAPSHOT_BACKGROUND_REFRESH', 'True').lower() == 'true'
+refresher: Optional[BackgroundRefresher] = None
+refresher_lock = threading.Lock()
+
+# Fight cards, fetched on first request and cached per event
+fight_card_store = FightCardStore(shared_cache)
+
+# Completed events, synced every ARCHIVE_SYNC_INTERVAL by the background refresher
+# (or by hand with `python src/archive.py backfill|sync`)
+archive_store = ArchiveStore()
+
+@app.before_request
+def start_refresher() -> None:
+    global refresher
+    if not app.testing:
+        shared_cache.start_listener()
+    if refresher is not None or not background_refresh or app.testing:
+        return
+    with refresher_lock:
+        if refresher is None:
+            refresher = BackgroundRefresher(snapshot_store, tasks=[lambda: sync_if_due(archive_store)])
+            refresher.start()
+
+@app.after_request
+def record_request(response: Response) -> Response:
+    started = g.get('request_started')
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        labels = {'endpoint': request.endpoint or 'unmatched', 'method': request.method}
+        metrics.observe('http_request_duration_seconds', elapsed, labels)
+        metrics.inc('http_requests_total', dict(labels, status=str(response.status_code)))
+        # Streamed bodies are produced after this point and are not part of either
+        response.headers['Server-Timing'] = server_timing_header(elapsed)
+        profile = profiler.stop(elapsed)
+        if profile and g.get('profile_forced'):
+            response.headers['X-Profile'] = profile
+    metrics.maybe_flush()
+    return response
+
+@app.after_request
+def add_staleness_headers(response: Response) -> Response:
+    """
+    Tell clients how old the schedule data is. Bodies are rendered when the snapshot is built,
+    so a snapshot kept after failed rebuilds, or built with the last known Wikipedia mapping,
+    is flagged in headers rather than in the body.
+    """
+    snapshot = g.get('snapshot')
+    if snapshot is None:
+        return response
+    response.headers['X-Data-Age'] = str(int(time.time() - snapshot['built_at']))
+    if snapshot.get('stale_since') or snapshot.get('wiki_mapping', {}).get('fallback'):
+        response.headers['X-Data-Stale'] = 'true'
+        response.headers['Warning'] = '110 - "Response is Stale"'
+    return response
+
+def get_snapshot() -> Dict[str, Any]:
+    """
+    Return the current snapshot (never scrapes when the refresher is running)
+    """
+    with phase('snapshot'):
+        snapshot: Dict[str, Any] = get_current_snapshot(snapshot_store, refresher)
+    g.snapshot = snapshot
+    return snapshot
+
+def filter_query(index: EventIndex, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = index.filter(event_type=query['event_type'], search=query['search'],
+                                                date_from=query['date_from'], date_to=query['date_to'],
+                                                after=query['after'])
+    return events
+
+def query_payload(index: EventIndex, query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Response payload of a parsed query: the projected matches, plus a `next` cursor when it has a limit
+    """
+    events = filter_query(index, query)
+    limit = query['limit']
+    payload: Dict[str, Any] = events_payload(project_events(events[:limit], query['fields']))
+    if limit:
+        # Cursor for the next page, or None on the last one
+        payload['next'] = events[limit - 1].get('event_id') if len(events) > limit else None
+    return payload
+
+def events_response(default_fields: Sequence[str]) -> Any:
+    """
+    Shared body of the upcoming event endpoints, which only differ in their default `fields`.
+    Unfiltered requests for a common projection get the bytes rendered when the snapshot was built;
+    everything else goes through the snapshot's index and is projected in memory.
+    """
+    try:
+        snapshot = get_snapshot()
+        query = parse_query(request.args, default_fields)
+        ndjson = wants_ndjson()
+
+        rendered = snapshot.get('responses', {}).get(projection_key(query['fields']))
+        filtered = any(query[name] for name in ('event_type', 'search', 'date_from', 'date_to', 'limit', 'after'))
+        if rendered and not filtered and not ndjson:
+            return send_rendered(rendered)
+
+        if ndjson:
+            with phase('filter'):
+                events = filter_query(index_for(snapshot), query)
+            return stream_ndjson(events[:query['limit']], query['fields'])
+        with phase('filter'):
+            payload = query_payload(index_for(snapshot), query)
+        with phase('render'):
+            return send_rendered(render(payload, compress=False))
+
+    except (SnapshotUnavailableError, InvalidQueryError):
+        raise
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.errorhandler(SnapshotUnavailableError)
+def snapshot_unavailable_handler(e):
+    return jsonify({
+        'status': 'error',
+        'message': str(e)
+    }), 503, {'Retry-After': '5'}
+
+@app.errorhandler(CircuitOpenError)
+def circuit_open_handler(e):
+    return jsonify({
+        'status': 'error',
+        'message': f"Upstream temporarily unavailable: {e}"
+    }), 503, {'Retry-After': str(max(1, int(e.retry_after + 0.5)))}
+
+@app.errorhandler(EventNotFoundError)
+def event_not_found_handler(e):
+    return jsonify({
+        'status': 'error',
+        'message': str(e)
+    }), 404
+
+@app.errorhandler(InvalidQueryError)
+def invalid_query_handler(e):
+    return jsonify({
+        'status': 'error',
+        'message': str(e)
+    }), 400
+
 @app.errorhandler(429)
 def ratelimit_handler(e):
     return jsonify({
@@ -39,7 +272,6 @@ def ratelimit_handler(e):
     }), 429
 
 @app.route('/api/events', methods=['GET'])
-@cache.cached(query_string=True)
 def get_events() -> Any:
     """
     Get upcoming UFC events and dates
@@ -55,6 +287,33 @@ def get_events() -> Any:
         in: query
         type: string
         description: Search in event name or location
+      - name: from
+        in: query
+        type: string
+        format: date
+        description: Only events on or after this date (YYYY-MM-DD); "Date TBA" events are excluded
+      - name: to
+        in: query
+        type: string
+        format: date
+        description: Only events on or before this date (YYYY-MM-DD); "Date TBA" events are excluded
+      - name: fields
+        in: query
+        type: string
+        description: Comma-separated fields to return (event_id, event_name, event_date, event_type, event_number, location)
+      - name: limit
+        in: query
+        type: integer
+        description: Return at most this many events; the response then carries a `next` cursor
+      - name: after
+        in: query
+        type: string
+        description: Cursor from a previous response's `next`; returns the events listed after it
+      - name: format
+        in: query
+        type: string
+        enum: [json, ndjson]
+        description: 'ndjson streams one event per line (also selected by "Accept: application/x-ndjson")'
     responses:
       200:
         description: List of upcoming UFC events with basic details
@@ -84,47 +343,14 @@ def get_events() -> Any:
                   event_number:
                     type: string
                     example: "268"
+      400:
+        description: Invalid query parameter (from, to, limit, fields, after or format)
+      304:
+        description: Not modified; the If-None-Match ETag still matches the current snapshot
     """
-    try:
-        from flask import request
-        event_type = request.args.get('type')
-        search_query = request.args.get('search')
-        
-        events = get_upcoming_ufc_schedule()
-        
-        # Apply filters
-        if event_type:
-            events = [e for e in events if event_type.lower() == e['event_type'].lower()]
-        
-        if search_query:
-            search_query = search_query.lower()
-            events = [e for e in events if search_query in e['event_name'].lower() or search_query in e['location'].lower()]
-            
-        # Return event name, date, type, and number
-        simplified_events = [
-            {
-                'event_name': event['event_name'],
-                'event_date': event['event_date'],
-                'event_type': event['event_type'],
-                'event_number': event['event_number']
-            }
-            for event in events
-        ]
-        
-        return jsonify({
-            'status': 'success',
-            'count': len(simplified_events),
-            'events': simplified_events
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+    return events_response(BASIC_FIELDS)
 
 @app.route('/api/events/full', methods=['GET'])
-@cache.cached(query_string=True)
 def get_events_full() -> Any:
     """
     Get upcoming UFC events with full details
@@ -140,6 +366,33 @@ def get_events_full() -> Any:
         in: query
         type: string
         description: Search in event name or location
+      - name: from
+        in: query
+        type: string
+        format: date
+        description: Only events on or after this date (YYYY-MM-DD); "Date TBA" events are excluded
+      - name: to
+        in: query
+        type: string
+        format: date
+        description: Only events on or before this date (YYYY-MM-DD); "Date TBA" events are excluded
+      - name: fields
+        in: query
+        type: string
+        description: Comma-separated fields to return (event_id, event_name, event_date, event_type, event_number, location)
+      - name: limit
+        in: query
+        type: integer
+        description: Return at most this many events; the response then carries a `next` cursor
+      - name: after
+        in: query
+        type: string
+        description: Cursor from a previous response's `next`; returns the events listed after it
+      - name: format
+        in: query
+        type: string
+        enum: [json, ndjson]
+        description: 'ndjson streams one event per line (also selected by "Accept: application/x-ndjson")'
     responses:
       200:
         description: List of upcoming UFC events with full details including location
@@ -172,28 +425,340 @@ def get_events_full() -> Any:
                   location:
                     type: string
                     example: "Las Vegas, Nevada, USA"
+      400:
+        description: Invalid query parameter (from, to, limit, fields, after or format)
+      304:
+        description: Not modified; the If-None-Match ETag still matches the current snapshot
+    """
+    return events_response(ALL_FIELDS)
+
+@app.route('/api/events/past', methods=['GET'])
+def get_past_events() -> Any:
+    """
+    Get completed UFC events from the local archive
+    ---
+    tags:
+      - Events
+    parameters:
+      - name: type
+        in: query
+        type: string
+        description: Filter by event type (e.g., "UFC", "UFC Fight Night")
+      - name: search
+        in: query
+        type: string
+        description: Search in event name or location
+      - name: number
+        in: query
+        type: string
+        description: Exact event number (e.g., "300")
+      - name: from
+        in: query
+        type: string
+        format: date
+        description: Only events on or after this date (YYYY-MM-DD)
+      - name: to
+        in: query
+        type: string
+        format: date
+        description: Only events on or before this date (YYYY-MM-DD)
+      - name: limit
+        in: query
+        type: integer
+        description: Page size (default 50, at most 500)
+      - name: page
+        in: query
+        type: integer
+        description: Page number, starting at 1
+      - name: after
+        in: query
+        type: string
+        description: Cursor (the `next` of the previous page); an alternative to page
+      - name: fields
+        in: query
+        type: string
+        description: Comma-separated fields to return (event_id, event_name, event_date, event_type, event_number, location)
+      - name: format
+        in: query
+        type: string
+        enum: [json, ndjson]
+        description: ndjson streams every matching event, one per line, unless limit or page is given
+    responses:
+      200:
+        description: One page of completed events, most recent first
+        schema:
+          type: object
+          properties:
+            status:
+              type: string
+              example: success
+            count:
+              type: integer
+              example: 50
+            total:
+              type: integer
+              example: 734
+            page:
+              type: integer
+              example: 1
+            limit:
+              type: integer
+              example: 50
+            events:
+              type: array
+              items:
+                type: object
+                properties:
+                  event_id:
+                    type: string
+                    example: "4f1c2a9be07d3e58"
+                  event_name:
+                    type: string
+                    example: "UFC 324: Gaethje vs. Pimblett"
+                  event_date:
+                    type: string
+                    example: "January 24, 2026"
+                  event_type:
+                    type: string
+                    example: "UFC"
+                  event_number:
+                    type: string
+                    example: "324"
+                  location:
+                    type: string
+                    example: "Las Vegas, Nevada, USA"
+      400:
+        description: Invalid query parameter
+      304:
+        description: Not modified; the If-None-Match ETag still matches
     """
     try:
-        from flask import request
-        event_type = request.args.get('type')
-        search_query = request.args.get('search')
-        
-        events = get_upcoming_ufc_schedule()
-        
-        # Apply filters
-        if event_type:
-            events = [e for e in events if event_type.lower() == e['event_type'].lower()]
-        
-        if search_query:
-            search_query = search_query.lower()
-            events = [e for e in events if search_query in e['event_name'].lower() or search_query in e['location'].lower()]
-        
-        return jsonify({
-            'status': 'success',
-            'count': len(events),
-            'events': events
+        filters = {
+            'event_type': request.args.get('type'),
+            'search': request.args.get('search'),
+            'event_number': request.args.get('number'),
+            'date_from': parse_date_param('from', request.args.get('from')),
+            'date_to': parse_date_param('to', request.args.get('to')),
+            'after': request.args.get('after')
+        }
+        fields = parse_fields_param(request.args.get('fields'), ALL_FIELDS)
+        limit = parse_int_param('limit', request.args.get('limit'))
+        page = parse_int_param('page', request.args.get('page')) or 1
+        if filters['after'] and page > 1:
+            raise InvalidQueryError("Use either 'page' or the 'after' cursor, not both")
+
+        if wants_ndjson():
+            # Exports stream every match unless a page is asked for
+            if limit is None and page > 1:
+                limit = ARCHIVE_DEFAULT_LIMIT
+            offset = (page - 1) * limit if limit else 0
+            return stream_ndjson(archive_store.iter_events(limit, offset, **filters), fields)
+
+        limit = min(limit or ARCHIVE_DEFAULT_LIMIT, ARCHIVE_MAX_LIMIT)
+        # One extra row tells whether there is a next page
+        with phase('archive'):
+            total, events = archive_store.query(limit + 1, (page - 1) * limit, **filters)
+        payload = events_payload(project_events(events[:limit], fields))
+        payload.update({
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'next': events[limit - 1]['event_id'] if len(events) > limit else None
         })
-    
+        with phase('render'):
+            return send_rendered(render(payload, compress=False))
+
+    except InvalidQueryError:
+        raise
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/events/batch', methods=['POST'])
+def get_events_batch() -> Any:
+    """
+    Run several event queries in one request
+    ---
+    tags:
+      - Events
+    description: 'Every query is answered from the same schedule snapshot, so the results are consistent with each other. The batch counts as a single request against the rate limit.'
+    consumes:
+      - application/json
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          properties:
+            queries:
+              type: array
+              description: Up to BATCH_MAX_QUERIES (default 25) queries; each takes the query parameters of /api/events
+              items:
+                type: object
+                required:
+                  - id
+                properties:
+                  id:
+                    type: string
+                    description: Key of this query's result in the response
+                    example: "numbered"
+                  full:
+                    type: boolean
+                    description: Default to every field, as /api/events/full does
+                    example: false
+                  type:
+                    type: string
+                    example: "UFC"
+                  search:
+                    type: string
+                  from:
+                    type: string
+                    format: date
+                  to:
+                    type: string
+                    format: date
+                  fields:
+                    type: array
+                    items:
+                      type: string
+                    example: ["event_name", "event_date"]
+                  limit:
+                    type: integer
+                  after:
+                    type: string
+    responses:
+      200:
+        description: 'Results keyed by query id; each is shaped like the /api/events response, or {"status": "error", "message": ...} when that query is invalid'
+        schema:
+          type: object
+          properties:
+            status:
+              type: string
+              example: success
+            results:
+              type: object
+              example: {"numbered": {"status": "success", "count": 1, "events": [{"event_name": "UFC 325: Volkanovski vs. Lopes 2", "event_date": "February 21, 2026"}]}}
+      400:
+        description: The body is not a valid list of queries
+    """
+    try:
+        queries = parse_batch(request.get_json(silent=True))
+        # One snapshot read and one index for every query
+        index = index_for(get_snapshot())
+
+        results = {}
+        with phase('filter'):
+            for query_id, params in queries:
+                try:
+                    query = parse_query(params, ALL_FIELDS if params.get('full') else BASIC_FIELDS)
+                    results[query_id] = query_payload(index, query)
+                except InvalidQueryError as e:
+                    results[query_id] = {'status': 'error', 'message': str(e)}
+
+        with phase('render'):
+            return Response(dumps({'status': 'success', 'results': results}), mimetype='application/json')
+
+    except (SnapshotUnavailableError, InvalidQueryError):
+        raise
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/events/<event_id:event_id>', methods=['GET'])
+def get_event(event_id: str) -> Any:
+    """
+    Get one event with its fight card
+    ---
+    tags:
+      - Events
+    parameters:
+      - name: event_id
+        in: path
+        type: string
+        required: true
+        description: UFCStats event id (the `event_id` of a listed event)
+    responses:
+      200:
+        description: Event details and bouts, main event first
+        schema:
+          type: object
+          properties:
+            status:
+              type: string
+              example: success
+            event:
+              type: object
+              properties:
+                event_id:
+                  type: string
+                  example: "6f8cd4ba7b6b6c2e"
+                event_name:
+                  type: string
+                  example: "UFC 325: Volkanovski vs. Lopes 2"
+                event_date:
+                  type: string
+                  example: "February 21, 2026"
+                event_type:
+                  type: string
+                  example: "UFC"
+                event_number:
+                  type: string
+                  example: "325"
+                location:
+                  type: string
+                  example: "Sydney, New South Wales, Australia"
+                fights:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      fight_id:
+                        type: string
+                        example: "1f2e3d4c5b6a7980"
+                      fighters:
+                        type: array
+                        items:
+                          type: string
+                        example: ["Alexander Volkanovski", "Diego Lopes"]
+                      weight_class:
+                        type: string
+                        example: "Featherweight"
+                      title_bout:
+                        type: boolean
+                        example: true
+                      result:
+                        type: string
+                        description: Result of the first fighter (win, loss, draw, nc) once the bout has happened
+                        example: null
+                      method:
+                        type: string
+                        example: null
+                      round:
+                        type: string
+                        example: null
+                      time:
+                        type: string
+                        example: null
+      404:
+        description: Unknown event id
+      503:
+        description: ufcstats.com is failing and its circuit is open; retry after the Retry-After delay
+      304:
+        description: Not modified; the If-None-Match ETag still matches
+    """
+    try:
+        with phase('card'):
+            card = fight_card_store.get(event_id)
+        with phase('render'):
+            return send_rendered(render({'status': 'success', 'event': card}, compress=False))
+
+    except (EventNotFoundError, CircuitOpenError):
+        raise
     except Exception as e:
         return jsonify({
             'status': 'error',
@@ -219,12 +784,120 @@ def health_check() -> Any:
             message:
               type: string
               example: UFC Events API is running
+            snapshot:
+              type: object
+              properties:
+                rebuilds:
+                  type: integer
+                  example: 3
+                coalesced:
+                  type: integer
+                  example: 17
+                failures:
+                  type: integer
+                  example: 0
+            cache:
+              type: object
+              description: In-process (L1) and Redis (L2) hit counts of this worker
+              properties:
+                l1_hits:
+                  type: integer
+                  example: 9120
+                l2_hits:
+                  type: integer
+                  example: 14
+                misses:
+                  type: integer
+                  example: 1
+                l1_hit_rate:
+                  type: number
+                  example: 0.9984
+                l2_hit_rate:
+                  type: number
+                  example: 0.0015
+                invalidations:
+                  type: integer
+                  example: 6
+                entries:
+                  type: integer
+                  example: 4
+                subscribed:
+                  type: boolean
+                  example: true
+            data:
+              type: object
+              description: 'Age of the served snapshot; when its rebuilds are failing, since when and why; whether it used the last known Wikipedia mapping'
+              properties:
+                age:
+                  type: integer
+                  example: 1820
+                stale_since:
+                  type: number
+                  example: null
+                last_error:
+                  type: string
+                  example: null
+                wiki_mapping_fallback:
+                  type: boolean
+                  example: false
+                wiki_mapping_fetched_at:
+                  type: number
+                  example: null
+            upstreams:
+              type: object
+              description: Circuit breaker of each upstream host contacted by this worker
+              additionalProperties:
+                type: object
+                properties:
+                  state:
+                    type: string
+                    enum: [closed, open, half_open]
+                    example: closed
+                  failures:
+                    type: integer
+                    example: 0
     """
+    snapshot = snapshot_store.read()
+    data: Dict[str, Any] = {}
+    if snapshot is not None:
+        wiki_mapping = snapshot.get('wiki_mapping', {})
+        data.update(age=int(time.time() - snapshot['built_at']), stale_since=snapshot.get('stale_since'),
+                    last_error=snapshot.get('last_error'), wiki_mapping_fallback=wiki_mapping.get('fallback', False),
+                    wiki_mapping_fetched_at=wiki_mapping.get('fetched_at'))
     return jsonify({
         'status': 'healthy',
-        'message': 'UFC Events API is running'
+        'message': 'UFC Events API is running',
+        'snapshot': snapshot_store.stats(),
+        'cache': shared_cache.stats(),
+        'data': data,
+        'upstreams': breaker_stats()
     })
 
+@app.route('/api/metrics', methods=['GET'])
+@limiter.exempt
+def get_metrics() -> Any:
+    """
+    Metrics in Prometheus text format
+    ---
+    tags:
+      - System
+    description: 'Request latency per endpoint, rate limit check time, scrape duration, events reused vs fetched by scrapes, upstream requests and bytes per host, cache hits and misses (summed over all workers), plus the age of the current snapshot. Not rate limited.'
+    produces:
+      - text/plain
+    responses:
+      200:
+        description: Prometheus text exposition format 0.0.4
+    """
+    extra: Dict[str, Any] = {}
+    for name, value in snapshot_store.stats().items():
+        extra[f"snapshot_{name}_total"] = ('counter', f"Snapshot {name} across all workers", value)
+    snapshot = snapshot_store.read()
+    if snapshot is not None:
+        extra['snapshot_age_seconds'] = ('gauge', 'Seconds since the current snapshot was built',
+                                         time.time() - snapshot['built_at'])
+        extra['snapshot_events'] = ('gauge', 'Events in the current snapshot', len(snapshot['events']))
+    return Response(metrics.render(extra), mimetype='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
     host = os.getenv('API_HOST', '0.0.0.0')
     port = int(os.getenv('API_PORT', 5000))
@@ -0,0 +1,270 @@
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from scrapers.dates import to_iso
+from event_query import InvalidQueryError
+from scrapers.ufc_scraper import get_completed_events_page
+
+# SQLite file holding completed events; shared by all workers on the host
+ARCHIVE_DB_PATH = os.getenv('ARCHIVE_DB_PATH', os.path.join(os.getenv('SCRAPER_STORE_DIR', 'data'), 'archive.sqlite3'))
+
+# Upper bound on completed-list pages walked by one backfill or sync
+ARCHIVE_MAX_PAGES = int(os.getenv('ARCHIVE_MAX_PAGES', 100))
+
+# Page size of /api/events/past when no limit is given, and the largest allowed one
+ARCHIVE_DEFAULT_LIMIT = int(os.getenv('ARCHIVE_DEFAULT_LIMIT', 50))
+ARCHIVE_MAX_LIMIT = int(os.getenv('ARCHIVE_MAX_LIMIT', 500))
+
+# Seconds between incremental syncs run by the API's background refresher (one worker per host); 0 disables
+ARCHIVE_SYNC_INTERVAL = int(os.getenv('ARCHIVE_SYNC_INTERVAL', 86400))
+
+# A scheduled sync claimed longer ago than this is presumed dead (worker killed) and may be claimed again
+ARCHIVE_SYNC_LEASE = int(os.getenv('ARCHIVE_SYNC_LEASE', 3600))
+
+ARCHIVE_FIELDS = ('event_id', 'event_name', 'event_date', 'event_type', 'event_number', 'location')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    event_name TEXT NOT NULL,
+    event_date TEXT NOT NULL,
+    event_day TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_number TEXT,
+    location TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_day ON events (event_day);
+CREATE INDEX IF NOT EXISTS events_type_day ON events (event_type COLLATE NOCASE, event_day);
+CREATE INDEX IF NOT EXISTS events_number ON events (event_number);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ArchiveStore:
+    """
+    Completed events in a local SQLite database, indexed on date, type and number.
+    Searches are substring matches and scan the table, which stays small (~1k events).
+    Each thread gets its own connection; WAL mode lets workers keep reading while a sync writes.
+    """
+
+    def __init__(self, path: str = ARCHIVE_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if connection is None or getattr(self._local, 'pid', None) != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def known_ids(self, event_ids: List[str]) -> Set[str]:
+        if not event_ids:
+            return set()
+        placeholders = ','.join('?' * len(event_ids))
+        rows = self._connection().execute(f"SELECT event_id FROM events WHERE event_id IN ({placeholders})", event_ids)
+        return {row[0] for row in rows}
+
+    def upsert(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update events (which must have a parseable date); returns how many were new
+        """
+        known = self.known_ids([e['event_id'] for e in events])
+        now = time.time()
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                """
+                INSERT INTO events (event_id, event_name, event_date, event_day, event_type, event_number, location, synced_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (event_id) DO UPDATE SET
+                    event_name = excluded.event_name, event_date = excluded.event_date, event_day = excluded.event_day,
+                    event_type = excluded.event_type, event_number = excluded.event_number,
+                    location = excluded.location, synced_at = excluded.synced_at
+                """,
+                [(e['event_id'], e['event_name'], e['event_date'], to_iso(e['event_date']), e['event_type'],
+                  e['event_number'], e['location'], now) for e in events]
+            )
+        return len([e for e in events if e['event_id'] not in known])
+
+    def _where(self, event_type: Optional[str] = None, search: Optional[str] = None,
+               event_number: Optional[str] = None, date_from: Optional[date] = None,
+               date_to: Optional[date] = None, after: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """
+        WHERE clause and parameters for the filters; they mean the same as on the upcoming
+        endpoints, and event_number is an exact match. `after` is a keyset cursor: only events
+        that come after that event in (date descending, id) order.
+        """
+        clauses = []
+        params: List[Any] = []
+        if after:
+            row = self._connection().execute("SELECT event_day FROM events WHERE event_id = ?", (after,)).fetchone()
+            if row is None:
+                raise InvalidQueryError(f"Invalid 'after' cursor '{after}', unknown event")
+            clauses.append('(event_day < ? OR (event_day = ? AND event_id > ?))')
+            params.extend([row[0], row[0], after])
+        if event_type:
+            clauses.append('event_type = ? COLLATE NOCASE')
+            params.append(event_type)
+        if search:
+            clauses.append('(instr(lower(event_name), ?) > 0 OR instr(lower(location), ?) > 0)')
+            params.extend([search.lower(), search.lower()])
+        if event_number:
+            clauses.append('event_number = ?')
+            params.append(event_number)
+        if date_from:
+            clauses.append('event_day >= ?')
+            params.append(date_from.isoformat())
+        if date_to:
+            clauses.append('event_day <= ?')
+            params.append(date_to.isoformat())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return where, params
+
+    def query(self, limit: int = ARCHIVE_DEFAULT_LIMIT, offset: int = 0,
+              **filters: Any) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Return (total matches, one page of events), most recent first.
+        The total ignores the `after` cursor, so it stays the same on every page.
+        """
+        where, params = self._where(**{name: value for name, value in filters.items() if name != 'after'})
+        total: int = self._connection().execute(f"SELECT COUNT(*) FROM events {where}", params).fetchone()[0]
+        return total, list(self.iter_events(limit, offset, **filters))
+
+    def iter_events(self, limit: Optional[int] = None, offset: int = 0, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate matching events, most recent first, straight from the cursor (all of them when limit is None).
+        The filters are checked right away, so an invalid cursor raises before a response is streamed.
+        """
+        where, params = self._where(**filters)
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            cursor = self._connection().execute(
+                f"SELECT {', '.join(ARCHIVE_FIELDS)} FROM events {where} ORDER BY event_day DESC, event_id LIMIT ? OFFSET ?",
+                params + [-1 if limit is None else limit, offset]
+            )
+            for row in cursor:
+                yield dict(row)
+
+        return rows()
+
+    def set_meta(self, key: str, value: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def claim_sync(self, interval: float, lease: float = ARCHIVE_SYNC_LEASE) -> bool:
+        """
+        Claim the next scheduled sync: True when the last one finished at least `interval` seconds ago
+        and no other claim is younger than `lease` (an older one belongs to a sync that died).
+        The check and the update are one statement, so only one worker on the host wins.
+        """
+        now = time.time()
+        connection = self._connection()
+        with connection:
+            connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('sync_started', '0')")
+            cursor = connection.execute(
+                """
+                UPDATE meta SET value = ? WHERE key = 'sync_started' AND CAST(value AS REAL) <= ?
+                    AND COALESCE((SELECT CAST(value AS REAL) FROM meta WHERE key = 'last_sync'), 0) <= ?
+                """,
+                (str(now), now - lease, now - interval)
+            )
+        claimed: bool = cursor.rowcount == 1
+        return claimed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Number of archived events and when the last sync finished
+        """
+        connection = self._connection()
+        count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        last_sync = connection.execute("SELECT value FROM meta WHERE key = 'last_sync'").fetchone()
+        return {'events': count, 'last_sync': float(last_sync[0]) if last_sync else None}
+
+
+def sync_archive(store: ArchiveStore, backfill: bool = False, max_pages: int = ARCHIVE_MAX_PAGES,
+                 fetch_page: Callable[[int], List[Dict[str, Any]]] = get_completed_events_page,
+                 today: Optional[date] = None) -> Dict[str, int]:
+    """
+    Walk the completed events list (newest first) into the archive.
+    A backfill walks every page and, once it got through, is recorded as complete;
+    an incremental sync stops at the first page with nothing new.
+    Events dated today or later (the list starts with the next upcoming event) are skipped.
+    """
+    cutoff = (today or date.today()).isoformat()
+    stats = {'pages': 0, 'new': 0, 'stored': 0}
+    for page in range(1, max_pages + 1):
+        events = fetch_page(page)
+        if not events:
+            break
+        stats['pages'] += 1
+        past = [e for e in events if (to_iso(e['event_date']) or cutoff) < cutoff]
+        new = store.upsert(past)
+        stats['new'] += new
+        stats['stored'] += len(past)
+        if not backfill and past and new == 0:
+            break
+    if backfill:
+        store.set_meta('backfill_complete', str(time.time()))
+    store.set_meta('last_sync', str(time.time()))
+    return stats
+
+
+def sync_if_due(store: ArchiveStore, interval: float = ARCHIVE_SYNC_INTERVAL,
+                fetch_page: Callable[[int], List[Dict[str, Any]]] = get_completed_events_page) -> Optional[Dict[str, int]]:
+    """
+    Run a sync when the last one is `interval` seconds old; returns its stats, or None when it
+    wasn't due or another worker claimed it. Until a backfill has completed the sync is a backfill,
+    so one that failed halfway (leaving the newest pages stored) is walked to the end on the retry.
+    A failed sync releases its claim so the next check retries it.
+    """
+    if interval <= 0 or not store.claim_sync(interval):
+        return None
+    backfill = store.get_meta('backfill_complete') is None
+    try:
+        stats = sync_archive(store, backfill=backfill, fetch_page=fetch_page)
+    except Exception:
+        store.set_meta('sync_started', '0')
+        raise
+    print(f"Archive sync: {stats['pages']} pages, {stats['new']} new events")
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Sync the archive of completed UFC events from UFCStats')
+    parser.add_argument('mode', choices=['backfill', 'sync'], help='backfill walks every page, sync stops at known events')
+    parser.add_argument('--max-pages', type=int, default=ARCHIVE_MAX_PAGES)
+    parser.add_argument('--db', default=ARCHIVE_DB_PATH, help='SQLite database path')
+    args = parser.parse_args(argv)
+
+    store = ArchiveStore(args.db)
+    started = time.time()
+    stats = sync_archive(store, backfill=args.mode == 'backfill', max_pages=args.max_pages)
+    print(f"Archive {args.mode}: {stats['pages']} pages, {stats['new']} new events, "
+          f"{store.stats()['events']} archived ({time.time() - started:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Dict, List, Optional, Set
+from scrapers.dates import parse_date
+from event_query import InvalidQueryError
+
+# Length of the substrings indexed for `search`; shorter queries scan the pre-lowered fields
+NGRAM_SIZE = 3
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class EventIndex:
+    """
+    Lookup structures built once per snapshot so filters resolve through set intersections:
+    a hash index on the lowercased event type, a trigram index over lowercased name and location,
+    and the parsed event dates sorted once for bisect range lookups.
+    Results are identical to event_query.filter_events, in snapshot order.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self.events = events
+        self.by_type: Dict[str, Set[int]] = {}
+        self.by_ngram: Dict[str, Set[int]] = {}
+        # Cursor lookups for `after`
+        self.by_id: Dict[Optional[str], int] = {e.get('event_id'): position for position, e in enumerate(events)}
+        # Lowercased (name, location) per event, used to confirm trigram candidates
+        self.texts = [(e['event_name'].lower(), e['location'].lower()) for e in events]
+
+        for position, (event, texts) in enumerate(zip(events, self.texts)):
+            self.by_type.setdefault(event['event_type'].lower(), set()).add(position)
+            for gram in ngrams(texts[0]) | ngrams(texts[1]):
+                self.by_ngram.setdefault(gram, set()).add(position)
+
+        # Events with a parsed date, sorted by date. "Date TBA" events are left out,
+        # so they never match a date range.
+        parsed = ((parse_date(e['event_date']), position) for position, e in enumerate(events))
+        dated = sorted((d, position) for d, position in parsed if d is not None)
+        self.dates: List[date] = [d for d, _ in dated]
+        self.date_positions: List[int] = [position for _, position in dated]
+
+    def date_range(self, date_from: Optional[date], date_to: Optional[date]) -> Set[int]:
+        """
+        Positions of events dated within [date_from, date_to]: two bisects plus the matches
+        """
+        lo = bisect_left(self.dates, date_from) if date_from else 0
+        hi = bisect_right(self.dates, date_to) if date_to else len(self.dates)
+        return set(self.date_positions[lo:hi])
+
+    def search(self, search: str, candidates: Optional[Set[int]] = None) -> Set[int]:
+        """
+        Positions whose name or location contains the (lowercased) search string
+        """
+        if len(search) >= NGRAM_SIZE:
+            # Rarest trigram first keeps the intersection small
+            postings = sorted((self.by_ngram.get(gram, set()) for gram in ngrams(search)), key=len)
+            matched = set(postings[0]).intersection(*postings[1:])
+            if candidates is not None:
+                matched &= candidates
+        else:
+            matched = set(range(len(self.events))) if candidates is None else candidates
+        # Trigrams may come from different fields or places; confirm the actual substring
+        return {p for p in matched if search in self.texts[p][0] or search in self.texts[p][1]}
+
+    def position_of(self, event_id: str) -> int:
+        """
+        Snapshot position of the event a cursor points at
+        """
+        if event_id not in self.by_id:
+            raise InvalidQueryError(f"Invalid 'after' cursor '{event_id}', the event is no longer listed")
+        return self.by_id[event_id]
+
+    def filter(self, event_type: Optional[str] = None, search: Optional[str] = None,
+               date_from: Optional[date] = None, date_to: Optional[date] = None,
+               after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Apply the `type` (exact, case-insensitive), `search` (substring in name or location)
+        and `from`/`to` (inclusive date range) filters, keeping only events listed after the `after` cursor
+        """
+        start = self.position_of(after) + 1 if after else 0
+        if not event_type and not search and not date_from and not date_to:
+            return self.events[start:]
+
+        positions: Optional[Set[int]] = None
+        if date_from or date_to:
+            positions = self.date_range(date_from, date_to)
+        if event_type:
+            by_type = self.by_type.get(event_type.lower(), set())
+            positions = by_type if positions is None else positions & by_type
+        if search:
+            positions = self.search(search.lower(), positions)
+
+        return [self.events[p] for p in sorted(positions or ()) if p >= start]
+
+
+_index: Optional[EventIndex] = None
+_index_version: Optional[str] = None
+_index_lock = threading.Lock()
+
+
+def index_for(snapshot: Dict[str, Any]) -> EventIndex:
+    """
+    Return the index of a snapshot, building it the first time this process sees its version
+    """
+    global _index, _index_version
+    with _index_lock:
+        if _index is None or _index_version != snapshot['version']:
+            _index = EventIndex(snapshot['events'])
+            _index_version = snapshot['version']
+        return _index
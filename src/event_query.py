@@ -0,0 +1,162 @@
+import os
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from scrapers.dates import parse_date
+
+# Every field of an event, in the order projections are normalized to
+ALL_FIELDS = ('event_id', 'event_name', 'event_date', 'event_type', 'event_number', 'location')
+
+# Fields returned by /api/events; /api/events/full returns every field
+BASIC_FIELDS = ('event_name', 'event_date', 'event_type', 'event_number')
+
+# Most queries accepted in one POST /api/events/batch
+BATCH_MAX_QUERIES = int(os.getenv('BATCH_MAX_QUERIES', 25))
+
+# Query parameters a batch query may carry, as on GET /api/events
+BATCH_QUERY_KEYS = ('type', 'search', 'from', 'to', 'fields', 'limit', 'after', 'full')
+
+
+class InvalidQueryError(ValueError):
+    """
+    Raised for query parameters that cannot be interpreted (answered with a 400)
+    """
+
+
+def parse_date_param(name: str, value: Optional[str]) -> Optional[date]:
+    """
+    Parse a `from`/`to` query parameter ("2026-02-07", or any format event dates use)
+    """
+    if not value:
+        return None
+    parsed: Optional[date] = parse_date(value)
+    if parsed is None:
+        raise InvalidQueryError(f"Invalid '{name}' date '{value}', expected YYYY-MM-DD")
+    return parsed
+
+
+def parse_fields_param(value: Optional[str], default: Sequence[str]) -> Sequence[str]:
+    """
+    Parse the comma-separated `fields` query parameter into a projection in ALL_FIELDS order,
+    so equivalent requests share one pre-rendered body
+    """
+    if not value:
+        return default
+    requested = {field.strip() for field in value.split(',') if field.strip()}
+    unknown = requested.difference(ALL_FIELDS)
+    if unknown or not requested:
+        raise InvalidQueryError(f"Invalid 'fields' '{value}', expected a comma-separated subset of {', '.join(ALL_FIELDS)}")
+    return tuple(field for field in ALL_FIELDS if field in requested)
+
+
+def parse_int_param(name: str, value: Optional[str]) -> Optional[int]:
+    """
+    Parse a positive integer query parameter such as `limit` or `page`
+    """
+    if not value:
+        return None
+    if not value.isdigit() or int(value) < 1:
+        raise InvalidQueryError(f"Invalid '{name}' '{value}', expected a positive integer")
+    return int(value)
+
+
+def parse_query(args: Mapping[str, Any], default_fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    Parse the filter, projection and paging parameters shared by the upcoming event endpoints
+    """
+    return {
+        'fields': parse_fields_param(args.get('fields'), default_fields),
+        'event_type': args.get('type'),
+        'search': args.get('search'),
+        'date_from': parse_date_param('from', args.get('from')),
+        'date_to': parse_date_param('to', args.get('to')),
+        'limit': parse_int_param('limit', args.get('limit')),
+        'after': args.get('after'),
+    }
+
+
+def parse_batch(body: Any) -> List[Tuple[str, Dict[str, str]]]:
+    """
+    Validate a batch request body, {"queries": [{"id": "ufc", "type": "UFC", ...}, ...]},
+    into (id, parameters) pairs. Values are normalized to their query string form
+    (numbers to strings, a `fields` list to a comma-separated string) so each query is
+    parsed exactly like the GET parameters. `"full": true` makes every field the default projection.
+    Values must be strings, numbers or booleans; only `fields` may also be a list of strings.
+    """
+    queries = body.get('queries') if isinstance(body, dict) else None
+    if not isinstance(queries, list) or not queries:
+        raise InvalidQueryError("Expected a JSON body {\"queries\": [...]} with at least one query")
+    if len(queries) > BATCH_MAX_QUERIES:
+        raise InvalidQueryError(f"Too many queries ({len(queries)}), at most {BATCH_MAX_QUERIES} per batch")
+
+    parsed = []
+    seen = set()
+    for query in queries:
+        if not isinstance(query, dict) or not isinstance(query.get('id'), str) or not query['id']:
+            raise InvalidQueryError("Every query must be an object with a non-empty string 'id'")
+        query_id = query['id']
+        if query_id in seen:
+            raise InvalidQueryError(f"Duplicate query id '{query_id}'")
+        seen.add(query_id)
+
+        unknown = set(query).difference(BATCH_QUERY_KEYS, ('id',))
+        if unknown:
+            raise InvalidQueryError(f"Unknown parameter(s) {', '.join(sorted(unknown))} in query '{query_id}'")
+        params = {}
+        for key, value in query.items():
+            if key == 'id' or value is None:
+                continue
+            if key == 'fields' and isinstance(value, list):
+                if not all(isinstance(field, str) for field in value):
+                    raise InvalidQueryError(f"'fields' in query '{query_id}' must be a list of strings")
+            elif not isinstance(value, (str, int)):
+                raise InvalidQueryError(f"Invalid value for '{key}' in query '{query_id}', expected a string or number")
+            if key == 'fields' and isinstance(value, list):
+                value = ','.join(str(field) for field in value)
+            elif key == 'full':
+                # Which endpoint's default fields apply: /api/events/full rather than /api/events
+                value = 'true' if value is True or str(value).lower() == 'true' else ''
+            params[key] = str(value)
+        parsed.append((query_id, params))
+    return parsed
+
+
+def filter_events(events: List[Dict[str, Any]], event_type: Optional[str] = None,
+                  search: Optional[str] = None, date_from: Optional[date] = None,
+                  date_to: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Apply the `type` (exact, case-insensitive), `search` (substring in name or location)
+    and `from`/`to` (inclusive date range) filters to the cached dataset.
+    Events without a known date ("Date TBA") never match a date range.
+    """
+    if date_from or date_to:
+        dated = [(parse_date(e['event_date']), e) for e in events]
+        events = [e for d, e in dated if d is not None
+                  and (date_from is None or d >= date_from) and (date_to is None or d <= date_to)]
+
+    if event_type:
+        event_type = event_type.lower()
+        events = [e for e in events if event_type == e['event_type'].lower()]
+
+    if search:
+        search = search.lower()
+        events = [e for e in events if search in e['event_name'].lower() or search in e['location'].lower()]
+
+    return events
+
+
+def project_events(events: List[Dict[str, Any]], fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Return only the requested fields of each event (all fields when none are given)
+    """
+    if fields is None:
+        return events
+    return [project_event(event, fields) for event in events]
+
+
+def project_event(event: Dict[str, Any], fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Return only the requested fields of one event (all fields when none are given)
+    """
+    if fields is None:
+        return event
+    return {field: event.get(field) for field in fields}
@@ -0,0 +1,71 @@
+import os
+import re
+import requests
+from typing import Any, Callable, Dict
+from scrapers.ufc_scraper import SCRAPER_EVENT_MAX_AGE, get_event_details
+
+# How long a parsed fight card is served before the detail page is read again
+FIGHT_CARD_TTL = int(os.getenv('FIGHT_CARD_TTL', 3600))
+
+# How long an unknown (but well-formed) event id is remembered, so repeated lookups don't each hit UFCStats
+FIGHT_CARD_MISSING_TTL = int(os.getenv('FIGHT_CARD_MISSING_TTL', 600))
+
+# Cache key prefix of the per-event fight cards
+FIGHT_CARD_KEY = 'ufc:card'
+
+# UFCStats event ids are 16 hex characters
+EVENT_ID_PATTERN = r'[0-9a-f]{16}'
+EVENT_ID_RE = re.compile(f"^{EVENT_ID_PATTERN}$")
+
+
+class EventNotFoundError(Exception):
+    """
+    Raised when an event id is malformed or UFCStats has no such event
+    """
+
+
+class FightCardStore:
+    """
+    Fight cards cached one entry per event in the shared cache backend, each with its own TTL.
+    A card is only built when it is first requested, from the detail page the schedule scrape
+    already downloaded whenever that copy is recent enough: the scrape re-downloads a page once
+    it is older than SCRAPER_EVENT_MAX_AGE, so any younger copy counts as current.
+    Unknown event ids are cached too (for missing_ttl), as a marker without an event name.
+    """
+
+    def __init__(self, cache: Any, loader: Callable[[str, float], Dict[str, Any]] = get_event_details,
+                 ttl: int = FIGHT_CARD_TTL, page_max_age: float = SCRAPER_EVENT_MAX_AGE,
+                 missing_ttl: int = FIGHT_CARD_MISSING_TTL):
+        self.cache = cache
+        self.loader = loader
+        self.ttl = ttl
+        self.page_max_age = page_max_age
+        self.missing_ttl = missing_ttl
+
+    def get(self, event_id: str) -> Dict[str, Any]:
+        if not EVENT_ID_RE.match(event_id):
+            raise EventNotFoundError(f"Unknown event '{event_id}'")
+
+        key = f"{FIGHT_CARD_KEY}:{event_id}"
+        card: Dict[str, Any] = self.cache.get(key)
+        if card is None:
+            try:
+                card = self.load(event_id)
+            except EventNotFoundError:
+                self.cache.set(key, {'missing': True}, timeout=self.missing_ttl)
+                raise
+            self.cache.set(key, card, timeout=self.ttl)
+        elif card.get('missing'):
+            raise EventNotFoundError(f"Unknown event '{event_id}'")
+        return card
+
+    def load(self, event_id: str) -> Dict[str, Any]:
+        try:
+            card = self.loader(event_id, self.page_max_age)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                raise EventNotFoundError(f"Unknown event '{event_id}'") from e
+            raise
+        if not card.get('event_name'):
+            raise EventNotFoundError(f"Unknown event '{event_id}'")
+        return card
@@ -0,0 +1,204 @@
+import os
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# How often a worker adds its counters to the shared totals in Redis
+METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', 5))
+
+# Redis hash holding the totals of every worker
+METRICS_KEY = 'ufc:metrics'
+
+# Histogram buckets in seconds, from a pre-rendered response to a full scrape
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Optional[Dict[str, str]]
+
+
+def series(name: str, labels: Labels = None) -> str:
+    """
+    Prometheus series name: http_requests_total{endpoint="get_events",status="200"}
+    """
+    if not labels:
+        return name
+    rendered = ','.join(f'{key}="{escape(str(value))}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+def escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def metric_name(series_name: str) -> str:
+    return series_name.split('{', 1)[0]
+
+
+class Metrics:
+    """
+    Counters and histograms aggregated across gunicorn workers.
+    Each worker accumulates increments locally (no network call on the request path) and
+    periodically adds them to a Redis hash with HINCRBYFLOAT, so the hash always holds the sum
+    over all workers and survives worker restarts. Without a Redis client the totals stay in
+    process. Histogram buckets are stored cumulatively, so summed deltas stay valid buckets.
+    Per-process counters kept elsewhere (cache stats) are folded in as deltas through collectors.
+    """
+
+    def __init__(self, client: Any = None, key: str = METRICS_KEY, flush_interval: float = METRICS_FLUSH_INTERVAL,
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.client = client
+        self.key = key
+        self.flush_interval = flush_interval
+        self.buckets = tuple(buckets)
+        # name -> (type, help)
+        self.definitions: Dict[str, Tuple[str, str]] = {}
+        self._pending: Dict[str, float] = {}
+        self._totals: Dict[str, float] = {}
+        self._collectors: List[Tuple[str, Callable[[], Dict[str, Any]], Dict[str, str], str, Optional[Sequence[str]]]] = []
+        self._collected: Dict[str, float] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> None:
+        self.definitions[name] = ('counter', help_text)
+
+    def histogram(self, name: str, help_text: str) -> None:
+        self.definitions[name] = ('histogram', help_text)
+
+    def collector(self, name: str, stats: Callable[[], Dict[str, Any]], labels: Labels = None,
+                  label: str = 'result', keys: Optional[Sequence[str]] = None) -> None:
+        """
+        Fold a per-process stats dict ({'hits': 10, 'misses': 2}) into counter `name`:
+        one series per key (all of them, or only `keys`) under `label`, next to the fixed `labels`
+        """
+        self._collectors.append((name, stats, dict(labels or {}), label, keys))
+
+    def inc(self, name: str, labels: Labels = None, value: float = 1) -> None:
+        with self._lock:
+            key = series(name, labels)
+            self._pending[key] = self._pending.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Labels = None) -> None:
+        labels = labels or {}
+        with self._lock:
+            for bound in self.buckets:
+                if value <= bound:
+                    key = series(f"{name}_bucket", dict(labels, le=repr(bound)))
+                    self._pending[key] = self._pending.get(key, 0) + 1
+            for suffix, amount in (('_bucket', 1.0), ('_count', 1.0), ('_sum', value)):
+                key = series(f"{name}{suffix}", dict(labels, le='+Inf') if suffix == '_bucket' else labels)
+                self._pending[key] = self._pending.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, name: str, labels: Labels = None) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, labels)
+
+    def _collect(self) -> None:
+        for name, stats, labels, label, keys in self._collectors:
+            try:
+                values = stats()
+            except Exception as e:
+                print(f"Error collecting {name}: {e}")
+                continue
+            for result, value in values.items():
+                if (keys is not None and result not in keys) or isinstance(value, bool) \
+                        or not isinstance(value, (int, float)):
+                    continue
+                series_labels = dict(labels, **{label: result})
+                key = series(name, series_labels)
+                delta = value - self._collected.get(key, 0)
+                self._collected[key] = value
+                if delta > 0:
+                    self.inc(name, series_labels, delta)
+
+    def flush(self) -> None:
+        """
+        Add this worker's increments since the last flush to the shared totals
+        """
+        self._collect()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        if self.client is None:
+            with self._lock:
+                for key, value in pending.items():
+                    self._totals[key] = self._totals.get(key, 0) + value
+            return
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for key, value in pending.items():
+                pipeline.hincrbyfloat(self.key, key, value)
+            pipeline.execute()
+        except Exception as e:
+            print(f"Error flushing metrics: {e}")
+            # Keep the increments for the next attempt
+            with self._lock:
+                for key, value in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + value
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def totals(self) -> Dict[str, float]:
+        if self.client is None:
+            with self._lock:
+                return dict(self._totals)
+        raw = self.client.hgetall(self.key)
+        return {
+            (key.decode('utf-8') if isinstance(key, bytes) else key): float(value)
+            for key, value in raw.items()
+        }
+
+    def render(self, extra: Optional[Dict[str, Tuple[str, str, float]]] = None) -> str:
+        """
+        Prometheus text exposition of the shared totals, plus values read at scrape time
+        ({series: (type, help, value)}, e.g. the snapshot age)
+        """
+        self.flush()
+        by_name: Dict[str, List[Tuple[str, float]]] = {}
+        for key, value in self.totals().items():
+            name = metric_name(key)
+            for suffix in ('_bucket', '_count', '_sum'):
+                base = name[:-len(suffix)]
+                if name.endswith(suffix) and self.definitions.get(base, ('',))[0] == 'histogram':
+                    name = base
+                    break
+            by_name.setdefault(name, []).append((key, value))
+
+        lines = []
+        for name in sorted(set(by_name) | set(self.definitions)):
+            metric_type, help_text = self.definitions.get(name, ('untyped', name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for key, value in sorted(by_name.get(name, []), key=bucket_order):
+                lines.append(f"{key} {format_value(value)}")
+        for key, (metric_type, help_text, value) in sorted((extra or {}).items()):
+            name = metric_name(key)
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{key} {format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+def bucket_order(item: Tuple[str, float]) -> Tuple[str, float]:
+    """
+    Sort series by name, with histogram buckets in ascending `le` order
+    """
+    key = item[0]
+    if 'le="' not in key:
+        return key, 0.0
+    start = key.index('le="') + 4
+    bound = key[start:key.index('"', start)]
+    rest = key[:start] + key[key.index('"', start):]
+    return rest, float('inf') if bound == '+Inf' else float(bound)
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
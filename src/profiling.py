@@ -0,0 +1,129 @@
+import os
+import hmac
+import time
+import random
+import cProfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from flask import g, request
+
+# Requests sending this token in X-Profile-Token are always profiled (empty: disabled)
+PROFILE_ADMIN_TOKEN = os.getenv('PROFILE_ADMIN_TOKEN', '')
+
+# Fraction of all requests profiled, e.g. 0.01; 0 disables sampling
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', 0))
+
+# Where .prof files are written (open them with snakeviz or pstats)
+PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(os.getenv('SCRAPER_STORE_DIR', 'data'), 'profiles'))
+
+# Sampled requests faster than this are discarded; token requests are always kept
+PROFILE_SLOW_MS = float(os.getenv('PROFILE_SLOW_MS', 500))
+
+# Profiles kept in PROFILE_DIR; the oldest are deleted beyond this
+PROFILE_MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', 200))
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Time a phase of the current request for its Server-Timing header (repeated phases add up)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - started)
+
+
+def record_phase(name: str, seconds: float) -> None:
+    timings: Dict[str, float] = g.setdefault('server_timing', {})
+    timings[name] = timings.get(name, 0.0) + seconds
+
+
+def server_timing_header(total: float) -> str:
+    """
+    Server-Timing value of the phases recorded for this request, in milliseconds:
+    "ratelimit;dur=0.41, snapshot;dur=0.02, filter;dur=0.13, render;dur=0.35, total;dur=1.1"
+    """
+    timings: Dict[str, float] = dict(g.get('server_timing', {}))
+    timings['total'] = total
+    return ', '.join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items())
+
+
+class RequestProfiler:
+    """
+    Opt-in cProfile of whole requests: per request with the admin token, or a random sample.
+    When neither is configured `start` returns after two comparisons. At most one request
+    per process is profiled at a time, which bounds the overhead and avoids nesting profilers.
+    """
+
+    def __init__(self, admin_token: str = PROFILE_ADMIN_TOKEN, sample_rate: float = PROFILE_SAMPLE_RATE,
+                 directory: str = PROFILE_DIR, slow_ms: float = PROFILE_SLOW_MS,
+                 max_files: int = PROFILE_MAX_FILES):
+        self.admin_token = admin_token
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.slow_ms = slow_ms
+        self.max_files = max_files
+        self._busy = threading.Lock()
+
+    def requested(self) -> bool:
+        token = request.headers.get('X-Profile-Token', '')
+        return bool(token) and hmac.compare_digest(token, self.admin_token)
+
+    def start(self) -> None:
+        if not self.admin_token and self.sample_rate <= 0:
+            return
+        forced = bool(self.admin_token) and self.requested()
+        if not forced and random.random() >= self.sample_rate:
+            return
+        if not self._busy.acquire(blocking=False):
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is already active in this interpreter
+            self._busy.release()
+            return
+        g.profile = profile
+        g.profile_forced = forced
+
+    def stop(self, elapsed: float) -> Optional[str]:
+        """
+        Stop the request's profile and write it if it was requested or the request was slow;
+        returns the file name written
+        """
+        profile: Optional[cProfile.Profile] = g.pop('profile', None)
+        if profile is None:
+            return None
+        try:
+            profile.disable()
+        finally:
+            self._busy.release()
+
+        elapsed_ms = elapsed * 1000
+        if not g.get('profile_forced') and elapsed_ms < self.slow_ms:
+            return None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            endpoint = request.endpoint or 'unmatched'
+            name = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{endpoint}-{elapsed_ms:.0f}ms.prof"
+            profile.dump_stats(os.path.join(self.directory, name))
+            self.prune()
+            return name
+        except OSError as e:
+            print(f"Error writing profile: {e}")
+            return None
+
+    def prune(self) -> None:
+        profiles = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith('.prof')),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        for entry in profiles[:max(len(profiles) - self.max_files, 0)]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
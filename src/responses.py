@@ -0,0 +1,151 @@
+import os
+import gzip
+import json
+import hashlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from flask import Response, request
+from event_query import ALL_FIELDS, BASIC_FIELDS, InvalidQueryError, project_event, project_events
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # orjson is optional; the standard library encoder produces the same JSON
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli  # type: ignore
+    BROTLI_AVAILABLE = True
+except ImportError:  # without brotli only gzip variants are stored
+    BROTLI_AVAILABLE = False
+
+# How long clients and proxies may reuse a response before revalidating it
+RESPONSE_MAX_AGE = int(os.getenv('RESPONSE_MAX_AGE', 60))
+
+# Bodies smaller than this are not worth compressing
+RESPONSE_COMPRESS_MIN_BYTES = int(os.getenv('RESPONSE_COMPRESS_MIN_BYTES', 512))
+
+# Projections rendered once per snapshot: the two endpoint defaults and the
+# name/date listing mobile clients poll
+PROJECTIONS: Tuple[Sequence[str], ...] = (
+    BASIC_FIELDS,
+    ALL_FIELDS,
+    ('event_name', 'event_date'),
+)
+
+# Preferred order when the client accepts several encodings equally
+COMPRESSED_ENCODINGS = ('br', 'gzip')
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Events serialized per chunk of a streamed response; memory use depends on this, not on the result size
+NDJSON_CHUNK_EVENTS = 100
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Serialize a payload to compact JSON with sorted keys, so equal payloads always hash the same
+    """
+    if ORJSON_AVAILABLE:
+        data: bytes = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        return data
+    return json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def render(payload: Any, compress: bool = True) -> Dict[str, Any]:
+    """
+    Serialize a payload once and keep its compressed variants and content hash:
+    {'etag', 'bodies': {'identity': ..., 'gzip': ..., 'br': ...}}
+    """
+    body = dumps(payload)
+    bodies = {'identity': body}
+    if compress and len(body) >= RESPONSE_COMPRESS_MIN_BYTES:
+        bodies['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+        if BROTLI_AVAILABLE:
+            bodies['br'] = brotli.compress(body)
+    return {'etag': hashlib.sha256(body).hexdigest(), 'bodies': bodies}
+
+
+def events_payload(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'status': 'success',
+        'count': len(events),
+        'events': events
+    }
+
+
+def projection_key(fields: Sequence[str]) -> str:
+    return ','.join(fields)
+
+
+def render_snapshot(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Render the unfiltered response of every common projection; called once per snapshot build
+    """
+    return {projection_key(fields): render(events_payload(project_events(events, fields))) for fields in PROJECTIONS}
+
+
+def choose_encoding(bodies: Dict[str, bytes]) -> str:
+    """
+    Pick the best stored variant allowed by the request's Accept-Encoding
+    """
+    accepted = request.accept_encodings
+    candidates = [name for name in COMPRESSED_ENCODINGS if name in bodies and accepted.quality(name) > 0]
+    if not candidates:
+        return 'identity'
+    # max() keeps the first of equally weighted encodings, i.e. the preferred one
+    return max(candidates, key=accepted.quality)
+
+
+def send_rendered(rendered: Dict[str, Any]) -> Response:
+    """
+    Send pre-rendered bytes as they are, or a bodiless 304 when the client's ETag still matches
+    """
+    response = Response(mimetype='application/json')
+    response.set_etag(rendered['etag'], weak=True)
+    response.headers['Cache-Control'] = f"public, max-age={RESPONSE_MAX_AGE}"
+    response.vary.add('Accept-Encoding')
+    # The same URL streams NDJSON for clients that ask for it in Accept
+    response.vary.add('Accept')
+
+    if request.if_none_match.contains_weak(rendered['etag']):
+        response.status_code = 304
+        return response
+
+    encoding = choose_encoding(rendered['bodies'])
+    response.set_data(rendered['bodies'][encoding])
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def wants_ndjson() -> bool:
+    """
+    True when the client asked for a streamed NDJSON response (format=ndjson or an Accept header preferring it)
+    """
+    response_format = request.args.get('format')
+    if response_format not in (None, '', 'json', 'ndjson'):
+        raise InvalidQueryError(f"Invalid 'format' '{response_format}', expected json or ndjson")
+    if response_format:
+        return response_format == 'ndjson'
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def stream_ndjson(events: Iterable[Dict[str, Any]], fields: Optional[Sequence[str]] = None) -> Response:
+    """
+    Stream one JSON document per line, serialized chunk by chunk as the events are consumed,
+    so the first byte goes out immediately and memory stays flat however many events there are
+    """
+    def generate() -> Iterator[bytes]:
+        chunk = []
+        for event in events:
+            chunk.append(dumps(project_event(event, fields)))
+            if len(chunk) >= NDJSON_CHUNK_EVENTS:
+                yield b'\n'.join(chunk) + b'\n'
+                chunk = []
+        if chunk:
+            yield b'\n'.join(chunk) + b'\n'
+
+    response = Response(generate(), mimetype=NDJSON_MIMETYPE)
+    response.headers['Cache-Control'] = f"public, max-age={RESPONSE_MAX_AGE}"
+    response.vary.add('Accept')
+    return response
@@ -0,0 +1,68 @@
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December')
+
+# Lowercase full names, three-letter abbreviations and "sept" -> month number
+MONTHS: Dict[str, int] = {}
+for number, name in enumerate(MONTH_NAMES, start=1):
+    MONTHS[name.lower()] = number
+    MONTHS[name[:3].lower()] = number
+MONTHS['sept'] = 9
+
+# "February 10, 2024", "Feb 10, 2024", "Feb. 10 2024"
+MONTH_FIRST_RE = re.compile(r'^([A-Za-z]+)\.?\s+(\d{1,2}),?\s+(\d{4})$')
+# "10 February 2024", "10 Feb 2024"
+DAY_FIRST_RE = re.compile(r'^(\d{1,2})\s+([A-Za-z]+)\.?,?\s+(\d{4})$')
+# "2024-02-10"
+ISO_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> Optional[date]:
+    """
+    Parse the date formats used by UFCStats and Wikipedia; returns None when the text is not a date
+    (e.g. "Date TBA")
+    """
+    text = ' '.join(text.split())
+    try:
+        match = MONTH_FIRST_RE.match(text)
+        if match:
+            month = MONTHS.get(match.group(1).lower())
+            return date(int(match.group(3)), month, int(match.group(2))) if month else None
+        match = DAY_FIRST_RE.match(text)
+        if match:
+            month = MONTHS.get(match.group(2).lower())
+            return date(int(match.group(3)), month, int(match.group(1))) if month else None
+        match = ISO_RE.match(text)
+        if match:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        # Out of range day or month, e.g. "February 30, 2026"
+        return None
+    return None
+
+
+def to_iso(text: str) -> Optional[str]:
+    """
+    Canonical ISO form of a date string: "Feb 7, 2026" -> "2026-02-07"
+    """
+    parsed = parse_date(text)
+    return parsed.isoformat() if parsed else None
+
+
+def ufcstats_display(value: date) -> str:
+    """
+    The form UFCStats shows on event pages: "February 07, 2026"
+    """
+    return f"{MONTH_NAMES[value.month - 1]} {value.day:02d}, {value.year}"
+
+
+def display_variants(value: date) -> Tuple[str, str]:
+    """
+    Zero-padded and unpadded long forms: ("February 07, 2026", "February 7, 2026")
+    """
+    return ufcstats_display(value), f"{MONTH_NAMES[value.month - 1]} {value.day}, {value.year}"
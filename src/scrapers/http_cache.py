@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+# On-disk cache of upstream responses and their validators (ETag / Last-Modified)
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'True').lower() == 'true'
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', os.path.join(os.getenv('SCRAPER_STORE_DIR', 'data'), 'http_cache'))
+HTTP_CACHE_MAX_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', 50 * 1024 * 1024))
+
+# Number of parsed pages kept in memory so unchanged pages are not parsed again
+PARSE_CACHE_SIZE = int(os.getenv('PARSE_CACHE_SIZE', 128))
+
+T = TypeVar('T')
+
+
+class HttpCache:
+    """
+    Stores response bodies with their validators, one file per URL.
+    Each file is a JSON header line followed by the raw body and is replaced atomically,
+    so workers sharing the directory never read a half-written entry.
+    The directory is kept under max_bytes by evicting the least recently used entries.
+    """
+
+    def __init__(self, directory: str = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for a URL ({'etag', 'last_modified', 'encoding', 'stored_at', 'body'}) or None
+        """
+        path = self._path(url)
+        try:
+            with open(path, 'rb') as f:
+                header: Dict[str, Any] = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if header.get('url') != url:
+            return None
+        header['body'] = body
+        return header
+
+    @staticmethod
+    def validators(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Conditional request headers for a stored entry
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str],
+            encoding: Optional[str]) -> None:
+        """
+        Store a response body. Bodies without validators cannot be revalidated but are
+        still kept, so a page downloaded once (e.g. an event detail page) can be reused.
+        Best effort: a full or read-only cache directory is logged and the page simply not cached.
+        """
+        header = {'url': url, 'etag': etag, 'last_modified': last_modified, 'encoding': encoding, 'stored_at': time.time()}
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error caching {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._count('stores')
+        self.evict()
+
+    def revalidated(self, url: str, entry: Dict[str, Any], etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Record a 304 for a stored entry: it is rewritten with a new stored_at (and any new validators),
+        so readers judging freshness by stored_at see the page as just confirmed
+        """
+        self.put(url, entry['body'], etag=etag or entry.get('etag'),
+                 last_modified=last_modified or entry.get('last_modified'), encoding=entry.get('encoding'))
+
+    def touch(self, url: str) -> None:
+        """
+        Mark an entry as recently used
+        """
+        try:
+            os.utime(self._path(url))
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the directory fits in max_bytes
+        """
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.is_file() and not entry.name.endswith('.tmp')]
+        except OSError:
+            return
+        files = sorted(((e.stat().st_mtime, e.stat().st_size, e.path) for e in entries))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self._count('evictions')
+
+    def record(self, hit: bool) -> None:
+        self._count('hits' if hit else 'misses')
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+class ParseCache:
+    """
+    Remembers the result of parsing a page, keyed by URL and parser, and returns it
+    as long as the page text is unchanged (e.g. after a 304 Not Modified)
+    """
+
+    def __init__(self, max_entries: int = PARSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0}
+
+    def parse(self, url: str, text: str, parser: Callable[[str], T]) -> T:
+        key = (url, f"{parser.__module__}.{parser.__qualname__}")
+        digest = hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == digest:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                result: T = cached[1]
+                return result
+            self._stats['misses'] += 1
+
+        result = parser(text)
+
+        with self._lock:
+            self._entries[key] = (digest, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+http_cache = HttpCache()
+parse_cache = ParseCache()
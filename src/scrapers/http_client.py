@@ -0,0 +1,235 @@
+import os
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+from scrapers.http_cache import HTTP_CACHE_ENABLED, http_cache
+
+# Timeouts in seconds: (connect, read). A hung upstream can no longer pin a worker.
+CONNECT_TIMEOUT = float(os.getenv('SCRAPER_CONNECT_TIMEOUT', 5))
+READ_TIMEOUT = float(os.getenv('SCRAPER_READ_TIMEOUT', 15))
+
+# Bounded retries with exponential backoff for connection errors and transient statuses
+MAX_RETRIES = int(os.getenv('SCRAPER_MAX_RETRIES', 2))
+BACKOFF_FACTOR = float(os.getenv('SCRAPER_BACKOFF_FACTOR', 0.5))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Keep-alive connections kept per host; should be at least SCRAPER_MAX_WORKERS
+POOL_MAXSIZE = int(os.getenv('SCRAPER_POOL_MAXSIZE', os.getenv('SCRAPER_MAX_WORKERS', 8)))
+
+# Wikipedia rejects requests without a descriptive User-Agent
+USER_AGENT = os.getenv('SCRAPER_USER_AGENT', 'ufc-api/1.0 (+https://github.com/hazemsamak/ufc-api)')
+
+# Consecutive failures (no response, 5xx or 429) that open a host's circuit; 0 disables the breakers
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 5))
+
+# Seconds an open circuit fails fast before a single probe request is let through
+CIRCUIT_RESET_TIMEOUT = float(os.getenv('CIRCUIT_RESET_TIMEOUT', 30))
+
+# Called after every upstream request with (host, status, body bytes, seconds), e.g. to export metrics
+request_observers: List[Callable[[str, int, int, float], None]] = []
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Raised without contacting the host while its circuit is open
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"Circuit open for {host}, next probe in {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: after `failure_threshold` consecutive failures the circuit opens and
+    requests fail fast; after `reset_timeout` one probe is let through (half-open), which
+    closes the circuit on success or opens it again on failure
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if self.failure_threshold <= 0:
+            return True
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            # Open long enough (or a probe never reported back): let one probe through.
+            # Everyone else keeps failing fast until it does.
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record(self, success: bool) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if success:
+                self.state = 'closed'
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'state': self.state, 'failures': self.failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+        return _breakers[host]
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Circuit state and consecutive failures of every host contacted by this process
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+def create_session() -> requests.Session:
+    """
+    Build a requests Session with pooled keep-alive connections, retries and a User-Agent
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared Session for this process.
+    A new one is created after a fork so gunicorn workers never share sockets.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = create_session()
+                _session_pid = pid
+    return _session
+
+
+def fetch(url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """
+    GET a URL through the shared Session with connect/read timeouts applied.
+    When a copy of the page is cached its validators are sent along, and a
+    304 Not Modified is turned back into a 200 carrying the stored body.
+    Raises CircuitOpenError without a request while the host's circuit is open.
+    """
+    # host:port, so upstreams that only differ by port (local stand-ins) get their own circuit
+    host = urlsplit(url).netloc
+    breaker = get_breaker(host)
+    if not breaker.allow():
+        raise CircuitOpenError(host, breaker.retry_after())
+
+    request_headers = dict(headers or {})
+    cached = http_cache.get(url) if HTTP_CACHE_ENABLED else None
+    if cached:
+        request_headers.update(http_cache.validators(cached))
+
+    started = time.perf_counter()
+    try:
+        response = get_session().get(url, headers=request_headers, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+    except requests.RequestException:
+        breaker.record(False)
+        notify_observers(url, None, time.perf_counter() - started)
+        raise
+    # A 4xx other than 429 is an answer about the page, not a sign the host is down
+    breaker.record(response.ok or (response.status_code < 500 and response.status_code != 429))
+    notify_observers(url, response, time.perf_counter() - started)
+
+    if cached and response.status_code == 304:
+        http_cache.record(hit=True)
+        http_cache.revalidated(url, cached, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response_from_cache(response, cached)
+
+    if HTTP_CACHE_ENABLED and response.status_code == 200:
+        http_cache.record(hit=False)
+        http_cache.put(
+            url,
+            response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            encoding=response.encoding
+        )
+    return response
+
+
+def notify_observers(url: str, response: Optional[requests.Response], elapsed: float) -> None:
+    """
+    Report a request to the observers; status 0 means no response at all (connection error,
+    timeout, retries exhausted)
+    """
+    host = urlsplit(url).netloc
+    for observer in request_observers:
+        try:
+            if response is None:
+                observer(host, 0, 0, elapsed)
+            else:
+                observer(host, response.status_code, len(response.content), elapsed)
+        except Exception as e:
+            print(f"Error in request observer: {e}")
+
+
+def response_from_cache(not_modified: requests.Response, cached: Dict[str, Any]) -> requests.Response:
+    """
+    Build a 200 response from a stored body and the headers of the 304 that validated it
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response._content = cached['body']
+    response.encoding = cached.get('encoding')
+    response.headers.update(not_modified.headers)
+    response.headers['X-Cache'] = 'revalidated'
+    response.url = not_modified.url
+    response.request = not_modified.request
+    return response
@@ -0,0 +1,441 @@
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Type
+from bs4 import BeautifulSoup, Tag
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:  # lxml is optional; the pure-Python backend always works
+    LXML_AVAILABLE = False
+
+# HTML parser backend used by all scraper extractors: "html.parser" (pure Python) or "lxml"
+SCRAPER_PARSER = os.getenv('SCRAPER_PARSER', 'html.parser')
+
+EventRow = Tuple[str, str, str]
+CompletedRow = Tuple[str, str, str, str]
+WikiRow = Tuple[str, str, Optional[str]]
+
+
+def clean_wiki_date(date_text: str) -> str:
+    """
+    Remove reference markers such as "[12]" from a Wikipedia date cell
+    """
+    return re.sub(r'\[.*?\]', '', date_text).strip()
+
+
+def find_fight_night_number(text: str) -> Optional[str]:
+    """
+    Look for "UFC Fight Night <number>" in the intro (first 5000 characters) of an article's text
+    """
+    # We need to be careful not to match future/past events mentioned in the chronology if they are not THIS event.
+    # But usually the page title or intro paragraph mentions the event name.
+    match = re.search(r'UFC Fight Night\s+(\d+)', text[:5000])
+    if match:
+        return match.group(1)
+    return None
+
+
+# Result flags shown in the first column of a fight row once the bout has happened
+BOUT_RESULTS = ('win', 'loss', 'draw', 'nc')
+
+
+def make_bout(fight_link: str, result: str, fighters: List[str], weight_class: str, title_bout: bool,
+              method: str, round_text: str, time_text: str) -> Dict[str, Any]:
+    """
+    Normalize the cells of one fight row; bouts that have not happened yet have no result, method, round or time
+    """
+    result = result.lower()
+    return {
+        'fight_id': fight_link.rstrip('/').rsplit('/', 1)[-1] if fight_link else None,
+        'fighters': fighters,
+        'weight_class': weight_class,
+        'title_bout': title_bout,
+        'result': result if result in BOUT_RESULTS else None,
+        'method': method or None,
+        'round': round_text or None,
+        'time': time_text or None,
+    }
+
+
+class ParserBackend(ABC):
+    """
+    Extraction interface shared by every backend; all backends return identical results
+    """
+    name = ''
+
+    @abstractmethod
+    def parse_events_table(self, html: str) -> List[EventRow]:
+        """
+        (event name, event link, location) for every row of the UFCStats events table
+        """
+
+    @abstractmethod
+    def parse_completed_events(self, html: str) -> List[CompletedRow]:
+        """
+        (event name, event link, date text, location) for every row of a UFCStats completed events page
+        """
+
+    @abstractmethod
+    def parse_event_date(self, html: str) -> str:
+        """
+        The date shown on a UFCStats event detail page, or "Date TBA"
+        """
+
+    @abstractmethod
+    def parse_event_details(self, html: str) -> Dict[str, Any]:
+        """
+        Name, date, location and fight card ("fights", see make_bout) of a UFCStats event detail page
+        """
+
+    @abstractmethod
+    def parse_wiki_table(self, html: str) -> List[WikiRow]:
+        """
+        (event name, date text, article link) for each row of the first wikitable with Event and Date headers
+        """
+
+    @abstractmethod
+    def parse_wiki_intro(self, html: str) -> Optional[str]:
+        """
+        The Fight Night number mentioned in the intro of a Wikipedia event article
+        """
+
+
+class SoupParser(ParserBackend):
+    """
+    Pure-Python backend: BeautifulSoup with the standard library html.parser
+    """
+    name = 'html.parser'
+
+    def parse_events_table(self, html: str) -> List[EventRow]:
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Find the events table
+        events_table = soup.find('table', class_='b-statistics__table-events')
+        if not events_table:
+            events_table = soup.find('table', class_='b-statistics__table')
+            if not events_table:
+                return []
+
+        tbody = events_table.find('tbody')
+        if not isinstance(tbody, Tag):
+            return []
+
+        parsed_rows = []
+        for row in tbody.find_all('tr'):
+            cols = row.find_all('td')
+
+            if len(cols) < 2:
+                continue
+
+            # Extract event name and link from first column
+            event_link_tag = cols[0].find('a')
+            if not event_link_tag:
+                continue
+
+            raw_event_name = event_link_tag.get_text(strip=True)
+            event_link = str(event_link_tag['href'])
+
+            # Extract location from second column
+            location = cols[1].get_text(strip=True)
+
+            parsed_rows.append((raw_event_name, event_link, location))
+
+        return parsed_rows
+
+    def parse_completed_events(self, html: str) -> List[CompletedRow]:
+        soup = BeautifulSoup(html, 'html.parser')
+        events_table = soup.find('table', class_='b-statistics__table-events')
+        if not isinstance(events_table, Tag):
+            return []
+
+        parsed_rows = []
+        for row in events_table.find_all('tr'):
+            cols = row.find_all('td')
+            if len(cols) < 2:
+                continue
+            event_link_tag = cols[0].find('a')
+            date_tag = cols[0].find('span', class_='b-statistics__date')
+            if not event_link_tag or not date_tag:
+                continue
+            parsed_rows.append((
+                event_link_tag.get_text(strip=True),
+                str(event_link_tag['href']),
+                date_tag.get_text(strip=True),
+                cols[1].get_text(strip=True)
+            ))
+        return parsed_rows
+
+    def parse_event_date(self, html: str) -> str:
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Look for date information in various possible locations
+        date_info = soup.find('li', class_='b-list__box-list-item')
+        if date_info and 'Date:' in date_info.get_text():
+            return str(date_info.get_text().replace('Date:', '').strip())
+
+        # Alternative: look for date in event details
+        for detail in soup.find_all('li', class_='b-list__box-list-item'):
+            text = detail.get_text()
+            if 'Date:' in text:
+                return str(text.replace('Date:', '').strip())
+
+        return "Date TBA"
+
+    def parse_event_details(self, html: str) -> Dict[str, Any]:
+        soup = BeautifulSoup(html, 'html.parser')
+        title = soup.find('span', class_='b-content__title-highlight')
+        location = None
+        for item in soup.find_all('li', class_='b-list__box-list-item'):
+            text = item.get_text()
+            if 'Location:' in text:
+                location = text.replace('Location:', '').strip()
+
+        fights = []
+        table = soup.find('table', class_='b-fight-details__table')
+        tbody = table.find('tbody') if isinstance(table, Tag) else None
+        if isinstance(tbody, Tag):
+            for row in tbody.find_all('tr'):
+                cols = row.find_all('td', recursive=False)
+                if len(cols) < 10:
+                    continue
+                weight = cols[6]
+                fights.append(make_bout(
+                    str(row.get('data-link') or ''),
+                    cols[0].get_text(strip=True),
+                    [a.get_text(strip=True) for a in cols[1].find_all('a')],
+                    weight.get_text(strip=True),
+                    any('belt.png' in str(img.get('src', '')) for img in weight.find_all('img')),
+                    self._first_paragraph(cols[7]),
+                    cols[8].get_text(strip=True),
+                    cols[9].get_text(strip=True)
+                ))
+
+        return {
+            'event_name': title.get_text(strip=True) if title else None,
+            'event_date': self.parse_event_date(html),
+            'location': location,
+            'fights': fights,
+        }
+
+    @staticmethod
+    def _first_paragraph(cell: Tag) -> str:
+        paragraph = cell.find('p')
+        return paragraph.get_text(strip=True) if paragraph else cell.get_text(strip=True)
+
+    def parse_wiki_table(self, html: str) -> List[WikiRow]:
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Find Scheduled events table
+        # Strategy: Look for the headers "Event", "Date", "Venue"
+        target_table = None
+        for table in soup.find_all('table', class_='wikitable'):
+            headers = [th.get_text(strip=True) for th in table.find_all('th')]
+            if "Event" in headers and "Date" in headers:
+                target_table = table
+                break
+
+        scheduled_events: List[WikiRow] = []
+        if target_table:
+            for row in target_table.find_all('tr')[1:]:
+                cols = row.find_all('td')
+                if len(cols) >= 2:
+                    # Col 0: Event (link text), Col 1: Date
+                    event_name = cols[0].get_text(strip=True)
+                    date_text = clean_wiki_date(cols[1].get_text(strip=True))
+                    link = cols[0].find('a')
+                    link_href = link.get('href') if isinstance(link, Tag) else None
+                    scheduled_events.append((event_name, date_text, link_href if isinstance(link_href, str) else None))
+
+        return scheduled_events
+
+    def parse_wiki_intro(self, html: str) -> Optional[str]:
+        return find_fight_night_number(BeautifulSoup(html, 'html.parser').get_text())
+
+
+# Text inside these elements is not part of BeautifulSoup's get_text(), so it is skipped here too
+LXML_TEXT_XPATH = './/text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]'
+
+
+def has_class(class_name: str) -> str:
+    """
+    XPath predicate matching one CSS class the way BeautifulSoup's class_ does
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+class LxmlParser(ParserBackend):
+    """
+    Fast backend: libxml2's HTML parser with XPath selectors
+    """
+    name = 'lxml'
+
+    @staticmethod
+    def _document(html: str) -> Optional[Any]:
+        try:
+            return lxml.html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            # Empty documents (and undecodable ones) have nothing to extract
+            return None
+
+    @staticmethod
+    def _text(element: Any, strip: bool = False) -> str:
+        texts = element.xpath(LXML_TEXT_XPATH)
+        if strip:
+            return ''.join(text.strip() for text in texts)
+        return ''.join(texts)
+
+    def parse_events_table(self, html: str) -> List[EventRow]:
+        document = self._document(html)
+        if document is None:
+            return []
+        tables = (document.xpath(f"//table[{has_class('b-statistics__table-events')}]")
+                  or document.xpath(f"//table[{has_class('b-statistics__table')}]"))
+        if not tables:
+            return []
+        tbody = tables[0].xpath('.//tbody')
+        if not tbody:
+            return []
+
+        parsed_rows = []
+        for row in tbody[0].xpath('.//tr'):
+            cols = row.xpath('.//td')
+            if len(cols) < 2:
+                continue
+            links = cols[0].xpath('.//a')
+            if not links:
+                continue
+            parsed_rows.append((self._text(links[0], strip=True), str(links[0].attrib['href']), self._text(cols[1], strip=True)))
+        return parsed_rows
+
+    def parse_completed_events(self, html: str) -> List[CompletedRow]:
+        document = self._document(html)
+        if document is None:
+            return []
+        tables = document.xpath(f"//table[{has_class('b-statistics__table-events')}]")
+        if not tables:
+            return []
+
+        parsed_rows = []
+        for row in tables[0].xpath('.//tr'):
+            cols = row.xpath('.//td')
+            if len(cols) < 2:
+                continue
+            links = cols[0].xpath('.//a')
+            dates = cols[0].xpath(f".//span[{has_class('b-statistics__date')}]")
+            if not links or not dates:
+                continue
+            parsed_rows.append((
+                self._text(links[0], strip=True),
+                str(links[0].attrib['href']),
+                self._text(dates[0], strip=True),
+                self._text(cols[1], strip=True)
+            ))
+        return parsed_rows
+
+    def parse_event_date(self, html: str) -> str:
+        document = self._document(html)
+        if document is None:
+            return "Date TBA"
+        for item in document.xpath(f"//li[{has_class('b-list__box-list-item')}]"):
+            text = self._text(item)
+            if 'Date:' in text:
+                return text.replace('Date:', '').strip()
+        return "Date TBA"
+
+    def parse_event_details(self, html: str) -> Dict[str, Any]:
+        document = self._document(html)
+        if document is None:
+            return {'event_name': None, 'event_date': "Date TBA", 'location': None, 'fights': []}
+        titles = document.xpath(f"//span[{has_class('b-content__title-highlight')}]")
+        location = None
+        for item in document.xpath(f"//li[{has_class('b-list__box-list-item')}]"):
+            text = self._text(item)
+            if 'Location:' in text:
+                location = text.replace('Location:', '').strip()
+
+        fights = []
+        tables = document.xpath(f"//table[{has_class('b-fight-details__table')}]")
+        tbody = tables[0].xpath('.//tbody') if tables else []
+        if tbody:
+            for row in tbody[0].xpath('.//tr'):
+                cols = row.xpath('./td')
+                if len(cols) < 10:
+                    continue
+                method = cols[7].xpath('.//p')
+                fights.append(make_bout(
+                    row.get('data-link') or '',
+                    self._text(cols[0], strip=True),
+                    [self._text(a, strip=True) for a in cols[1].xpath('.//a')],
+                    self._text(cols[6], strip=True),
+                    any('belt.png' in (img.get('src') or '') for img in cols[6].xpath('.//img')),
+                    self._text(method[0] if method else cols[7], strip=True),
+                    self._text(cols[8], strip=True),
+                    self._text(cols[9], strip=True)
+                ))
+
+        return {
+            'event_name': self._text(titles[0], strip=True) if titles else None,
+            'event_date': self.parse_event_date(html),
+            'location': location,
+            'fights': fights,
+        }
+
+    def parse_wiki_table(self, html: str) -> List[WikiRow]:
+        document = self._document(html)
+        if document is None:
+            return []
+        target_table = None
+        for table in document.xpath(f"//table[{has_class('wikitable')}]"):
+            headers = [self._text(th, strip=True) for th in table.xpath('.//th')]
+            if "Event" in headers and "Date" in headers:
+                target_table = table
+                break
+
+        scheduled_events: List[WikiRow] = []
+        if target_table is not None:
+            for row in target_table.xpath('.//tr')[1:]:
+                cols = row.xpath('.//td')
+                if len(cols) >= 2:
+                    links = cols[0].xpath('.//a')
+                    link_href = links[0].get('href') if links else None
+                    scheduled_events.append((
+                        self._text(cols[0], strip=True),
+                        clean_wiki_date(self._text(cols[1], strip=True)),
+                        link_href
+                    ))
+        return scheduled_events
+
+    def parse_wiki_intro(self, html: str) -> Optional[str]:
+        document = self._document(html)
+        if document is None:
+            return None
+        return find_fight_night_number(self._text(document))
+
+
+PARSER_BACKENDS: Dict[str, Type[ParserBackend]] = {
+    SoupParser.name: SoupParser,
+    LxmlParser.name: LxmlParser,
+}
+
+
+def available_backends() -> List[str]:
+    """
+    Names of the backends that can be used in this environment
+    """
+    return [name for name in PARSER_BACKENDS if name != LxmlParser.name or LXML_AVAILABLE]
+
+
+def get_parser(name: Optional[str] = None) -> ParserBackend:
+    """
+    Return the configured parser backend, falling back to html.parser when lxml is not installed
+    """
+    name = name or SCRAPER_PARSER
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{name}', expected one of {', '.join(PARSER_BACKENDS)}")
+    if name == LxmlParser.name and not LXML_AVAILABLE:
+        print("lxml is not installed, falling back to the html.parser backend")
+        name = SoupParser.name
+    return PARSER_BACKENDS[name]()
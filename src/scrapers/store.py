@@ -0,0 +1,104 @@
+import os
+import json
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl; fall back to in-process locking only
+    fcntl = None  # type: ignore
+
+# Where scraper state survives restarts: "file" (JSON files on disk) or "redis"
+SCRAPER_STORE_BACKEND = os.getenv('SCRAPER_STORE_BACKEND', 'file')
+SCRAPER_STORE_DIR = os.getenv('SCRAPER_STORE_DIR', 'data')
+
+
+class FileStore:
+    """
+    Small persistent key/value store kept in a JSON file.
+    Writes re-read the file under an exclusive lock and replace it atomically,
+    so several gunicorn workers can share one file without losing entries.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Dict[str, Any] = {}
+        self._signature: Optional[Tuple[int, int]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return self._data
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._signature:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+                self._signature = signature
+            except (OSError, ValueError) as e:
+                print(f"Error reading store {self.path}: {e}")
+        return self._data
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self._update(lambda data: data.__setitem__(key, value))
+
+    def delete(self, key: str) -> None:
+        if self.get(key) is not None:
+            self._update(lambda data: data.pop(key, None))
+
+    def _update(self, mutate: Callable[[Dict[str, Any]], Any]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock, open(f"{self.path}.lock", 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            data = dict(self._load())
+            mutate(data)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._data = data
+            stat = os.stat(self.path)
+            self._signature = (stat.st_mtime_ns, stat.st_size)
+
+
+class RedisStore:
+    """
+    Persistent key/value store kept in a single Redis hash (values are JSON encoded)
+    """
+
+    def __init__(self, client: Any, name: str):
+        self.client = client
+        self.name = name
+
+    def get(self, key: str) -> Any:
+        value = self.client.hget(self.name, key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        self.client.hset(self.name, key, json.dumps(value))
+
+    def delete(self, key: str) -> None:
+        self.client.hdel(self.name, key)
+
+
+def create_store(name: str) -> Any:
+    """
+    Return the configured persistent store for a given kind of scraper state
+    """
+    if SCRAPER_STORE_BACKEND == 'redis':
+        import redis
+        client = redis.Redis(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', 6379))
+        )
+        return RedisStore(client, f"ufc:store:{name}")
+    return FileStore(os.path.join(SCRAPER_STORE_DIR, f"{name}.json"))
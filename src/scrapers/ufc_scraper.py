@@ -1,35 +1,103 @@
-import requests
-import pandas as pd
+import os
 import re
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup, Tag
+import time
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from scrapers.http_client import fetch
+from scrapers.http_cache import HTTP_CACHE_ENABLED, http_cache, parse_cache
+from scrapers.store import create_store
+from scrapers.parsers import get_parser
+from scrapers.dates import display_variants, parse_date, to_iso
+
+# Upstream origins; point them at a stand-in server for load tests (tests/benchmarks/load_test.py)
+UFCSTATS_BASE_URL = os.getenv('UFCSTATS_BASE_URL', 'http://ufcstats.com').rstrip('/')
+WIKIPEDIA_BASE_URL = os.getenv('WIKIPEDIA_BASE_URL', 'https://en.wikipedia.org').rstrip('/')
+
+# Maximum number of concurrent upstream fetches during a schedule scrape
+SCRAPER_MAX_WORKERS = int(os.getenv('SCRAPER_MAX_WORKERS', 8))
+
+# HTML parser backend for every extractor (SCRAPER_PARSER: "html.parser" or "lxml")
+parser_backend = get_parser()
+
+# Resolved Fight Night numbers, keyed by Wikipedia link and by date
+number_store = create_store('fight_night_numbers')
+
+# Previously resolved UFCStats events (date, number, location), keyed by event link.
+# Entries older than SCRAPER_EVENT_MAX_AGE seconds get their detail page fetched again.
+event_store = create_store('ufcstats_events')
+SCRAPER_EVENT_MAX_AGE = int(os.getenv('SCRAPER_EVENT_MAX_AGE', 86400))
+
+# Last Wikipedia mapping scraped successfully; served while Wikipedia is failing
+mapping_store = create_store('wiki_mapping')
+
+# Wikipedia list parsing: "targeted" only parses the scheduled events table, "full" parses the whole page
+WIKI_PARSE_MODE = os.getenv('WIKI_PARSE_MODE', 'targeted')
+TABLE_TAG_RE = re.compile(r'<(/?)table\b[^>]*>', re.IGNORECASE)
+TH_RE = re.compile(r'<th\b[^>]*>(.*?)</th>', re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# How many rows the last schedule scrape reused from the store vs fetched upstream (exported by /api/metrics)
+last_scrape_stats: Dict[str, int] = {'reused': 0, 'fetched': 0}
+
+# Whether the last schedule scrape used the last-known-good Wikipedia mapping (or had none at all),
+# and when the mapping it used was scraped; read right after a scrape and stored with its snapshot
+wiki_mapping_state: Dict[str, Any] = {'fallback': False, 'fetched_at': None}
+
+# Paginated list of past events (?page=N)
+COMPLETED_EVENTS_URL = f"{UFCSTATS_BASE_URL}/statistics/events/completed"
+
+# Event detail page; the same URL the schedule scrape fetches for each event's date
+EVENT_DETAILS_URL = UFCSTATS_BASE_URL + "/event-details/{event_id}"
 
 def get_event_date_from_detail_page(event_url: str) -> str:
     """
     Get the actual event date from the event detail page
     """
     try:
-        response = requests.get(event_url)
+        response = fetch(event_url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Look for date information in various possible locations
-        date_info = soup.find('li', class_='b-list__box-list-item')
-        if date_info and 'Date:' in date_info.get_text():
-            date_text = str(date_info.get_text().replace('Date:', '').strip())
-            return date_text
-        
-        # Alternative: look for date in event details
-        details = soup.find_all('li', class_='b-list__box-list-item')
-        for detail in details:
-            text = detail.get_text()
-            if 'Date:' in text:
-                return str(text.replace('Date:', '').strip())
-        
-        return "Date TBA"
+        date_text: str = parse_cache.parse(event_url, response.text, parse_event_date)
+        return date_text
     except:
         return "Date TBA"
 
+def get_event_details(event_id: str, max_age: float) -> Dict[str, Any]:
+    """
+    Name, date, location and fight card of one event.
+    A detail page downloaded less than max_age seconds ago (usually by the schedule scrape)
+    is parsed from the page cache without another upstream request.
+    """
+    url = EVENT_DETAILS_URL.format(event_id=event_id)
+    cached = http_cache.get(url) if HTTP_CACHE_ENABLED else None
+    if cached and time.time() - cached.get('stored_at', 0) < max_age:
+        http_cache.touch(url)
+        text = cached['body'].decode(cached.get('encoding') or 'utf-8', errors='replace')
+    else:
+        response = fetch(url)
+        response.raise_for_status()
+        text = response.text
+
+    details: Dict[str, Any] = dict(parse_cache.parse(url, text, parse_event_details))
+    details['event_id'] = event_id
+    if details['event_name']:
+        details['event_type'], details['event_number'] = classify_event(details['event_name'])
+    return details
+
+def parse_event_details(html: str) -> Dict[str, Any]:
+    """
+    Extract name, date, location and fight card from an event detail page
+    """
+    details: Dict[str, Any] = parser_backend.parse_event_details(html)
+    return details
+
+def parse_event_date(html: str) -> str:
+    """
+    Extract the event date from an event detail page
+    """
+    date_text: str = parser_backend.parse_event_date(html)
+    return date_text
+
 def clean_event_name(event_name: str) -> str:
     """
     Clean event name to show only "UFC <number>" for numbered events
@@ -45,196 +113,265 @@ def clean_event_name(event_name: str) -> str:
     return event_name
 
 
-def get_upcoming_ufc_schedule() -> List[Dict[str, Any]]:
+def get_upcoming_ufc_schedule(max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
     """
-    Scrape the upcoming UFC schedule from UFCStats.com and return as list of dictionaries
+    Scrape the upcoming UFC schedule from UFCStats.com and return as list of dictionaries.
+    Scraping is incremental: only event links that are new (or whose stored entry expired)
+    have their detail page fetched, and an expired entry keeps its resolved Fight Night number.
+    Those pages (and the Wikipedia mapping, when a Fight Night number is still unknown) are
+    fetched concurrently, bounded by max_workers (defaults to the SCRAPER_MAX_WORKERS
+    environment variable).
     """
-    events_url = "http://ufcstats.com/statistics/events/upcoming"
+    events_url = f"{UFCSTATS_BASE_URL}/statistics/events/upcoming"
     
-    response = requests.get(events_url)
+    response = fetch(events_url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
-    # Find the events table
-    events_table = soup.find('table', class_='b-statistics__table-events')
-    if not events_table:
-        events_table = soup.find('table', class_='b-statistics__table')
-        if not events_table:
-            return []
-    
-    tbody = events_table.find('tbody')
-    if not tbody:
-        return []
+    parsed_rows = parse_cache.parse(events_url, response.text, parse_upcoming_events_table)
 
-    # Fetch event mapping from Wikipedia
-    wiki_mapping = get_event_mapping_from_wikipedia()
-    
-    event_rows: List[Tag] = []
-    if isinstance(tbody, Tag):
-        event_rows = tbody.find_all('tr')
-    else:
-        return []
+    if max_workers is None:
+        max_workers = SCRAPER_MAX_WORKERS
+    max_workers = max(1, max_workers)
+
+    # Reuse previously resolved events (keyed by their UFCStats link): the date when the entry is
+    # recent enough, so only new or expired links need their detail page fetched again, and the
+    # Fight Night number in any case, since it never changes once resolved
+    now = time.time()
+    stored_rows: List[Optional[Dict[str, Any]]] = [event_store.get(event_link) for _, event_link, _ in parsed_rows]
+    reusable: List[Optional[Dict[str, Any]]] = []
+    for stored in stored_rows:
+        if stored and stored.get('event_date') != "Date TBA" and now - stored.get('fetched_at', 0) < SCRAPER_EVENT_MAX_AGE:
+            reusable.append(stored)
+        else:
+            reusable.append(None)
+
+    links_to_fetch = [row[1] for row, stored in zip(parsed_rows, reusable) if stored is None]
+
+    # Wikipedia is only needed for Fight Nights whose number is still unknown
+    needs_wiki = False
+    for (raw_event_name, _, _), stored in zip(parsed_rows, stored_rows):
+        event_type, event_number = classify_event(raw_event_name)
+        if event_type == "UFC Fight Night" and event_number is None and not (stored and stored.get('event_number')):
+            needs_wiki = True
+
+    # Fetch the Wikipedia mapping and the remaining detail pages concurrently.
+    # get_event_date_from_detail_page already degrades to "Date TBA" on failure.
+    wiki_mapping: Dict[str, str] = {}
+    wiki_mapping_state.update(fallback=False, fetched_at=None)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        wiki_future = executor.submit(get_event_mapping_from_wikipedia) if needs_wiki else None
+        fetched_dates = dict(zip(links_to_fetch, executor.map(get_event_date_from_detail_page, links_to_fetch)))
+        if wiki_future is not None:
+            wiki_mapping = wiki_future.result()
     
     upcoming_events = []
     
-    for row in event_rows:
-        cols = row.find_all('td')
-        
-        if len(cols) < 2:
-            continue
-            
-        # Extract event name and link from first column
-        event_link_tag = cols[0].find('a')
-        if not event_link_tag:
-            continue
-            
-        raw_event_name = event_link_tag.get_text(strip=True)
-        event_link = str(event_link_tag['href'])
-        
-        # Determine event type and number
-        event_type = "UFC"
-        event_number = None
-        
-        # Check for "UFC <number>" pattern
-        ufc_match = re.match(r'^UFC\s+(\d+)', raw_event_name)
-        if ufc_match:
-            event_type = "UFC"
-            event_number = ufc_match.group(1)
-        elif "Fight Night" in raw_event_name:
-             event_type = "UFC Fight Night"
-             # Try to find number in name first (unlikely for UFCStats but possible)
-             fn_match = re.search(r'Fight Night\s+(\d+)', raw_event_name)
-             if fn_match:
-                 event_number = fn_match.group(1)
-             else:
-                 # Try Wikipedia mapping
-                 # Get actual date from the event detail page
-                 event_date = get_event_date_from_detail_page(event_link)
-                 
-                 # Check mapping
-                 # The mapping keys are formatted dates.
-                 # The values in mapping are "UFC Fight Night <number>" or similar.
-                 
-                 if event_date in wiki_mapping:
-                     wiki_name = wiki_mapping[event_date]
-                     # Extract number from wiki name
-                     wiki_match = re.search(r'Fight Night\s+(\d+)', wiki_name)
-                     if wiki_match:
-                         event_number = wiki_match.group(1)
-
-        # If we didn't get the date yet (numbered events Loop), get it now
-        # Creating a local variable 'event_date' if not already set is risky in loop if branches differ.
-        if 'event_date' not in locals():
-             event_date = get_event_date_from_detail_page(event_link)
-
-        # Extract location from second column
-        location = cols[1].get_text(strip=True)
-        
+    for (raw_event_name, event_link, location), stored, fresh in zip(parsed_rows, stored_rows, reusable):
+        event_type, event_number = classify_event(raw_event_name)
+        event_date = fresh['event_date'] if fresh else fetched_dates[event_link]
+
+        if event_type == "UFC Fight Night" and event_number is None:
+            if stored and stored.get('event_number'):
+                event_number = stored['event_number']
+            else:
+                # Try Wikipedia mapping
+                # The mapping keys are formatted dates (including ISO dates).
+                # The values in mapping are "UFC Fight Night <number>" or similar.
+                wiki_name = wiki_mapping.get(event_date) or wiki_mapping.get(to_iso(event_date) or '', '')
+                # Extract number from wiki name
+                wiki_match = re.search(r'Fight Night\s+(\d+)', wiki_name)
+                if wiki_match:
+                    event_number = wiki_match.group(1)
+
+        if event_date != "Date TBA" and (fresh is None or fresh.get('event_number') != event_number):
+            try:
+                event_store.set(event_link, {
+                    'event_date': event_date,
+                    'event_number': event_number,
+                    'location': location,
+                    'fetched_at': fresh['fetched_at'] if fresh else now
+                })
+            except Exception as e:
+                # Only costs a detail page fetch on the next scrape
+                print(f"Error storing event {event_link}: {e}")
+
         upcoming_events.append({
+            'event_id': event_id_from_link(event_link),
             'event_date': event_date,
             'event_type': event_type,
             'event_name': raw_event_name,
             'event_number': event_number,
             'location': location
         })
-        
-        # Clean up local var for next iteration safety
-        del event_date
-    
+
+    last_scrape_stats['reused'] = len(parsed_rows) - len(links_to_fetch)
+    last_scrape_stats['fetched'] = len(links_to_fetch)
+
     return upcoming_events
 
+def get_completed_events_page(page: int) -> List[Dict[str, Any]]:
+    """
+    Scrape one page of the UFCStats completed events list.
+    The date is part of the list, so no detail pages are fetched.
+    """
+    url = f"{COMPLETED_EVENTS_URL}?page={page}"
+    response = fetch(url)
+    response.raise_for_status()
+
+    events = []
+    for raw_event_name, event_link, date_text, location in parse_cache.parse(url, response.text, parse_completed_events_page):
+        event_type, event_number = classify_event(raw_event_name)
+        events.append({
+            'event_id': event_id_from_link(event_link),
+            'event_date': date_text,
+            'event_type': event_type,
+            'event_name': raw_event_name,
+            'event_number': event_number,
+            'location': location
+        })
+    return events
+
+def parse_completed_events_page(html: str) -> List[Tuple[str, str, str, str]]:
+    """
+    Extract (event name, event link, date text, location) for every row of a completed events page
+    """
+    rows: List[Tuple[str, str, str, str]] = parser_backend.parse_completed_events(html)
+    return rows
+
+def event_id_from_link(event_link: str) -> str:
+    """
+    The stable UFCStats identifier at the end of an event link,
+    e.g. "http://ufcstats.com/event-details/8e6ad1ab0bd2a3b1" -> "8e6ad1ab0bd2a3b1"
+    """
+    return event_link.rstrip('/').rsplit('/', 1)[-1]
+
+def parse_upcoming_events_table(html: str) -> List[Tuple[str, str, str]]:
+    """
+    Extract (event name, event link, location) for every row of the UFCStats events table
+    """
+    rows: List[Tuple[str, str, str]] = parser_backend.parse_events_table(html)
+    return rows
+
+def classify_event(raw_event_name: str) -> Tuple[str, Optional[str]]:
+    """
+    Determine the event type and, when it is part of the name, the event number.
+    For example: "UFC 325: Holloway vs. Oliveira" -> ("UFC", "325")
+    """
+    # Check for "UFC <number>" pattern
+    ufc_match = re.match(r'^UFC\s+(\d+)', raw_event_name)
+    if ufc_match:
+        return "UFC", ufc_match.group(1)
+    if "Fight Night" in raw_event_name:
+        # Try to find number in name first (unlikely for UFCStats but possible)
+        fn_match = re.search(r'Fight Night\s+(\d+)', raw_event_name)
+        return "UFC Fight Night", fn_match.group(1) if fn_match else None
+    return "UFC", None
+
 def get_event_mapping_from_wikipedia() -> Dict[str, str]:
     """
     Scrape upcoming events from Wikipedia to get the Fight Night numbers.
-    Returns a dictionary mapping Date -> Event Name (e.g. "February 10, 2024" -> "UFC Fight Night 236")
+    Returns a dictionary mapping Date -> Event Name (e.g. "February 10, 2024" -> "UFC Fight Night 236").
+    When Wikipedia fails (or its circuit is open) the last mapping scraped successfully is returned instead.
     """
-    url = "https://en.wikipedia.org/wiki/List_of_UFC_events"
+    url = f"{WIKIPEDIA_BASE_URL}/wiki/List_of_UFC_events"
     try:
-        response = requests.get(url)
-        # Wikipedia might block requests without user agent
-        if response.status_code != 200:
-             response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find Scheduled events table
-        # Strategy: Look for the headers "Event", "Date", "Venue"
-        tables = soup.find_all('table', class_='wikitable')
-        target_table = None
-        for table in tables:
-            headers = [th.get_text(strip=True) for th in table.find_all('th')]
-            if "Event" in headers and "Date" in headers:
-                target_table = table
-                break
+        # The shared session sends a descriptive User-Agent, which Wikipedia requires
+        response = fetch(url)
+        response.raise_for_status()
         
         mapping = {}
-        if target_table:
-            rows = target_table.find_all('tr')
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) >= 2:
-                    # Col 0: Event (link text)
-                    # Col 1: Date
-                    event_col = cols[0]
-                    date_col = cols[1]
-                    
-                    event_name = event_col.get_text(strip=True)
-                    date_text = date_col.get_text(strip=True)
-                    
-                    # Normalize date to match UFCStats format if possible?
-                    # UFCStats: "February 10, 2024"
-                    # Wikipedia: "Feb 10, 2024" or "February 10, 2024"
-                    # We might need to be flexible or parse dates. 
-                    # For now let's try to match exactly or basic transformation
-                    # Let's clean the date text (remove [ref])
-                    date_text = re.sub(r'\[.*?\]', '', date_text).strip()
-                    
-                    # If event name is just "UFC Fight Night: ..." without number, try to find it in the link
-                    if "Fight Night" in event_name and not re.search(r'\d+', event_name):
-                        link = event_col.find('a')
-                        if link:
-                            link_href = link.get('href')
-                            if isinstance(link_href, str):
-                                wiki_url = f"https://en.wikipedia.org{link_href}"
-                                # Fetch detail page to find number
-                                number = get_fight_night_number_from_wiki_url(wiki_url)
-                                if number:
-                                    # Construct new name e.g. "UFC Fight Night 267"
-                                    # Or should we keep the subtitle? "UFC Fight Night 267: Strickland vs. Hernandez"
-                                    # The user just asked for the number, but usually we want "UFC Fight Night <number>" as the main identifier.
-                                    # Let's prepend it.
-                                    event_name = f"UFC Fight Night {number}"
-
-                    mapping[date_text] = event_name
-                    
-                    # Also try converting "Feb 10, 2024" to "February 10, 2024"
-                    try:
-                        dt = pd.to_datetime(date_text)
-                        formatted_date = dt.strftime('%B %d, %Y').replace(' 0', ' ') # Remove leading zero in day? UFCStats uses "February 8, 2025" (no leading zero usually)
-                        # Actually pandas strftime %d is 01-31. 
-                        # Python's platform specific formatting for %-d or similar might work but relies on OS.
-                        # Let's just do standard valid date string and maybe handle the matching carefully.
-                        
-                        # UFCStats date format from `get_event_date_from_detail_page`:
-                        # "February 8, 2025" or "July 27, 2024"
-                        
-                        formatted_date_long = dt.strftime('%B %d, %Y') # "February 08, 2025"
-                        
-                        # Handle single digit day matching manually if needed or just strip 0
-                        parts = formatted_date_long.split(' ')
-                        if parts[1].startswith('0'):
-                            parts[1] = parts[1][1:]
-                        
-                        formatted_date_ufc_style = " ".join(parts)
-                        mapping[formatted_date_ufc_style] = event_name
-                        
-                    except:
-                        pass
-                        
+        for event_name, date_text, link_href in parse_cache.parse(url, response.text, parse_wiki_scheduled_events):
+            # If event name is just "UFC Fight Night: ..." without number, try to find it in the link
+            if "Fight Night" in event_name and not re.search(r'\d+', event_name):
+                if link_href:
+                    number = resolve_fight_night_number(link_href, date_text)
+                    if number:
+                        # Construct new name e.g. "UFC Fight Night 267"
+                        # Or should we keep the subtitle? "UFC Fight Night 267: Strickland vs. Hernandez"
+                        # The user just asked for the number, but usually we want "UFC Fight Night <number>" as the main identifier.
+                        # Let's prepend it.
+                        event_name = f"UFC Fight Night {number}"
+
+            mapping[date_text] = event_name
+            
+            # Also register the normalized forms: "Feb 10, 2024" -> "February 10, 2024",
+            # "February 10, 2024" (UFCStats pads the day) and "2024-02-10"
+            parsed_date = parse_date(date_text)
+            if parsed_date:
+                for formatted_date in display_variants(parsed_date):
+                    mapping[formatted_date] = event_name
+                mapping[parsed_date.isoformat()] = event_name
+
+        fetched_at = time.time()
+        try:
+            mapping_store.set('last_good', {'mapping': mapping, 'fetched_at': fetched_at})
+        except Exception as e:
+            # Only costs the fallback copy; this mapping is current
+            print(f"Error storing Wikipedia mapping: {e}")
+        wiki_mapping_state.update(fallback=False, fetched_at=fetched_at)
         return mapping
     except Exception as e:
-        print(f"Error scraping Wikipedia: {e}")
-        return {}
+        stored = mapping_store.get('last_good')
+        if not stored:
+            print(f"Error scraping Wikipedia: {e}")
+            wiki_mapping_state.update(fallback=True, fetched_at=None)
+            return {}
+        age = int(time.time() - stored['fetched_at'])
+        print(f"Error scraping Wikipedia: {e}; using the last known good mapping from {age}s ago")
+        wiki_mapping_state.update(fallback=True, fetched_at=stored['fetched_at'])
+        last_good: Dict[str, str] = stored['mapping']
+        return last_good
+
+def parse_wiki_scheduled_events(html: str) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Extract (event name, date text, article link) for each row of the Wikipedia scheduled events table
+    """
+    # The list page holds hundreds of past events; in targeted mode only the
+    # scheduled table is handed to the parser instead of the whole page
+    fragment = find_scheduled_table_html(html) if WIKI_PARSE_MODE == 'targeted' else None
+    rows: List[Tuple[str, str, Optional[str]]] = parser_backend.parse_wiki_table(fragment if fragment is not None else html)
+    return rows
+
+def find_scheduled_table_html(html: str) -> Optional[str]:
+    """
+    Return the raw HTML of the first top-level wikitable whose headers include "Event" and "Date",
+    scanning table tags without building a tree and stopping as soon as that table is closed.
+    Returns None when no such table is found.
+    """
+    depth = 0
+    start: Optional[int] = None
+    for tag in TABLE_TAG_RE.finditer(html):
+        if tag.group(1) != '/':
+            if depth == 0:
+                start = tag.start() if 'wikitable' in tag.group(0) else None
+            depth += 1
+            continue
+        if depth == 0:
+            continue
+        depth -= 1
+        if depth == 0 and start is not None:
+            fragment = html[start:tag.end()]
+            # Same header text as BeautifulSoup's get_text(strip=True)
+            headers = [''.join(unescape(piece).strip() for piece in TAG_RE.split(th)) for th in TH_RE.findall(fragment)]
+            if "Event" in headers and "Date" in headers:
+                return fragment
+            start = None
+    return None
+
+def resolve_fight_night_number(wiki_href: str, date_text: str) -> Optional[str]:
+    """
+    Return the Fight Night number for a Wikipedia event link.
+    Numbers never change once assigned, so resolved ones are kept in the persistent
+    store (keyed by link and by date) and the article is only fetched for unseen events.
+    """
+    number: Optional[str] = number_store.get(f"link:{wiki_href}") or number_store.get(f"date:{date_text}")
+    if number:
+        return number
+
+    number = get_fight_night_number_from_wiki_url(f"{WIKIPEDIA_BASE_URL}{wiki_href}")
+    if number:
+        number_store.set(f"link:{wiki_href}", number)
+        number_store.set(f"date:{date_text}", number)
+    return number
 
 def get_fight_night_number_from_wiki_url(url: str) -> Optional[str]:
     """
@@ -242,24 +379,17 @@ def get_fight_night_number_from_wiki_url(url: str) -> Optional[str]:
     Returns the number string (e.g. "267") or None.
     """
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
+        response = fetch(url)
         if response.status_code != 200:
             return None
             
-        soup = BeautifulSoup(response.text, 'html.parser')
-        text = soup.get_text()
-        
-        # Look for pattern "UFC Fight Night <number>"
-        # We need to be careful not to match future/past events mentioned in the chronology if they are not THIS event.
-        # But usually the page title or intro paragraph mentions the event name.
-        # Infobox "series" or "chronology" is tricky.
-        
-        # Let's look for explicitly "UFC Fight Night <number>" appearing in the first 2000 chars (intro)
-        intro_text = text[:5000]
-        match = re.search(r'UFC Fight Night\s+(\d+)', intro_text)
-        if match:
-            return match.group(1)
-            
-        return None
+        return parse_wiki_intro_number(response.text)
     except:
         return None
+
+def parse_wiki_intro_number(html: str) -> Optional[str]:
+    """
+    Look for "UFC Fight Night <number>" in the intro of a Wikipedia event article
+    """
+    number: Optional[str] = parser_backend.parse_wiki_intro(html)
+    return number
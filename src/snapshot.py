@@ -0,0 +1,236 @@
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Cache key holding the current schedule snapshot (one entry shared by all workers)
+SNAPSHOT_KEY = 'ufc:events:snapshot'
+
+# A snapshot older than this is rebuilt in the background (defaults to 3/4 of CACHE_TIMEOUT)
+SNAPSHOT_REFRESH_AFTER = int(os.getenv('SNAPSHOT_REFRESH_AFTER', int(os.getenv('CACHE_TIMEOUT', 43200)) * 3 // 4))
+
+# How often the background refresher wakes up to check the snapshot age
+SNAPSHOT_CHECK_INTERVAL = int(os.getenv('SNAPSHOT_CHECK_INTERVAL', 60))
+
+# How long a request waits for the very first snapshot before giving up
+SNAPSHOT_WAIT_TIMEOUT = float(os.getenv('SNAPSHOT_WAIT_TIMEOUT', 20))
+
+# Lifetime of the rebuild lease; must exceed the slowest expected scrape
+SNAPSHOT_LEASE_TIMEOUT = int(os.getenv('SNAPSHOT_LEASE_TIMEOUT', 120))
+
+# Counters kept next to the snapshot, aggregated across all workers
+SNAPSHOT_COUNTERS = ('rebuilds', 'coalesced', 'failures')
+
+
+class SnapshotUnavailableError(Exception):
+    """
+    Raised when no snapshot has been built yet and none arrived in time (or building it failed)
+    """
+
+
+class SnapshotStore:
+    """
+    Stores the scraped schedule as a single versioned snapshot in the shared cache backend.
+    Writing the snapshot is a single SET, so readers always see either the old or the new one.
+    Rebuilds are single-flight across workers: a lease taken with SETNX lets one worker
+    scrape while the others wait for its result or keep the last good snapshot.
+    An optional renderer turns the events into pre-serialized responses stored with the snapshot.
+    A failed rebuild keeps the last good snapshot and marks it with `stale_since`/`last_error`.
+    An optional describer adds fields about how the events were built (e.g. fallbacks used by the scrape).
+    """
+
+    def __init__(self, cache: Any, builder: Callable[[], List[Dict[str, Any]]],
+                 key: str = SNAPSHOT_KEY, refresh_after: int = SNAPSHOT_REFRESH_AFTER,
+                 lease_timeout: int = SNAPSHOT_LEASE_TIMEOUT,
+                 renderer: Optional[Callable[[List[Dict[str, Any]]], Dict[str, Any]]] = None,
+                 describer: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.cache = cache
+        self.builder = builder
+        self.renderer = renderer
+        self.describer = describer
+        self.key = key
+        self.lease_key = f"{key}:lease"
+        self.refresh_after = refresh_after
+        self.lease_timeout = lease_timeout
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the current snapshot without ever scraping
+        """
+        snapshot: Optional[Dict[str, Any]] = self.cache.get(self.key)
+        return snapshot
+
+    def is_stale(self, snapshot: Optional[Dict[str, Any]]) -> bool:
+        """
+        True when the snapshot is missing or old enough to be rebuilt
+        """
+        if snapshot is None:
+            return True
+        age: float = time.time() - snapshot['built_at']
+        return age >= self.refresh_after
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Scrape a new schedule and swap it in.
+        The snapshot never expires on its own so the previous one keeps being served while this runs.
+        """
+        events = self.builder()
+        snapshot = {
+            'version': uuid.uuid4().hex,
+            'built_at': time.time(),
+            'events': events
+        }
+        if self.describer is not None:
+            # Called right after the builder, in the same worker, so it describes this build
+            snapshot.update(self.describer())
+        if self.renderer is not None:
+            snapshot['responses'] = self.renderer(events)
+        self.cache.set(self.key, snapshot, timeout=0)
+        return snapshot
+
+    def refresh_single_flight(self, wait_timeout: float = 0) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the snapshot unless another worker already holds the lease.
+        Callers that lose the race are counted as coalesced and, after waiting up to
+        wait_timeout for the rebuild to finish, get the latest snapshot (possibly the old one).
+        """
+        token = uuid.uuid4().hex
+        if self.cache.add(self.lease_key, token, timeout=self.lease_timeout):
+            try:
+                self.incr('rebuilds')
+                return self.refresh()
+            except Exception as e:
+                self.incr('failures')
+                self.mark_failed(e)
+                raise
+            finally:
+                # Only release our own lease; an expired one may already belong to someone else
+                if self.cache.get(self.lease_key) == token:
+                    self.cache.delete(self.lease_key)
+
+        self.incr('coalesced')
+        deadline = time.monotonic() + wait_timeout
+        while self.cache.get(self.lease_key) is not None and time.monotonic() < deadline:
+            time.sleep(0.1)
+        return self.read()
+
+    def mark_failed(self, error: Exception) -> None:
+        """
+        Flag the snapshot being served as stale after a failed rebuild.
+        `stale_since` keeps the first failure; the next successful rebuild replaces the whole snapshot.
+        """
+        snapshot = self.read()
+        if snapshot is None:
+            return
+        now = time.time()
+        marked = dict(snapshot, failed_at=now, last_error=str(error))
+        marked.setdefault('stale_since', now)
+        self.cache.set(self.key, marked, timeout=0)
+
+    def incr(self, counter: str) -> None:
+        self.cache.inc(f"{self.key}:stats:{counter}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the rebuild/coalesce counters shared by all workers
+        """
+        values = self.cache.get_many(*[f"{self.key}:stats:{name}" for name in SNAPSHOT_COUNTERS])
+        return {name: int(value or 0) for name, value in zip(SNAPSHOT_COUNTERS, values)}
+
+    def wait_for_snapshot(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Poll until some worker has published a snapshot or the timeout runs out
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self.read()
+            if snapshot is not None or time.monotonic() >= deadline:
+                return snapshot
+            time.sleep(0.1)
+
+
+class BackgroundRefresher(threading.Thread):
+    """
+    Daemon thread that rebuilds the snapshot before it goes stale.
+    Other periodic jobs (`tasks`) run after each check; they decide themselves whether they are due.
+    """
+
+    def __init__(self, store: SnapshotStore, check_interval: int = SNAPSHOT_CHECK_INTERVAL,
+                 tasks: Sequence[Callable[[], Any]] = ()):
+        super().__init__(name='snapshot-refresher', daemon=True)
+        self.store = store
+        self.check_interval = check_interval
+        self.tasks = list(tasks)
+        self._wake = threading.Event()
+
+    def request_refresh(self) -> None:
+        """
+        Wake the refresher up immediately (used when a request finds no snapshot)
+        """
+        self._wake.set()
+
+    def refresh_if_stale(self) -> None:
+        snapshot = self.store.read()
+        if not self.store.is_stale(snapshot):
+            return
+        try:
+            # Another worker may already be rebuilding; then this one simply skips
+            self.store.refresh_single_flight()
+        except Exception as e:
+            print(f"Error refreshing snapshot: {e}")
+
+    def run_tasks(self) -> None:
+        for task in self.tasks:
+            try:
+                task()
+            except Exception as e:
+                print(f"Error running background task: {e}")
+
+    def run(self) -> None:
+        while True:
+            self.refresh_if_stale()
+            self.run_tasks()
+            # Jitter the wake-up so workers don't all check at the same instant
+            self._wake.wait(self.check_interval * random.uniform(0.8, 1.2))
+            self._wake.clear()
+
+
+def get_current_snapshot(store: SnapshotStore, refresher: Optional[BackgroundRefresher],
+                         wait_timeout: float = SNAPSHOT_WAIT_TIMEOUT) -> Dict[str, Any]:
+    """
+    Return the snapshot for a request, serving a stale one while a refresh is running.
+    Only when nothing has ever been built does the request wait for the refresher;
+    without a refresher (tests, background refresh disabled) one caller builds it inline
+    and concurrent callers wait on its lease. A stale snapshot is then also rebuilt inline,
+    while everyone else (and the caller, if the rebuild fails) keeps getting the old one.
+    """
+    snapshot = store.read()
+    if snapshot is not None:
+        if not store.is_stale(snapshot):
+            return snapshot
+        if refresher is not None:
+            refresher.request_refresh()
+            return snapshot
+        try:
+            return store.refresh_single_flight() or snapshot
+        except Exception as e:
+            print(f"Error refreshing snapshot: {e}")
+            # Marked stale by the failed rebuild
+            return store.read() or snapshot
+
+    if refresher is None:
+        try:
+            snapshot = store.refresh_single_flight(wait_timeout)
+        except Exception as e:
+            print(f"Error building snapshot: {e}")
+            raise SnapshotUnavailableError("Event data is temporarily unavailable, please retry shortly") from e
+    else:
+        store.incr('coalesced')
+        refresher.request_refresh()
+        snapshot = store.wait_for_snapshot(wait_timeout)
+
+    if snapshot is None:
+        raise SnapshotUnavailableError("Event data is still being loaded, please retry shortly")
+    return snapshot
@@ -0,0 +1,180 @@
+import os
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Entries kept in each worker's in-process cache; 0 disables it
+LOCAL_CACHE_MAX_ENTRIES = int(os.getenv('LOCAL_CACHE_MAX_ENTRIES', 256))
+
+# Longest an in-process entry is served without going back to Redis; only matters if an invalidation is lost
+LOCAL_CACHE_TTL = int(os.getenv('LOCAL_CACHE_TTL', 300))
+
+# Pub/sub channel on which writes announce the keys other workers must drop
+LOCAL_CACHE_CHANNEL = 'ufc:cache:invalidate'
+
+
+class TieredCache:
+    """
+    Cache backend wrapper with an in-process LRU (L1) in front of the shared backend (L2).
+    Only keys accepted by `local` are kept in L1, as live objects, so a hit costs no network
+    round-trip and no unpickling; leases and counters always go to the backend.
+    Every write through the wrapper publishes the key on a Redis channel and each worker's
+    listener drops its copy. L1 is only trusted while that listener is subscribed
+    (or when there is no Redis client, i.e. a single-process backend).
+    Anything else (add of other keys, inc, get_many, ...) is passed straight to the backend.
+    """
+
+    def __init__(self, backend: Any, local: Callable[[str], bool], client: Any = None,
+                 max_entries: int = LOCAL_CACHE_MAX_ENTRIES, ttl: int = LOCAL_CACHE_TTL,
+                 channel: str = LOCAL_CACHE_CHANNEL):
+        self.backend = backend
+        self.local = local
+        self.client = client
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.channel = channel
+        self.sender = uuid.uuid4().hex
+        self.subscribed = False
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        # Bumped on every invalidation; a backend read that raced one is not kept
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._listener_pid: Optional[int] = None
+        self._stats = {'l1_hits': 0, 'l2_hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.backend, name)
+
+    def _l1_enabled(self, key: str) -> bool:
+        return self.max_entries > 0 and (self.client is None or self.subscribed) and self.local(key)
+
+    def get(self, key: str) -> Any:
+        if not self._l1_enabled(key):
+            return self.backend.get(key)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats['l1_hits'] += 1
+                return cached[1]
+            generation = self._generation
+
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['l2_hits'] += 1
+            if generation == self._generation:
+                self._store(key, value, self.ttl)
+        return value
+
+    def _store(self, key: str, value: Any, ttl: float) -> None:
+        # Callers hold the lock
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> Any:
+        result = self.backend.set(key, value, timeout=timeout)
+        if self.max_entries > 0 and self.local(key):
+            self.invalidate(key)
+            self.publish(key)
+            with self._lock:
+                self._store(key, value, min(self.ttl, timeout) if timeout else self.ttl)
+        return result
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> Any:
+        added = self.backend.add(key, value, timeout=timeout)
+        if added and self.max_entries > 0 and self.local(key):
+            self.invalidate(key)
+            self.publish(key)
+        return added
+
+    def delete(self, key: str) -> Any:
+        result = self.backend.delete(key)
+        if self.max_entries > 0 and self.local(key):
+            self.invalidate(key)
+            self.publish(key)
+        return result
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop one key from L1, or everything when key is None
+        """
+        with self._lock:
+            self._generation += 1
+            self._stats['invalidations'] += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def publish(self, key: str) -> None:
+        if self.client is None:
+            return
+        try:
+            self.client.publish(self.channel, f"{self.sender} {key}")
+        except Exception as e:
+            print(f"Error publishing cache invalidation for {key}: {e}")
+
+    def handle_message(self, data: Any) -> None:
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        sender, _, key = str(data).partition(' ')
+        # Our own writes already updated L1
+        if sender != self.sender:
+            self.invalidate(key)
+
+    def listen(self) -> None:
+        """
+        Apply invalidations published by other workers; reconnects after errors, dropping all
+        of L1 each time since messages sent while disconnected are lost
+        """
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self.invalidate()
+                self.subscribed = True
+                for message in pubsub.listen():
+                    if message.get('type') == 'message':
+                        self.handle_message(message['data'])
+            except Exception as e:
+                print(f"Cache invalidation listener error: {e}")
+            self.subscribed = False
+            self.invalidate()
+            time.sleep(1)
+
+    def start_listener(self) -> None:
+        """
+        Start the invalidation listener of this process (again after a fork, where threads are lost)
+        """
+        if self.client is None or self.max_entries <= 0:
+            return
+        with self._lock:
+            if self._listener is not None and self._listener_pid == os.getpid():
+                return
+            self.subscribed = False
+            self._entries.clear()
+            self._listener = threading.Thread(target=self.listen, name='cache-invalidation', daemon=True)
+            self._listener_pid = os.getpid()
+            self._listener.start()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        L1/L2 hit counts and rates of this process, over the lookups of L1-eligible keys
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['l1_hits'] + stats['l2_hits'] + stats['misses']
+        stats['l1_hit_rate'] = round(stats['l1_hits'] / lookups, 4) if lookups else 0.0
+        stats['l2_hit_rate'] = round(stats['l2_hits'] / lookups, 4) if lookups else 0.0
+        stats['subscribed'] = self.subscribed
+        return stats
@@ -0,0 +1,66 @@
+import sys
+import os
+import random
+import time
+from datetime import date, timedelta
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+
+from event_index import EventIndex
+from event_query import filter_events
+
+CITIES = ['Las Vegas, Nevada, USA', 'Abu Dhabi, United Arab Emirates', 'London, England, UK',
+          'Sydney, New South Wales, Australia', 'Paris, France', 'Houston, Texas, USA',
+          'Mexico City, Mexico', 'Sao Paulo, Brazil', 'Newark, New Jersey, USA', 'Perth, Western Australia']
+
+QUERIES = [
+    ('UFC', None, None, None), (None, 'vegas', None, None), (None, 'brazil', None, None),
+    ('UFC Fight Night', 'usa', None, None), (None, 'fighter 4217', None, None), (None, 'zz', None, None),
+    (None, 'no such event', None, None), (None, None, date(2026, 1, 1), date(2026, 3, 31)),
+    (None, None, date(2020, 1, 1), None), ('UFC', 'vegas', date(2010, 1, 1), date(2010, 12, 31)),
+]
+
+def build_events(count, seed=1):
+    """
+    Synthetic schedule of `count` events with realistic names, types and locations
+    """
+    rng = random.Random(seed)
+    events = []
+    for i in range(count):
+        numbered = rng.random() < 0.4
+        events.append({
+            'event_name': f"UFC {i}: Fighter {i} vs. Fighter {i + 1}" if numbered else f"UFC Fight Night: Fighter {i} vs. Fighter {i + 1}",
+            'event_date': (date(2000, 1, 1) + timedelta(days=rng.randrange(10000))).strftime('%B %d, %Y') if rng.random() < 0.95 else 'Date TBA',
+            'event_type': 'UFC' if numbered else 'UFC Fight Night',
+            'location': rng.choice(CITIES),
+        })
+    return events
+
+def best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmark(count=10000, repeat=20):
+    """
+    Compare the linear filter with the index for a set of type/search queries
+    """
+    events = build_events(count)
+    start = time.perf_counter()
+    index = EventIndex(events)
+    print(f"{count} events, index built in {(time.perf_counter() - start) * 1000:.1f}ms")
+    print(f"{'type':<18}{'search':<16}{'from':<12}{'to':<12}{'matches':>8}{'linear':>12}{'index':>12}")
+    for query in QUERIES:
+        assert index.filter(*query) == filter_events(events, *query)
+        linear = best_time(lambda: filter_events(events, *query), repeat)
+        indexed = best_time(lambda: index.filter(*query), repeat)
+        matches = len(index.filter(*query))
+        event_type, search, date_from, date_to = (str(value) for value in query)
+        print(f"{event_type:<18}{search:<16}{date_from:<12}{date_to:<12}{matches:>8}{linear * 1000:>10.2f}ms{indexed * 1000:>10.2f}ms")
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
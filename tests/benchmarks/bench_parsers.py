@@ -0,0 +1,43 @@
+import sys
+import os
+import time
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+
+from scrapers.parsers import available_backends, get_parser
+from bench_wiki_parse import build_wiki_list_page
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+def best_time(func, html, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmark(repeat=20):
+    """
+    Time every extractor on every available backend and print a per-backend report
+    """
+    cases = [
+        ('events table', 'parse_events_table', read_fixture('ufcstats_upcoming.html')),
+        ('detail date', 'parse_event_date', read_fixture('ufcstats_event_detail.html')),
+        ('wiki table', 'parse_wiki_table', read_fixture('wikipedia_list_of_ufc_events.html')),
+        ('wiki table (700 past)', 'parse_wiki_table', build_wiki_list_page(700)),
+        ('wiki intro', 'parse_wiki_intro', read_fixture('wikipedia_event_article.html')),
+    ]
+    backends = available_backends()
+    print(f"{'extractor':<24}" + "".join(f"{name:>14}" for name in backends))
+    for label, method, html in cases:
+        timings = [best_time(getattr(get_parser(name), method), html, repeat) for name in backends]
+        print(f"{label:<24}" + "".join(f"{seconds * 1000:>12.2f}ms" for seconds in timings))
+
+if __name__ == "__main__":
+    run_benchmark()
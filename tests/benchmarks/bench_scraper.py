@@ -0,0 +1,195 @@
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import tempfile
+import statistics
+from contextlib import contextmanager
+
+import requests
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+
+from scrapers import ufc_scraper
+from scrapers.http_cache import ParseCache
+from scrapers.parsers import get_parser
+from scrapers.store import FileStore
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+# Recorded page served for each upstream URL prefix
+REPLAY = [
+    ('http://ufcstats.com/statistics/events/upcoming', 'ufcstats_upcoming.html'),
+    ('http://ufcstats.com/event-details/', 'ufcstats_event_detail.html'),
+    ('https://en.wikipedia.org/wiki/List_of_UFC_events', 'wikipedia_list_of_ufc_events.html'),
+    ('https://en.wikipedia.org/wiki/', 'wikipedia_event_article.html'),
+]
+
+# Stage timings within this many milliseconds of the baseline are never called regressions
+NOISE_FLOOR_MS = 0.05
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+def make_fetch(latency=0.0):
+    """
+    fetch() stand-in that answers every known URL with its recorded page,
+    optionally after a simulated network latency (to judge concurrency changes)
+    """
+    pages = {prefix: read_fixture(name) for prefix, name in REPLAY}
+
+    def replay_fetch(url, headers=None):
+        if latency:
+            time.sleep(latency)
+        response = requests.Response()
+        response.url = url
+        response.encoding = 'utf-8'
+        for prefix, _ in REPLAY:
+            if url.startswith(prefix):
+                response.status_code = 200
+                response._content = pages[prefix]
+                return response
+        response.status_code = 404
+        response._content = b''
+        return response
+
+    return replay_fetch
+
+@contextmanager
+def replayed_scraper(directory, parser=None, latency=0.0):
+    """
+    Point the scraper at the recorded pages, with empty stores and parse cache
+    """
+    names = ('fetch', 'number_store', 'event_store', 'mapping_store', 'parse_cache', 'parser_backend')
+    saved = {name: getattr(ufc_scraper, name) for name in names}
+    ufc_scraper.fetch = make_fetch(latency)
+    ufc_scraper.parser_backend = get_parser(parser) if parser else saved['parser_backend']
+    reset_state(directory)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(ufc_scraper, name, value)
+
+def reset_state(directory):
+    """
+    Fresh stores and parse cache, as on a worker's first scrape
+    """
+    suffix = time.perf_counter_ns()
+    ufc_scraper.number_store = FileStore(os.path.join(directory, f"numbers-{suffix}.json"))
+    ufc_scraper.event_store = FileStore(os.path.join(directory, f"events-{suffix}.json"))
+    ufc_scraper.mapping_store = FileStore(os.path.join(directory, f"wiki-mapping-{suffix}.json"))
+    ufc_scraper.parse_cache = ParseCache()
+
+def measure(func, repeat, setup=None):
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {'best_ms': round(min(timings) * 1000, 4), 'median_ms': round(statistics.median(timings) * 1000, 4)}
+
+def run_benchmark(repeat=20, parser=None, latency=0.0):
+    """
+    Time each scraper stage against the recorded pages; returns the results document
+    """
+    upcoming = read_fixture('ufcstats_upcoming.html').decode('utf-8')
+    detail = read_fixture('ufcstats_event_detail.html').decode('utf-8')
+    wiki_list = read_fixture('wikipedia_list_of_ufc_events.html').decode('utf-8')
+    wiki_article = read_fixture('wikipedia_event_article.html').decode('utf-8')
+
+    with tempfile.TemporaryDirectory() as directory, replayed_scraper(directory, parser, latency):
+        reset = lambda: reset_state(directory)
+        stages = {
+            'list_parse': measure(lambda: ufc_scraper.parse_upcoming_events_table(upcoming), repeat),
+            'detail_parse': measure(lambda: ufc_scraper.parse_event_date(detail), repeat),
+            'detail_card_parse': measure(lambda: ufc_scraper.parse_event_details(detail), repeat),
+            'wiki_table_parse': measure(lambda: ufc_scraper.parse_wiki_scheduled_events(wiki_list), repeat),
+            'wiki_intro_parse': measure(lambda: ufc_scraper.parse_wiki_intro_number(wiki_article), repeat),
+            # Wikipedia mapping with every Fight Night number still unknown (articles fetched and parsed)
+            'number_resolution': measure(ufc_scraper.get_event_mapping_from_wikipedia, repeat, setup=reset),
+            'end_to_end_cold': measure(ufc_scraper.get_upcoming_ufc_schedule, repeat, setup=reset),
+            # Stores and parse cache filled by the previous run, as on every scheduled refresh
+            'end_to_end_warm': measure(ufc_scraper.get_upcoming_ufc_schedule, repeat),
+        }
+        backend = ufc_scraper.parser_backend.name
+
+    return {
+        'python': platform.python_version(),
+        'parser': backend,
+        'repeat': repeat,
+        'latency_ms': latency * 1000,
+        'stages': stages,
+    }
+
+def compare(results, baseline, threshold):
+    """
+    Stages whose median got slower than the baseline by more than `threshold` (0.25 = 25%)
+    """
+    regressions = []
+    for stage, timing in results['stages'].items():
+        before = baseline.get('stages', {}).get(stage)
+        if before is None:
+            continue
+        limit = before['median_ms'] * (1 + threshold)
+        if timing['median_ms'] > limit and timing['median_ms'] - before['median_ms'] > NOISE_FLOOR_MS:
+            regressions.append(stage)
+    return regressions
+
+def print_report(results, baseline=None):
+    print(f"parser={results['parser']} python={results['python']} repeat={results['repeat']} "
+          f"latency={results['latency_ms']:g}ms")
+    print(f"{'stage':<20}{'best':>12}{'median':>12}" + (f"{'baseline':>12}{'change':>9}" if baseline else ''))
+    for stage, timing in results['stages'].items():
+        line = f"{stage:<20}{timing['best_ms']:>10.3f}ms{timing['median_ms']:>10.3f}ms"
+        before = (baseline or {}).get('stages', {}).get(stage)
+        if before:
+            change = (timing['median_ms'] / before['median_ms'] - 1) * 100 if before['median_ms'] else 0.0
+            line += f"{before['median_ms']:>10.3f}ms{change:>+8.1f}%"
+        print(line)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Offline scraper benchmark over the recorded HTML fixtures')
+    parser.add_argument('--repeat', type=int, default=20, help='runs per stage (best and median are reported)')
+    parser.add_argument('--parser', help='parser backend (html.parser or lxml); defaults to SCRAPER_PARSER')
+    parser.add_argument('--latency-ms', type=float, default=0, help='simulated latency of every upstream request')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='results JSON of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='fail when a stage median is this much slower than the baseline (0.25 = 25%%)')
+    args = parser.parse_args(argv)
+
+    # The scraper logs every run; keep the report readable
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            results = run_benchmark(args.repeat, args.parser, args.latency_ms / 1000)
+        finally:
+            sys.stdout = stdout
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"REGRESSION: {', '.join(regressions)} more than {args.threshold:.0%} slower than the baseline")
+            return 1
+        print(f"OK: no stage more than {args.threshold:.0%} slower than the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
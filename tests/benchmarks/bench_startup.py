@@ -0,0 +1,49 @@
+import sys
+import os
+import json
+import subprocess
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Runs inside a fresh interpreter so nothing is already imported
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'module': '{module}',
+    'import_seconds': elapsed,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules_loaded': len(sys.modules),
+    'pandas_loaded': 'pandas' in sys.modules,
+}}))
+"""
+
+def measure(module, repeat=5):
+    """
+    Import a module in fresh interpreters and keep the fastest run
+    """
+    env = dict(os.environ, PYTHONPATH=SRC, SCRAPER_STORE_DIR=os.path.join(SRC, '..', 'data'))
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', PROBE.format(module=module)], cwd=SRC, env=env,
+                                capture_output=True, text=True, check=True)
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return min(runs, key=lambda run: run['import_seconds'])
+
+def run_benchmark(output=None):
+    """
+    Report worker start-up cost: import time, peak RSS and whether pandas was pulled in
+    """
+    results = [measure(module) for module in ('scrapers.dates', 'scrapers.ufc_scraper', 'api')]
+    print(f"{'module':<22}{'import':>12}{'max rss':>14}{'modules':>10}{'pandas':>8}")
+    for run in results:
+        print(f"{run['module']:<22}{run['import_seconds'] * 1000:>10.1f}ms{run['max_rss_kb'] / 1024:>11.1f}MiB"
+              f"{run['modules_loaded']:>10}{str(run['pandas_loaded']):>8}")
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else None)
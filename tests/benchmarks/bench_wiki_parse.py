@@ -0,0 +1,74 @@
+import sys
+import os
+import time
+import tracemalloc
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+
+from scrapers import ufc_scraper
+
+def build_wiki_list_page(past_events=700, scheduled_events=12):
+    """
+    Build a List_of_UFC_events-like page: a small scheduled table followed by a large past events table
+    """
+    scheduled_rows = "".join(
+        f'<tr><td><a href="/wiki/UFC_Fight_Night_{270 + i}">UFC Fight Night: Fighter {i} vs. Fighter {i + 1}</a></td>'
+        f'<td>March {i + 1}, 2026<sup class="reference"><a href="#cite-{i}">[{i}]</a></sup></td>'
+        f'<td>UFC Apex</td><td>Las Vegas, Nevada, U.S.</td><td></td></tr>'
+        for i in range(scheduled_events)
+    )
+    past_rows = "".join(
+        f'<tr><td>{past_events - i}</td><td><a href="/wiki/UFC_{past_events - i}">UFC {past_events - i}: Main Event {i}</a></td>'
+        f'<td><span data-sort-value="{i}">Jan {i % 28 + 1}, {2025 - i // 40}</span></td>'
+        f'<td><a href="/wiki/Arena_{i}">Arena {i}</a></td><td><a href="/wiki/City_{i}">City {i}</a>, Country</td>'
+        f'<td><a href="/wiki/Attendance">{10000 + i}</a></td><td><sup class="reference"><a href="#p-{i}">[{i}]</a></sup></td></tr>'
+        for i in range(past_events)
+    )
+    prose = "<p>" + "The Ultimate Fighting Championship is a mixed martial arts promotion. " * 40 + "</p>"
+    return (
+        "<html><head><title>List of UFC events</title></head><body>"
+        + prose * 5
+        + '<h2 id="Scheduled_events">Scheduled events</h2><table class="wikitable sortable">'
+        + "<tr><th>Event</th><th>Date</th><th>Venue</th><th>Location</th><th>Ref.</th></tr>"
+        + scheduled_rows + "</table>"
+        + '<h2 id="Past_events">Past events</h2><table class="wikitable sortable">'
+        + "<tr><th>#</th><th>Event</th><th>Date</th><th>Venue</th><th>Location</th><th>Attendance</th><th>Ref.</th></tr>"
+        + past_rows + "</table>"
+        + prose * 20
+        + "</body></html>"
+    )
+
+def measure(mode, html, repeat=5):
+    """
+    Return (best parse time in seconds, peak traced memory in bytes, parsed rows) for a parse mode
+    """
+    ufc_scraper.WIKI_PARSE_MODE = mode
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = ufc_scraper.parse_wiki_scheduled_events(html)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    ufc_scraper.parse_wiki_scheduled_events(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, rows
+
+def run_benchmark(past_events=700):
+    html = build_wiki_list_page(past_events)
+    print(f"Wikipedia list page: {len(html) / 1024:.0f} KiB, {past_events} past events")
+    print(f"{'mode':<10} {'parse time':>12} {'peak memory':>14}")
+    results = {}
+    for mode in ('full', 'targeted'):
+        seconds, peak, rows = measure(mode, html)
+        results[mode] = (seconds, peak, rows)
+        print(f"{mode:<10} {seconds * 1000:>10.1f}ms {peak / 1024 / 1024:>12.1f}MB")
+
+    assert results['full'][2] == results['targeted'][2], "Parse modes returned different rows"
+    print(f"Speed-up: {results['full'][0] / results['targeted'][0]:.1f}x, "
+          f"memory: {results['full'][1] / results['targeted'][1]:.1f}x less")
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 700)
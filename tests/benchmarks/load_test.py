@@ -0,0 +1,219 @@
+import sys
+import os
+import json
+import time
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+
+import redis
+import requests
+
+from upstream_sim import UpstreamSimulator
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Requests each client cycles through; a mix of pre-rendered and filtered responses
+DEFAULT_PATHS = ['/api/events', '/api/events/full', '/api/events?type=UFC', '/api/events/full?search=vegas']
+
+# Cache keys removed before the cold phase so the first requests find nothing: everything the API
+# stored through Flask-Caching (snapshot, its lease and counters, fight cards), which prefixes its keys
+RESET_PATTERNS = ('flask_cache_ufc:*',)
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def run_clients(base_url, paths, clients, duration):
+    """
+    Drive the API with `clients` concurrent sessions for `duration` seconds;
+    returns the latency (seconds) and status of every request
+    """
+    results = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(offset):
+        session = requests.Session()
+        local = []
+        i = offset
+        while time.monotonic() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                status = session.get(base_url + path, timeout=60).status_code
+            except requests.RequestException:
+                status = 0
+            local.append((time.perf_counter() - started, status))
+        with lock:
+            results.extend(local)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def run_phase(name, base_url, paths, clients, duration, upstreams):
+    before = {host: sim.stats() for host, sim in upstreams.items()}
+    started = time.monotonic()
+    results = run_clients(base_url, paths, clients, duration)
+    elapsed = time.monotonic() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    upstream = {}
+    for host, sim in upstreams.items():
+        after = sim.stats()
+        upstream[host] = {key: after[key] - before[host][key] for key in after}
+    upstream_requests = sum(counts['requests'] for counts in upstream.values())
+    return {
+        'phase': name,
+        'requests': len(results),
+        'errors': sum(1 for _, status in results if status != 200),
+        'throughput_rps': round(len(results) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        'upstream': upstream,
+        # Upstream requests per API request; 0 once every response comes from the snapshot
+        'amplification': round(upstream_requests / len(results), 4) if results else 0.0,
+    }
+
+
+def reset_cache(client):
+    for pattern in RESET_PATTERNS:
+        keys = list(client.scan_iter(pattern))
+        if keys:
+            client.delete(*keys)
+
+
+def start_api(args, upstreams, directory):
+    env = dict(
+        os.environ,
+        UFCSTATS_BASE_URL=upstreams['ufcstats'].url,
+        WIKIPEDIA_BASE_URL=upstreams['wikipedia'].url,
+        REDIS_HOST=args.redis_host,
+        REDIS_PORT=str(args.redis_port),
+        RATELIMIT_DEFAULT='100000000 per hour',
+        SNAPSHOT_BACKGROUND_REFRESH='True',
+        SNAPSHOT_REFRESH_AFTER=str(args.refresh_after),
+        SNAPSHOT_CHECK_INTERVAL='1',
+        SCRAPER_STORE_BACKEND='file',
+        SCRAPER_STORE_DIR=directory,
+        HTTP_CACHE_DIR=os.path.join(directory, 'http_cache'),
+        ARCHIVE_DB_PATH=os.path.join(directory, 'archive.sqlite3'),
+        FLASK_DEBUG='False',
+    )
+    command = ['gunicorn', '--chdir', SRC, 'api:app', '--bind', f"127.0.0.1:{args.port}",
+               '--workers', str(args.workers), '--threads', str(args.threads), '--timeout', '60']
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    # Wait for the port rather than a request: the first request starts the snapshot refresher,
+    # and the scrape it triggers belongs to the cold phase
+    base_url = f"http://127.0.0.1:{args.port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', args.port), timeout=1).close()
+            return process, base_url
+        except OSError:
+            pass
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError('The API did not start; check gunicorn and that Redis is reachable')
+
+
+def print_report(results):
+    print(f"{'phase':<8}{'requests':>10}{'errors':>8}{'req/s':>9}{'p50':>10}{'p95':>10}{'p99':>10}"
+          f"{'upstream':>10}{'ampl.':>8}")
+    for phase in results['phases']:
+        upstream = sum(counts['requests'] for counts in phase['upstream'].values())
+        print(f"{phase['phase']:<8}{phase['requests']:>10}{phase['errors']:>8}{phase['throughput_rps']:>9.1f}"
+              f"{phase['p50_ms']:>8.1f}ms{phase['p95_ms']:>8.1f}ms{phase['p99_ms']:>8.1f}ms"
+              f"{upstream:>10}{phase['amplification']:>8.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Load test gunicorn + Redis against a simulated ufcstats.com/Wikipedia. '
+                    'Use a throwaway Redis: the cold phase deletes the cached snapshot and fight cards (flask_cache_ufc:*).')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=2)
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--redis-host', default=os.getenv('REDIS_HOST', 'localhost'))
+    parser.add_argument('--redis-port', type=int, default=int(os.getenv('REDIS_PORT', 6379)))
+    parser.add_argument('--clients', type=int, default=16, help='concurrent API clients')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per phase')
+    parser.add_argument('--refresh-after', type=int, default=30,
+                        help='snapshot age (s) that triggers a rebuild; the expiry phase starts after it')
+    parser.add_argument('--path', action='append', dest='paths', help='API path to request (repeatable)')
+    for host in ('ufcstats', 'wiki'):
+        parser.add_argument(f"--{host}-latency-ms", type=float, default=100)
+        parser.add_argument(f"--{host}-jitter-ms", type=float, default=50)
+        parser.add_argument(f"--{host}-error-rate", type=float, default=0, help='fraction answered with 503')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    upstreams = {
+        'ufcstats': UpstreamSimulator(latency=args.ufcstats_latency_ms / 1000, jitter=args.ufcstats_jitter_ms / 1000,
+                                      error_rate=args.ufcstats_error_rate).start(),
+        'wikipedia': UpstreamSimulator(latency=args.wiki_latency_ms / 1000, jitter=args.wiki_jitter_ms / 1000,
+                                       error_rate=args.wiki_error_rate).start(),
+    }
+    paths = args.paths or DEFAULT_PATHS
+
+    with tempfile.TemporaryDirectory() as directory:
+        process, base_url = start_api(args, upstreams, directory)
+        try:
+            # After start-up and before the first request, so nothing can repopulate it in between
+            reset_cache(redis.Redis(host=args.redis_host, port=args.redis_port))
+            cold_started = time.monotonic()
+            phases = [
+                run_phase('cold', base_url, paths, args.clients, args.duration, upstreams),
+                run_phase('warm', base_url, paths, args.clients, args.duration, upstreams),
+            ]
+            # Let the snapshot built during the cold phase go stale
+            time.sleep(max(0.0, cold_started + args.refresh_after + 1 - time.monotonic()))
+            phases.append(run_phase('expiry', base_url, paths, args.clients, args.duration, upstreams))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+            for sim in upstreams.values():
+                sim.stop()
+
+    results = {
+        'workers': args.workers,
+        'threads': args.threads,
+        'clients': args.clients,
+        'duration': args.duration,
+        'paths': paths,
+        'upstream': {host: {'latency_ms': getattr(args, f"{key}_latency_ms"),
+                            'jitter_ms': getattr(args, f"{key}_jitter_ms"),
+                            'error_rate': getattr(args, f"{key}_error_rate")}
+                     for host, key in (('ufcstats', 'ufcstats'), ('wikipedia', 'wiki'))},
+        'phases': phases,
+    }
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
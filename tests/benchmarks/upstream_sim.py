@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+# Recorded page served for each path prefix, first match wins
+ROUTES = [
+    ('/statistics/events/upcoming', 'ufcstats_upcoming.html'),
+    ('/statistics/events/completed', 'ufcstats_completed.html'),
+    ('/event-details/', 'ufcstats_event_detail.html'),
+    ('/wiki/List_of_UFC_events', 'wikipedia_list_of_ufc_events.html'),
+    ('/wiki/', 'wikipedia_event_article.html'),
+]
+
+# Absolute links in the recorded pages, rewritten to point back at the stand-in server
+RECORDED_ORIGINS = (b'http://ufcstats.com', b'https://en.wikipedia.org')
+
+
+class UpstreamSimulator:
+    """
+    Local stand-in for ufcstats.com and Wikipedia serving the recorded fixture pages,
+    with injected latency (+/- jitter) and a rate of 503 responses. Counts requests per route
+    so a load test can report how many upstream requests the API made.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.counts = {'requests': 0, 'errors': 0, 'bytes': 0}
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        self.pages = {}
+        for prefix, name in ROUTES:
+            with open(os.path.join(FIXTURES, name), 'rb') as f:
+                body = f.read()
+            for origin in RECORDED_ORIGINS:
+                body = body.replace(origin, self.url.encode())
+            self.pages[prefix] = body
+        self._thread = None
+
+    def _handler(self):
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                simulator.respond(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def respond(self, handler: BaseHTTPRequestHandler) -> None:
+        delay = max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+        if delay:
+            time.sleep(delay)
+
+        body = next((page for prefix, page in self.pages.items() if handler.path.startswith(prefix)), None)
+        failed = random.random() < self.error_rate
+        status = 503 if failed else (200 if body is not None else 404)
+        body = body if status == 200 else b''
+        with self._lock:
+            self.counts['requests'] += 1
+            self.counts['errors'] += failed
+            self.counts['bytes'] += len(body)
+
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'text/html; charset=utf-8')
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts)
+
+    def start(self) -> 'UpstreamSimulator':
+        self._thread = threading.Thread(target=self.server.serve_forever, name='upstream-sim', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the recorded UFCStats/Wikipedia pages locally')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0, help='fraction of requests answered with 503')
+    args = parser.parse_args(argv)
+
+    simulator = UpstreamSimulator(port=args.port, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                                  error_rate=args.error_rate)
+    print(f"Serving fixtures on {simulator.url} (set UFCSTATS_BASE_URL and WIKIPEDIA_BASE_URL to it)")
+    try:
+        simulator.server.serve_forever()
+    except KeyboardInterrupt:
+        simulator.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
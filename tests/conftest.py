@@ -0,0 +1,20 @@
+import pytest
+import sys
+import os
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from scrapers.store import FileStore
+from scrapers.http_cache import http_cache
+
+@pytest.fixture(autouse=True)
+def isolated_scraper_stores(mocker, tmp_path):
+    """Keep persistent scraper state of each test in its own temporary directory"""
+    mocker.patch('scrapers.ufc_scraper.number_store', FileStore(str(tmp_path / 'fight_night_numbers.json')))
+    mocker.patch('scrapers.ufc_scraper.event_store', FileStore(str(tmp_path / 'ufcstats_events.json')))
+    mocker.patch('scrapers.ufc_scraper.mapping_store', FileStore(str(tmp_path / 'wiki_mapping.json')))
+    # Upstream failures simulated by one test must not open a circuit for the next
+    mocker.patch('scrapers.http_client._breakers', {})
+    mocker.patch.dict('scrapers.ufc_scraper.wiki_mapping_state')
+    mocker.patch.object(http_cache, 'directory', str(tmp_path / 'http_cache'))
@@ -47,3 +47,14 @@ def test_get_events_full(client):
     if data['count'] > 0:
         event = data['events'][0]
         assert 'location' in event
+
+def test_past_events_ndjson_rejects_invalid_cursor(client):
+    """An unknown cursor is a 400 before anything is streamed, as in the JSON response"""
+    response = client.get('/api/events/past?format=ndjson&after=bogus')
+    assert response.status_code == 400
+    assert response.get_json()['status'] == 'error'
+
+def test_event_route_only_matches_event_ids(client):
+    """Other segments under /api/events/ are not looked up as events"""
+    assert client.get('/api/events/batch').status_code == 405
+    assert client.get('/api/events/not-an-id').status_code == 404
@@ -0,0 +1,159 @@
+import sys
+import os
+import time
+import pytest
+from datetime import date
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from archive import ArchiveStore, sync_archive, sync_if_due
+from event_query import InvalidQueryError
+
+TODAY = date(2026, 2, 1)
+
+def make_event(i, event_date, event_type='UFC', location='Las Vegas, Nevada, USA'):
+    return {
+        'event_id': f'id{i:04d}',
+        'event_name': f'UFC {i}: Fighter {i} vs. Fighter {i + 1}' if event_type == 'UFC' else f'UFC Fight Night: Fighter {i} vs. Fighter {i + 1}',
+        'event_date': event_date,
+        'event_type': event_type,
+        'event_number': str(i) if event_type == 'UFC' else None,
+        'location': location
+    }
+
+# Three pages of the completed list, newest first; the first row is the next upcoming event
+PAGES = [
+    [make_event(330, 'February 07, 2026'), make_event(329, 'January 24, 2026'),
+     make_event(328, 'December 13, 2025', 'UFC Fight Night', 'London, England, UK')],
+    [make_event(327, 'December 06, 2025'), make_event(326, 'November 22, 2025', 'UFC Fight Night', 'Doha, Qatar'),
+     make_event(325, 'November 15, 2025', location='New York City, New York, USA')],
+    [make_event(324, 'November 08, 2025')],
+]
+
+def fake_pages(pages):
+    calls = []
+    def fetch_page(page):
+        calls.append(page)
+        return pages[page - 1] if page <= len(pages) else []
+    return fetch_page, calls
+
+@pytest.fixture
+def store(tmp_path):
+    return ArchiveStore(str(tmp_path / 'archive.sqlite3'))
+
+def test_backfill_walks_every_page_and_skips_upcoming(store):
+    fetch_page, calls = fake_pages(PAGES)
+    stats = sync_archive(store, backfill=True, fetch_page=fetch_page, today=TODAY)
+
+    assert calls == [1, 2, 3, 4]
+    assert stats == {'pages': 3, 'new': 6, 'stored': 6}
+    total, events = store.query()
+    assert total == 6
+    assert events[0]['event_id'] == 'id0329'
+    assert 'id0330' not in [e['event_id'] for e in events]
+
+def test_incremental_sync_stops_at_known_events(store):
+    sync_archive(store, backfill=True, fetch_page=fake_pages(PAGES)[0], today=TODAY)
+
+    newer = [[make_event(331, 'January 31, 2026')] + PAGES[0]] + PAGES[1:]
+    fetch_page, calls = fake_pages(newer)
+    stats = sync_archive(store, fetch_page=fetch_page, today=TODAY)
+    assert stats['new'] == 1
+    assert calls == [1, 2]
+    assert store.stats()['events'] == 7
+
+    # The event that was upcoming during the first sync is archived once it has happened
+    fetch_page, calls = fake_pages(PAGES)
+    assert sync_archive(store, fetch_page=fetch_page, today=date(2026, 2, 8))['new'] == 1
+    assert store.query(event_number='330')[0] == 1
+
+def test_query_filters_and_pagination(store):
+    sync_archive(store, backfill=True, fetch_page=fake_pages(PAGES)[0], today=TODAY)
+
+    assert store.query(event_type='ufc fight night')[0] == 2
+    assert [e['event_id'] for e in store.query(search='LONDON')[1]] == ['id0328']
+    assert [e['event_id'] for e in store.query(date_from=date(2025, 11, 15), date_to=date(2025, 12, 6))[1]] == ['id0327', 'id0326', 'id0325']
+    assert store.query(event_type='UFC', search='vegas', date_to=date(2025, 12, 31))[0] == 2
+
+    total, first_page = store.query(limit=4)
+    _, second_page = store.query(limit=4, offset=4)
+    assert total == 6
+    assert len(first_page) == 4
+    assert [e['event_id'] for e in second_page] == ['id0325', 'id0324']
+
+def test_search_is_a_literal_substring(store):
+    """Wildcards in the search text are not interpreted"""
+    sync_archive(store, backfill=True, fetch_page=fake_pages(PAGES)[0], today=TODAY)
+    assert store.query(search='%')[0] == 0
+    assert store.query(search='_')[0] == 0
+
+def test_iter_events_streams_every_match(store):
+    """Exports read straight from the cursor, with no page size unless one is given"""
+    sync_archive(store, backfill=True, fetch_page=fake_pages(PAGES)[0], today=TODAY)
+
+    events = store.iter_events(event_type='UFC')
+    assert next(events)['event_id'] == 'id0329'
+    assert [e['event_id'] for e in events] == ['id0327', 'id0325', 'id0324']
+    assert [e['event_id'] for e in store.iter_events(2, 2)] == ['id0327', 'id0326']
+
+def test_after_cursor_pages_through_matches(store):
+    """Keyset pages follow (date descending, id) order and the total ignores the cursor"""
+    sync_archive(store, backfill=True, fetch_page=fake_pages(PAGES)[0], today=TODAY)
+
+    total, first = store.query(2, event_type='UFC')
+    total_after, second = store.query(2, event_type='UFC', after=first[-1]['event_id'])
+    assert total == total_after == 4
+    assert [e['event_id'] for e in first + second] == ['id0329', 'id0327', 'id0325', 'id0324']
+    with pytest.raises(InvalidQueryError):
+        store.query(after='unknown')
+
+def test_iter_events_rejects_invalid_cursor_before_streaming(store):
+    """The cursor is validated when the iterator is created, not on its first row"""
+    with pytest.raises(InvalidQueryError):
+        store.iter_events(after='unknown')
+
+def test_scheduled_sync_runs_once_per_interval(store, tmp_path):
+    """The first due sync fills an empty archive; other workers and later checks skip until the interval passes"""
+    fetch_page, calls = fake_pages(PAGES)
+    stats = sync_if_due(store, interval=3600, fetch_page=fetch_page)
+    assert stats['pages'] == 3
+    assert store.stats()['events'] == 7
+
+    other_worker = ArchiveStore(str(tmp_path / 'archive.sqlite3'))
+    assert sync_if_due(other_worker, interval=3600, fetch_page=fetch_page) is None
+    assert sync_if_due(store, interval=0, fetch_page=fetch_page) is None
+    assert len(calls) == 4
+
+def test_failed_scheduled_sync_is_retried(store):
+    def failing_page(page):
+        raise Exception("ufcstats.com is down")
+
+    with pytest.raises(Exception):
+        sync_if_due(store, interval=3600, fetch_page=failing_page)
+    assert sync_if_due(store, interval=3600, fetch_page=fake_pages(PAGES)[0])['new'] == 7
+
+def test_backfill_interrupted_halfway_is_completed_on_retry(store):
+    """The newest pages already stored must not stop the retry at page 1"""
+    def failing_on_page_2(page):
+        if page == 2:
+            raise Exception("ufcstats.com is down")
+        return PAGES[page - 1]
+
+    with pytest.raises(Exception):
+        sync_if_due(store, interval=3600, fetch_page=failing_on_page_2)
+    assert store.stats()['events'] == 3
+
+    stats = sync_if_due(store, interval=3600, fetch_page=fake_pages(PAGES)[0])
+    assert (stats['pages'], stats['new']) == (3, 4)
+
+    # Later runs (a day on) are incremental again
+    store.set_meta('last_sync', '0')
+    store.set_meta('sync_started', '0')
+    assert sync_if_due(store, interval=3600, fetch_page=fake_pages(PAGES)[0])['pages'] == 1
+
+def test_claim_of_a_dead_sync_expires_after_the_lease(store):
+    assert store.claim_sync(3600, lease=60)
+    assert not store.claim_sync(3600, lease=60)
+    store.set_meta('sync_started', str(time.time() - 61))
+    assert store.claim_sync(3600, lease=60)
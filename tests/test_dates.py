@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import os
+from datetime import date
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from scrapers.dates import display_variants, parse_date, to_iso, ufcstats_display
+
+def test_parse_wikipedia_and_ufcstats_formats():
+    assert parse_date("February 07, 2026") == date(2026, 2, 7)
+    assert parse_date("Feb 7, 2026") == date(2026, 2, 7)
+    assert parse_date("Sept. 13 2025") == date(2025, 9, 13)
+    assert parse_date("7 February 2026") == date(2026, 2, 7)
+    assert parse_date("  March  14,   2026 ") == date(2026, 3, 14)
+    assert parse_date("2026-03-14") == date(2026, 3, 14)
+
+def test_unparseable_dates():
+    assert parse_date("Date TBA") is None
+    assert parse_date("Febtober 7, 2026") is None
+    assert parse_date("February 30, 2026") is None
+    assert to_iso("TBD") is None
+
+def test_canonical_and_display_forms():
+    assert to_iso("Feb 7, 2026") == "2026-02-07"
+    assert ufcstats_display(date(2026, 2, 7)) == "February 07, 2026"
+    assert display_variants(date(2026, 2, 7)) == ("February 07, 2026", "February 7, 2026")
+
+def test_scraper_does_not_import_pandas():
+    """Worker start-up must not pay for pandas"""
+    code = "import sys; import scrapers.ufc_scraper; print('pandas' in sys.modules)"
+    src = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+    result = subprocess.run([sys.executable, '-c', code], cwd=src, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,73 @@
+import random
+import sys
+import os
+import pytest
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from datetime import date
+from event_index import EventIndex, index_for
+from event_query import InvalidQueryError, filter_events
+
+EVENTS = [
+    {'event_id': 'e0', 'event_date': 'February 21, 2026', 'event_name': 'UFC 325: Volkanovski vs. Lopes', 'event_type': 'UFC', 'location': 'Sydney, New South Wales, Australia'},
+    {'event_id': 'e1', 'event_date': 'February 07, 2026', 'event_name': 'UFC Fight Night: Bautista vs. Oliveira', 'event_type': 'UFC Fight Night', 'location': 'Las Vegas, Nevada, USA'},
+    {'event_id': 'e2', 'event_date': 'Date TBA', 'event_name': 'UFC Fight Night: Strickland vs. Hernandez', 'event_type': 'UFC Fight Night', 'location': 'Houston, Texas, USA'},
+    {'event_id': 'e3', 'event_date': 'March 07, 2026', 'event_name': 'UFC 326: Ankalaev vs. Pereira', 'event_type': 'UFC', 'location': 'Las Vegas, Nevada, USA'},
+    {'event_id': 'e4', 'event_date': 'March 07, 2026', 'event_name': 'Noche UFC: Moreno vs. Royval', 'event_type': 'UFC', 'location': 'Mexico City, Mexico'},
+]
+
+@pytest.mark.parametrize('event_type, search', [
+    (None, None), ('UFC', None), ('ufc fight night', None), ('Bellator', None),
+    (None, 'vegas'), (None, 'VS.'), (None, 'a'), (None, 'ca'), (None, 'xyz'),
+    (None, 'nevada, usa'), ('UFC', 'las vegas'), ('UFC Fight Night', 'mexico'),
+    # Trigrams "ega" and "veg" both occur, but never as one substring
+    (None, 'vegas, texas'),
+])
+def test_index_matches_linear_filter(event_type, search):
+    assert EventIndex(EVENTS).filter(event_type, search) == filter_events(EVENTS, event_type, search)
+
+@pytest.mark.parametrize('date_from, date_to', [
+    (date(2026, 2, 7), None), (None, date(2026, 2, 21)), (date(2026, 2, 8), date(2026, 3, 7)),
+    (date(2026, 3, 7), date(2026, 3, 7)), (date(2026, 4, 1), None), (date(2026, 3, 1), date(2026, 2, 1)),
+])
+def test_date_range_matches_linear_filter(date_from, date_to):
+    index = EventIndex(EVENTS)
+    assert index.filter(date_from=date_from, date_to=date_to) == filter_events(EVENTS, date_from=date_from, date_to=date_to)
+    assert index.filter('UFC', 'vegas', date_from, date_to) == filter_events(EVENTS, 'UFC', 'vegas', date_from, date_to)
+
+def test_tba_events_never_match_a_date_range():
+    """Events without a date are only returned when no range is requested"""
+    index = EventIndex(EVENTS)
+    assert 'Houston, Texas, USA' not in [e['location'] for e in index.filter(date_from=date(2000, 1, 1))]
+    assert 'Houston, Texas, USA' in [e['location'] for e in index.filter(search='houston')]
+
+def test_random_queries_match_linear_filter():
+    """Substrings of the indexed text (and some noise) give the same results as a scan"""
+    rng = random.Random(7)
+    index = EventIndex(EVENTS)
+    texts = [e['event_name'] for e in EVENTS] + [e['location'] for e in EVENTS]
+    for _ in range(300):
+        text = rng.choice(texts)
+        start = rng.randrange(len(text))
+        search = text[start:start + rng.randint(1, 8)]
+        if rng.random() < 0.2:
+            search += 'q'
+        assert index.filter(None, search.upper()) == filter_events(EVENTS, None, search.upper())
+
+def test_index_is_rebuilt_per_snapshot_version():
+    first = index_for({'version': 'a', 'events': EVENTS})
+    assert index_for({'version': 'a', 'events': EVENTS}) is first
+    second = index_for({'version': 'b', 'events': EVENTS[:1]})
+    assert second is not first
+    assert second.filter(search='vegas') == []
+
+def test_after_cursor_continues_the_filtered_listing():
+    """Pages fetched with the cursor concatenate to the unpaginated result"""
+    index = EventIndex(EVENTS)
+    assert index.filter(after='e1') == EVENTS[2:]
+    assert index.filter('UFC', after='e0') == [EVENTS[3], EVENTS[4]]
+    assert index.filter(search='vegas', after='e3') == []
+    with pytest.raises(InvalidQueryError):
+        index.filter(after='gone')
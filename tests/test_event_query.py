@@ -0,0 +1,100 @@
+import sys
+import os
+import pytest
+from datetime import date
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from event_query import (ALL_FIELDS, BASIC_FIELDS, BATCH_MAX_QUERIES, InvalidQueryError, parse_batch, parse_fields_param,
+                         filter_events, parse_date_param, parse_int_param, parse_query, project_events)
+
+EVENTS = [
+    {'event_name': 'UFC 325: Volkanovski vs. Lopes', 'event_date': 'February 21, 2026', 'event_type': 'UFC',
+     'event_number': '325', 'location': 'Sydney, New South Wales, Australia'},
+    {'event_name': 'UFC Fight Night: Bautista vs. Oliveira', 'event_date': 'February 07, 2026', 'event_type': 'UFC Fight Night',
+     'event_number': '268', 'location': 'Las Vegas, Nevada, USA'},
+    {'event_name': 'UFC 326: Vegas Card', 'event_date': 'March 07, 2026', 'event_type': 'UFC',
+     'event_number': '326', 'location': 'Las Vegas, Nevada, USA'},
+]
+
+def test_filter_by_type_is_exact_and_case_insensitive():
+    """type matches the whole event type regardless of case"""
+    assert [e['event_number'] for e in filter_events(EVENTS, event_type='ufc')] == ['325', '326']
+    assert [e['event_number'] for e in filter_events(EVENTS, event_type='UFC Fight Night')] == ['268']
+    assert filter_events(EVENTS, event_type='Fight') == []
+
+def test_search_matches_name_or_location():
+    """search is a case-insensitive substring match on name or location"""
+    assert [e['event_number'] for e in filter_events(EVENTS, search='VEGAS')] == ['268', '326']
+    assert [e['event_number'] for e in filter_events(EVENTS, search='lopes')] == ['325']
+    assert [e['event_number'] for e in filter_events(EVENTS, event_type='UFC', search='vegas')] == ['326']
+
+def test_no_filters_returns_everything():
+    assert filter_events(EVENTS) == EVENTS
+
+def test_project_basic_fields():
+    """The basic projection drops location; no fields keeps the full event"""
+    projected = project_events(EVENTS, BASIC_FIELDS)
+    assert all(set(e) == set(BASIC_FIELDS) for e in projected)
+    assert project_events(EVENTS, None) == EVENTS
+
+def test_date_range_is_inclusive():
+    """from/to bound the parsed event date on both ends"""
+    in_february = filter_events(EVENTS, date_from=date(2026, 2, 7), date_to=date(2026, 2, 21))
+    assert [e['event_number'] for e in in_february] == ['325', '268']
+    assert [e['event_number'] for e in filter_events(EVENTS, date_from=date(2026, 3, 1))] == ['326']
+
+def test_query_params_are_validated():
+    assert parse_date_param('from', '2026-02-07') == date(2026, 2, 7)
+    assert parse_date_param('to', None) is None
+    assert parse_int_param('limit', '5') == 5
+    with pytest.raises(InvalidQueryError):
+        parse_date_param('from', 'next week')
+    for value in ('0', '-1', 'ten'):
+        with pytest.raises(InvalidQueryError):
+            parse_int_param('limit', value)
+
+def test_fields_are_normalized_and_validated():
+    """Any order or spacing of the same fields gives the same projection"""
+    assert parse_fields_param(None, BASIC_FIELDS) == BASIC_FIELDS
+    assert parse_fields_param('event_date, event_name', ALL_FIELDS) == ('event_name', 'event_date')
+    assert parse_fields_param('location,event_id,location', BASIC_FIELDS) == ('event_id', 'location')
+    for value in ('venue', ',', 'event_name,fighters'):
+        with pytest.raises(InvalidQueryError):
+            parse_fields_param(value, BASIC_FIELDS)
+
+def test_parse_query():
+    query = parse_query({'type': 'UFC', 'from': '2026-02-01', 'limit': '5', 'fields': 'location,event_name'}, BASIC_FIELDS)
+    assert query == {'fields': ('event_name', 'location'), 'event_type': 'UFC', 'search': None,
+                     'date_from': date(2026, 2, 1), 'date_to': None, 'limit': 5, 'after': None}
+    assert parse_query({}, ALL_FIELDS)['fields'] == ALL_FIELDS
+
+def test_parse_batch_normalizes_values_to_query_strings():
+    queries = parse_batch({'queries': [
+        {'id': 'numbered', 'type': 'UFC', 'limit': 5, 'fields': ['event_name', 'event_date']},
+        {'id': 'vegas', 'search': 'Vegas', 'full': True, 'after': None},
+    ]})
+    assert queries == [
+        ('numbered', {'type': 'UFC', 'limit': '5', 'fields': 'event_name,event_date'}),
+        ('vegas', {'search': 'Vegas', 'full': 'true'}),
+    ]
+    # Values are then validated exactly like GET parameters
+    assert parse_query(queries[0][1], BASIC_FIELDS)['limit'] == 5
+
+@pytest.mark.parametrize('body', [
+    None,
+    [{'id': 'a'}],
+    {'queries': []},
+    {'queries': [{'type': 'UFC'}]},
+    {'queries': [{'id': 'a'}, {'id': 'a'}]},
+    {'queries': [{'id': 'a', 'limt': 5}]},
+    {'queries': [{'id': str(i)} for i in range(BATCH_MAX_QUERIES + 1)]},
+    # Non-scalar values would otherwise be stringified into filters that silently match nothing
+    {'queries': [{'id': 'a', 'type': {'x': 1}}]},
+    {'queries': [{'id': 'a', 'search': [1]}]},
+    {'queries': [{'id': 'a', 'fields': ['event_name', {'x': 1}]}]},
+])
+def test_parse_batch_rejects_malformed_bodies(body):
+    with pytest.raises(InvalidQueryError):
+        parse_batch(body)
@@ -0,0 +1,109 @@
+import sys
+import os
+import pytest
+import requests
+from cachelib import SimpleCache
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from fight_cards import EventNotFoundError, FightCardStore
+from scrapers.http_cache import http_cache
+
+EVENT_ID = '6f8cd4ba7b6b6c2e'
+EVENT_URL = f"http://ufcstats.com/event-details/{EVENT_ID}"
+
+def read_fixture(name):
+    with open(os.path.join(os.path.dirname(__file__), 'fixtures', name), 'rb') as f:
+        return f.read()
+
+def test_card_reuses_the_page_downloaded_by_the_schedule_scrape(mocker):
+    """A detail page already in the page cache is parsed without another upstream request"""
+    http_cache.put(EVENT_URL, read_fixture('ufcstats_event_detail.html'), etag=None, last_modified=None, encoding='utf-8')
+    mock_fetch = mocker.patch('scrapers.ufc_scraper.fetch')
+
+    card = FightCardStore(SimpleCache()).get(EVENT_ID)
+
+    mock_fetch.assert_not_called()
+    assert card['event_id'] == EVENT_ID
+    assert card['event_name'] == 'UFC 325: Volkanovski vs. Lopes 2'
+    assert card['event_type'] == 'UFC'
+    assert card['event_number'] == '325'
+    assert card['location'] == 'Sydney, New South Wales, Australia'
+    assert [bout['fighters'] for bout in card['fights']][0] == ['Alexander Volkanovski', 'Diego Lopes']
+    assert card['fights'][0]['title_bout'] is True
+
+def test_card_is_fetched_lazily_and_cached_per_event(mocker):
+    mock_response = mocker.Mock()
+    mock_response.text = read_fixture('ufcstats_event_detail.html').decode('utf-8')
+    mock_fetch = mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+    cache = SimpleCache()
+    set_spy = mocker.spy(cache, 'set')
+    store = FightCardStore(cache, ttl=600)
+
+    first = store.get(EVENT_ID)
+    second = store.get(EVENT_ID)
+
+    mock_fetch.assert_called_once_with(EVENT_URL)
+    assert first == second
+    set_spy.assert_called_once_with(f"ufc:card:{EVENT_ID}", first, timeout=600)
+
+def test_stale_page_cache_entry_is_fetched_again(mocker):
+    http_cache.put(EVENT_URL, read_fixture('ufcstats_event_detail.html'), etag=None, last_modified=None, encoding='utf-8')
+    mocker.patch('scrapers.ufc_scraper.time.time', return_value=10 ** 12)
+    mock_response = mocker.Mock()
+    mock_response.text = read_fixture('ufcstats_completed_event_detail.html').decode('utf-8')
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+
+    card = FightCardStore(SimpleCache()).get(EVENT_ID)
+    assert card['fights'][0]['result'] == 'win'
+    assert card['fights'][0]['method'] == 'KO/TKO'
+
+def test_unknown_events(mocker):
+    store = FightCardStore(SimpleCache())
+    with pytest.raises(EventNotFoundError):
+        store.get('../../etc/passwd')
+
+    not_found = requests.Response()
+    not_found.status_code = 404
+    mock_fetch = mocker.patch('scrapers.ufc_scraper.fetch', return_value=not_found)
+    with pytest.raises(EventNotFoundError):
+        store.get('0123456789abcdef')
+
+    # Remembered, so the same id doesn't reach UFCStats again
+    with pytest.raises(EventNotFoundError):
+        store.get('0123456789abcdef')
+    assert mock_fetch.call_count == 1
+
+def test_card_reuses_pages_as_old_as_the_schedule_scrape_allows(mocker):
+    """The page cache is trusted for as long as the scrape itself reuses a page, not just the card TTL"""
+    http_cache.put(EVENT_URL, read_fixture('ufcstats_event_detail.html'), etag=None, last_modified=None, encoding='utf-8')
+    import time
+    mocker.patch('scrapers.ufc_scraper.time.time', return_value=time.time() + 7200)
+    mock_fetch = mocker.patch('scrapers.ufc_scraper.fetch')
+
+    card = FightCardStore(SimpleCache(), ttl=3600, page_max_age=86400).get(EVENT_ID)
+
+    mock_fetch.assert_not_called()
+    assert card['event_name'] == 'UFC 325: Volkanovski vs. Lopes 2'
+
+def test_page_revalidated_with_304_counts_as_fresh(mocker):
+    """A 304 during the schedule scrape renews the page, so the card doesn't fetch it again"""
+    import time
+    from scrapers import http_client
+    page = read_fixture('ufcstats_event_detail.html')
+    http_cache.put(EVENT_URL, page, etag='"abc"', last_modified=None, encoding='utf-8')
+    later = time.time() + 2 * 86400
+    mocker.patch('scrapers.http_cache.time.time', return_value=later)
+    mocker.patch('scrapers.ufc_scraper.time.time', return_value=later)
+    not_modified = requests.Response()
+    not_modified.status_code = 304
+    mocker.patch.object(http_client.get_session(), 'get', return_value=not_modified)
+
+    http_client.fetch(EVENT_URL)
+    assert http_cache.get(EVENT_URL)['stored_at'] == later
+
+    mock_fetch = mocker.patch('scrapers.ufc_scraper.fetch')
+    card = FightCardStore(SimpleCache(), page_max_age=86400).get(EVENT_ID)
+    mock_fetch.assert_not_called()
+    assert card['event_name'] == 'UFC 325: Volkanovski vs. Lopes 2'
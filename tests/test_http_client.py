@@ -0,0 +1,187 @@
+import pytest
+import sys
+import os
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from scrapers import http_client
+
+def test_session_is_shared_and_configured():
+    """The session is reused, pooled, retried and identifies itself"""
+    session = http_client.get_session()
+    assert http_client.get_session() is session
+    assert session.headers['User-Agent'] == http_client.USER_AGENT
+
+    adapter = session.get_adapter('https://en.wikipedia.org/wiki/List_of_UFC_events')
+    assert adapter.max_retries.total == http_client.MAX_RETRIES
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter._pool_maxsize == http_client.POOL_MAXSIZE
+
+def test_fetch_applies_timeouts(mocker):
+    """Every fetch carries both a connect and a read timeout"""
+    session = http_client.get_session()
+    mock_get = mocker.patch.object(session, 'get')
+
+    http_client.fetch("http://ufcstats.com/statistics/events/upcoming")
+
+    _, kwargs = mock_get.call_args
+    assert kwargs['timeout'] == (http_client.CONNECT_TIMEOUT, http_client.READ_TIMEOUT)
+
+def test_new_session_after_fork(mocker):
+    """A forked worker gets its own session instead of inheriting the parent's sockets"""
+    session = http_client.get_session()
+    mocker.patch('os.getpid', return_value=-1)
+    assert http_client.get_session() is not session
+
+def make_response(mocker, status_code, body=b'', headers=None):
+    import requests
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    return response
+
+def test_fetch_revalidates_with_stored_validators(mocker):
+    """A cached page is revalidated and a 304 is answered with the stored body"""
+    session = http_client.get_session()
+    page = b'<html>Scheduled events</html>'
+    mock_get = mocker.patch.object(session, 'get', side_effect=[
+        make_response(mocker, 200, page, {'ETag': '"abc"', 'Last-Modified': 'Sat, 07 Feb 2026 10:00:00 GMT'}),
+        make_response(mocker, 304, b'', {'ETag': '"abc"'}),
+    ])
+    stats = http_client.http_cache.stats()
+
+    first = http_client.fetch("https://en.wikipedia.org/wiki/List_of_UFC_events")
+    second = http_client.fetch("https://en.wikipedia.org/wiki/List_of_UFC_events")
+
+    assert first.text == second.text == page.decode()
+    assert second.status_code == 200
+    assert mock_get.call_args_list[0].kwargs['headers'] == {}
+    assert mock_get.call_args_list[1].kwargs['headers'] == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Sat, 07 Feb 2026 10:00:00 GMT'
+    }
+    new_stats = http_client.http_cache.stats()
+    assert new_stats['hits'] == stats['hits'] + 1
+    assert new_stats['misses'] == stats['misses'] + 1
+
+def test_fetch_survives_an_unwritable_cache_dir(mocker, tmp_path):
+    """Failing to cache a page is logged and the fetched response still returned"""
+    blocker = tmp_path / 'not-a-directory'
+    blocker.write_text('')
+    mocker.patch.object(http_client.http_cache, 'directory', str(blocker / 'http_cache'))
+    session = http_client.get_session()
+    mocker.patch.object(session, 'get', return_value=make_response(mocker, 200, b'<html></html>', {'ETag': '"abc"'}))
+
+    response = http_client.fetch("http://ufcstats.com/statistics/events/upcoming")
+
+    assert response.text == '<html></html>'
+    assert http_client.http_cache.get("http://ufcstats.com/statistics/events/upcoming") is None
+
+def test_http_cache_evicts_least_recently_used(tmp_path):
+    """The cache directory stays under its byte budget"""
+    import os
+    import time
+    from scrapers.http_cache import HttpCache
+    cache = HttpCache(str(tmp_path), max_bytes=2500)
+
+    cache.put("http://ufcstats.com/a", b'a' * 1000, etag='"a"', last_modified=None, encoding='utf-8')
+    cache.put("http://ufcstats.com/b", b'b' * 1000, etag='"b"', last_modified=None, encoding='utf-8')
+    # Make "a" the most recently used entry
+    os.utime(cache._path("http://ufcstats.com/b"), (time.time() - 60, time.time() - 60))
+    cache.put("http://ufcstats.com/c", b'c' * 1000, etag='"c"', last_modified=None, encoding='utf-8')
+
+    assert cache.get("http://ufcstats.com/b") is None
+    assert cache.get("http://ufcstats.com/a")['body'] == b'a' * 1000
+    assert cache.get("http://ufcstats.com/c")['etag'] == '"c"'
+    assert cache.stats()['evictions'] == 1
+
+def test_parse_cache_skips_reparsing_unchanged_pages(mocker):
+    """The same page text is only parsed once"""
+    from scrapers.http_cache import ParseCache
+    cache = ParseCache(max_entries=2)
+    parser = mocker.Mock(side_effect=lambda text: len(text))
+    parser.__qualname__ = 'parser'
+
+    assert cache.parse("http://ufcstats.com/a", "page", parser) == 4
+    assert cache.parse("http://ufcstats.com/a", "page", parser) == 4
+    assert cache.parse("http://ufcstats.com/a", "changed page", parser) == 12
+    assert parser.call_count == 2
+    assert cache.stats() == {'hits': 1, 'misses': 2}
+
+def test_fetch_reports_requests_to_observers(mocker):
+    """Observers see the host, status, body size and duration of every upstream request"""
+    import requests
+    session = http_client.get_session()
+    mocker.patch.object(session, 'get', side_effect=[
+        make_response(mocker, 200, b'<html></html>'),
+        requests.ConnectionError('refused'),
+    ])
+    observer = mocker.Mock()
+    mocker.patch.object(http_client, 'request_observers', [observer])
+
+    http_client.fetch("http://ufcstats.com/statistics/events/upcoming")
+    try:
+        http_client.fetch("https://en.wikipedia.org/wiki/List_of_UFC_events")
+    except requests.ConnectionError:
+        pass
+
+    (host, status, size, elapsed), _ = observer.call_args_list[0]
+    assert (host, status, size) == ('ufcstats.com', 200, 13)
+    assert elapsed >= 0
+    assert observer.call_args_list[1][0][:3] == ('en.wikipedia.org', 0, 0)
+
+def test_circuit_opens_after_consecutive_failures(mocker):
+    """After the threshold a host fails fast; other hosts are unaffected"""
+    import requests
+    mocker.patch('scrapers.http_client.CIRCUIT_FAILURE_THRESHOLD', 2)
+    session = http_client.get_session()
+    mock_get = mocker.patch.object(session, 'get', return_value=make_response(mocker, 503, b''))
+
+    http_client.fetch("https://en.wikipedia.org/wiki/List_of_UFC_events")
+    http_client.fetch("https://en.wikipedia.org/wiki/List_of_UFC_events")
+    with pytest.raises(http_client.CircuitOpenError) as raised:
+        http_client.fetch("https://en.wikipedia.org/wiki/List_of_UFC_events")
+
+    assert isinstance(raised.value, requests.ConnectionError)
+    assert raised.value.retry_after > 0
+    assert mock_get.call_count == 2
+    assert http_client.breaker_stats()['en.wikipedia.org'] == {'state': 'open', 'failures': 2}
+
+    mock_get.return_value = make_response(mocker, 404, b'')
+    http_client.fetch("http://ufcstats.com/event-details/missing")
+    assert http_client.breaker_stats()['ufcstats.com']['state'] == 'closed'
+
+def test_circuits_are_kept_per_port(mocker):
+    """Two upstreams on one address with different ports do not share a circuit"""
+    mocker.patch('scrapers.http_client.CIRCUIT_FAILURE_THRESHOLD', 1)
+    session = http_client.get_session()
+    mocker.patch.object(session, 'get', return_value=make_response(mocker, 503, b''))
+
+    http_client.fetch("http://127.0.0.1:8081/wiki/List_of_UFC_events")
+    http_client.fetch("http://127.0.0.1:8082/statistics/events/upcoming")
+
+    assert set(http_client.breaker_stats()) == {'127.0.0.1:8081', '127.0.0.1:8082'}
+
+def test_half_open_probe_closes_or_reopens_the_circuit(mocker):
+    """After the reset timeout one probe goes through; its outcome decides the circuit"""
+    clock = mocker.patch('scrapers.http_client.time.monotonic', return_value=100.0)
+    breaker = http_client.CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+    breaker.record(False)
+    assert not breaker.allow()
+
+    clock.return_value = 131.0
+    assert breaker.allow()
+    assert breaker.state == 'half_open'
+    assert not breaker.allow()
+    breaker.record(False)
+    assert breaker.state == 'open'
+
+    clock.return_value = 162.0
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.stats() == {'state': 'closed', 'failures': 0}
+    assert breaker.allow()
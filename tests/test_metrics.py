@@ -0,0 +1,98 @@
+import sys
+import os
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from metrics import Metrics
+
+class SharedHash:
+    """The HINCRBYFLOAT/HGETALL subset of a Redis client, shared by several workers"""
+
+    def __init__(self):
+        self.values = {}
+
+    def pipeline(self, transaction=False):
+        return self
+
+    def hincrbyfloat(self, key, field, amount):
+        self.values[field.encode()] = self.values.get(field.encode(), 0.0) + amount
+
+    def execute(self):
+        pass
+
+    def hgetall(self, key):
+        return {field: str(value).encode() for field, value in self.values.items()}
+
+def make_metrics(client=None):
+    metrics = Metrics(client, buckets=(0.1, 1.0))
+    metrics.counter('requests_total', 'Requests')
+    metrics.histogram('latency_seconds', 'Latency')
+    return metrics
+
+def test_counters_and_histograms_render_as_prometheus_text():
+    metrics = make_metrics()
+    metrics.inc('requests_total', {'endpoint': 'get_events', 'status': '200'})
+    metrics.inc('requests_total', {'endpoint': 'get_events', 'status': '200'})
+    metrics.observe('latency_seconds', 0.05, {'endpoint': 'get_events'})
+    metrics.observe('latency_seconds', 0.5, {'endpoint': 'get_events'})
+
+    text = metrics.render({'snapshot_age_seconds': ('gauge', 'Snapshot age', 12.5)})
+
+    assert '# TYPE requests_total counter' in text
+    assert 'requests_total{endpoint="get_events",status="200"} 2' in text
+    assert '# TYPE latency_seconds histogram' in text
+    lines = [line for line in text.splitlines() if line.startswith('latency_seconds')]
+    assert lines == [
+        'latency_seconds_bucket{endpoint="get_events",le="0.1"} 1',
+        'latency_seconds_bucket{endpoint="get_events",le="1.0"} 2',
+        'latency_seconds_bucket{endpoint="get_events",le="+Inf"} 2',
+        'latency_seconds_count{endpoint="get_events"} 2',
+        'latency_seconds_sum{endpoint="get_events"} 0.55',
+    ]
+    assert '# TYPE snapshot_age_seconds gauge\nsnapshot_age_seconds 12.5' in text
+
+def test_workers_are_summed_in_redis():
+    shared = SharedHash()
+    workers = [make_metrics(shared), make_metrics(shared)]
+    for worker in workers:
+        worker.inc('requests_total')
+        worker.observe('latency_seconds', 2.0)
+
+    # Nothing is sent until a worker flushes
+    assert shared.values == {}
+    workers[0].flush()
+    text = workers[1].render()
+
+    assert 'requests_total 2' in text
+    assert 'latency_seconds_bucket{le="1.0"} 0' not in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    # Flushing again only sends what is new
+    workers[0].flush()
+    assert shared.values[b'requests_total'] == 2
+
+def test_failed_flush_keeps_increments(mocker):
+    client = mocker.Mock()
+    client.pipeline.return_value.execute.side_effect = ConnectionError('down')
+    metrics = make_metrics(client)
+    metrics.inc('requests_total', value=3)
+
+    metrics.flush()
+    client.pipeline.return_value.execute.side_effect = None
+    metrics.flush()
+
+    client.pipeline.return_value.hincrbyfloat.assert_called_with('ufc:metrics', 'requests_total', 3)
+
+def test_collectors_fold_in_per_process_counters_as_deltas():
+    stats = {'hits': 5, 'misses': 1, 'hit_rate': 0.83}
+    metrics = make_metrics()
+    metrics.counter('cache_lookups_total', 'Cache lookups')
+    metrics.collector('cache_lookups_total', lambda: stats, {'cache': 'http'}, keys=('hits', 'misses'))
+
+    metrics.flush()
+    stats.update(hits=8)
+    text = metrics.render()
+
+    assert 'cache_lookups_total{cache="http",result="hits"} 8' in text
+    assert 'cache_lookups_total{cache="http",result="misses"} 1' in text
+    assert 'hit_rate' not in text
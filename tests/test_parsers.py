@@ -0,0 +1,94 @@
+import pytest
+import sys
+import os
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from scrapers.parsers import ParserBackend, SoupParser, available_backends, get_parser
+from scrapers.ufc_scraper import find_scheduled_table_html
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+BACKENDS = available_backends()
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return get_parser(request.param)
+
+def test_both_backends_are_available():
+    """lxml is a runtime dependency, so the equivalence suite must cover both backends"""
+    assert BACKENDS == ['html.parser', 'lxml']
+
+def test_incomplete_backend_fails_when_created():
+    """A backend missing an extractor is rejected up front, not on its first parse"""
+    class PartialParser(ParserBackend):
+        name = 'partial'
+
+        def parse_events_table(self, html):
+            return []
+
+    with pytest.raises(TypeError):
+        PartialParser()
+
+def test_parse_events_table(backend):
+    rows = backend.parse_events_table(read_fixture('ufcstats_upcoming.html'))
+    assert rows[0] == ("UFC Fight Night: Bautista vs. Oliveira", "http://ufcstats.com/event-details/8e6ad1ab0bd2a3b1", "Las Vegas, Nevada, USA")
+    assert len(rows) == 5
+    assert rows == SoupParser().parse_events_table(read_fixture('ufcstats_upcoming.html'))
+
+def test_parse_event_date(backend):
+    assert backend.parse_event_date(read_fixture('ufcstats_event_detail.html')) == "February 21, 2026"
+    assert backend.parse_event_date("<html><body>No date</body></html>") == "Date TBA"
+    assert backend.parse_event_date("") == "Date TBA"
+
+@pytest.mark.parametrize('targeted', [False, True])
+def test_parse_wiki_table(backend, targeted):
+    html = read_fixture('wikipedia_list_of_ufc_events.html')
+    if targeted:
+        html = find_scheduled_table_html(html)
+    rows = backend.parse_wiki_table(html)
+    assert rows[0] == ("UFC Fight Night: Bautista vs. Oliveira", "Feb 7, 2026", "/wiki/UFC_Fight_Night_267")
+    assert rows[2] == ("UFC Fight Night: Strickland vs. Hernandez", "Feb 28, 2026", "/wiki/UFC_Fight_Night:_Strickland_vs._Hernandez")
+    assert len(rows) == 5
+    assert rows == SoupParser().parse_wiki_table(html)
+
+def test_parse_wiki_intro(backend):
+    """Script text in the page head is ignored by every backend"""
+    assert backend.parse_wiki_intro(read_fixture('wikipedia_event_article.html')) == "269"
+    assert backend.parse_wiki_intro("<p>No number</p>") is None
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_parser('html5lib')
+
+def test_parse_completed_events(backend):
+    html = read_fixture('ufcstats_completed.html')
+    rows = backend.parse_completed_events(html)
+    assert rows[1] == ("UFC 324: Gaethje vs. Pimblett", "http://ufcstats.com/event-details/4f1c2a9be07d3e58",
+                       "January 24, 2026", "Las Vegas, Nevada, USA")
+    assert len(rows) == 7
+    assert rows == SoupParser().parse_completed_events(html)
+    assert backend.parse_completed_events("") == []
+
+def test_parse_event_details(backend):
+    details = backend.parse_event_details(read_fixture('ufcstats_event_detail.html'))
+    assert details['event_name'] == "UFC 325: Volkanovski vs. Lopes 2"
+    assert details['event_date'] == "February 21, 2026"
+    assert details['location'] == "Sydney, New South Wales, Australia"
+    assert [bout['weight_class'] for bout in details['fights']] == ["Featherweight", "Lightweight", "Light Heavyweight"]
+    assert details['fights'][1] == {
+        'fight_id': '2a3b4c5d6e7f8091', 'fighters': ['Dan Hooker', 'Benoit Saint Denis'],
+        'weight_class': 'Lightweight', 'title_bout': False,
+        'result': None, 'method': None, 'round': None, 'time': None
+    }
+
+def test_parse_completed_event_details(backend):
+    html = read_fixture('ufcstats_completed_event_detail.html')
+    bout = backend.parse_event_details(html)['fights'][0]
+    assert (bout['result'], bout['method'], bout['round'], bout['time']) == ('win', 'KO/TKO', '2', '3:14')
+    assert backend.parse_event_details(html) == SoupParser().parse_event_details(html)
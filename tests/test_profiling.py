@@ -0,0 +1,79 @@
+import sys
+import os
+import pytest
+from flask import Flask, g
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from profiling import RequestProfiler, phase, record_phase, server_timing_header
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+def test_server_timing_lists_phases_and_total(app):
+    with app.test_request_context('/api/events'):
+        record_phase('ratelimit', 0.0004)
+        with phase('filter'):
+            pass
+        record_phase('filter', 0.002)
+        header = server_timing_header(0.0123)
+
+    names = [part.split(';')[0] for part in header.split(', ')]
+    assert names == ['ratelimit', 'filter', 'total']
+    assert header.startswith('ratelimit;dur=0.40, filter;dur=2.')
+    assert header.endswith('total;dur=12.30')
+
+def test_disabled_profiler_does_nothing(app, tmp_path):
+    profiler = RequestProfiler(admin_token='', sample_rate=0, directory=str(tmp_path))
+    with app.test_request_context('/api/events', headers={'X-Profile-Token': 'anything'}):
+        profiler.start()
+        assert 'profile' not in g
+        assert profiler.stop(10.0) is None
+    assert os.listdir(tmp_path) == []
+
+def test_admin_token_profiles_the_request(app, tmp_path):
+    profiler = RequestProfiler(admin_token='secret', sample_rate=0, directory=str(tmp_path), slow_ms=10_000)
+    with app.test_request_context('/api/events', headers={'X-Profile-Token': 'wrong'}):
+        profiler.start()
+        assert 'profile' not in g
+
+    with app.test_request_context('/api/events', headers={'X-Profile-Token': 'secret'}):
+        profiler.start()
+        sum(range(1000))
+        name = profiler.stop(0.002)
+
+    assert name.endswith('ms.prof')
+    assert os.listdir(tmp_path) == [name]
+
+def test_sampled_profiles_are_kept_only_when_slow(app, tmp_path, mocker):
+    profiler = RequestProfiler(admin_token='', sample_rate=0.5, directory=str(tmp_path), slow_ms=100, max_files=2)
+    mocker.patch('profiling.random.random', return_value=0.1)
+
+    with app.test_request_context('/api/events'):
+        profiler.start()
+        assert profiler.stop(0.05) is None
+    for _ in range(3):
+        with app.test_request_context('/api/events'):
+            profiler.start()
+            assert profiler.stop(0.25) is not None
+
+    # Oldest profiles beyond max_files are pruned
+    assert len(os.listdir(tmp_path)) <= 2
+
+def test_one_profile_at_a_time(app, tmp_path):
+    profiler = RequestProfiler(admin_token='', sample_rate=1, directory=str(tmp_path))
+    with app.test_request_context('/api/events'):
+        profiler.start()
+        assert 'profile' in g
+        # A concurrent request (its own app context) is not profiled while this one is
+        with Flask('other').test_request_context('/api/events/full'):
+            profiler.start()
+            assert 'profile' not in g
+        profiler.stop(0.0)
+
+    with app.test_request_context('/api/events'):
+        profiler.start()
+        assert 'profile' in g
+        profiler.stop(0.0)
@@ -0,0 +1,116 @@
+import gzip
+import json
+import sys
+import os
+import pytest
+from flask import Flask
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import responses
+from event_query import BASIC_FIELDS, InvalidQueryError
+from event_query import ALL_FIELDS
+from responses import projection_key, render, render_snapshot, send_rendered, stream_ndjson, wants_ndjson
+
+EVENTS = [
+    {'event_id': f'id{i}', 'event_name': f'UFC Fight Night: Fighter {i} vs. Fighter {i + 1}', 'event_date': 'March 07, 2026',
+     'event_type': 'UFC Fight Night', 'event_number': str(270 + i), 'location': 'Las Vegas, Nevada, USA'}
+    for i in range(10)
+]
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+def test_snapshot_renders_every_projection():
+    """Common projections are rendered once, with compressed variants and a content hash"""
+    rendered = render_snapshot(EVENTS)
+    basic_key, full_key = projection_key(BASIC_FIELDS), projection_key(ALL_FIELDS)
+
+    basic = json.loads(rendered[basic_key]['bodies']['identity'])
+    full = json.loads(rendered[full_key]['bodies']['identity'])
+    names = json.loads(rendered['event_name,event_date']['bodies']['identity'])
+    assert basic['count'] == full['count'] == names['count'] == 10
+    assert 'location' not in basic['events'][0]
+    assert full['events'][0] == EVENTS[0]
+    assert set(names['events'][0]) == {'event_name', 'event_date'}
+    assert len(rendered['event_name,event_date']['bodies']['identity']) < len(rendered[full_key]['bodies']['identity']) / 2
+    assert gzip.decompress(rendered[full_key]['bodies']['gzip']) == rendered[full_key]['bodies']['identity']
+    assert rendered[basic_key]['etag'] != rendered[full_key]['etag']
+    assert render_snapshot(EVENTS)[full_key]['etag'] == rendered[full_key]['etag']
+
+def test_stdlib_encoder_matches_orjson(mocker):
+    """The fallback encoder produces the same bytes, so ETags do not depend on orjson"""
+    fast = render({'events': EVENTS})
+    mocker.patch.object(responses, 'ORJSON_AVAILABLE', False)
+    assert render({'events': EVENTS}) == fast
+
+@pytest.mark.parametrize('accept_encoding, expected', [
+    ('gzip, deflate, br', 'br'),
+    ('gzip', 'gzip'),
+    ('br;q=0.5, gzip', 'gzip'),
+    ('gzip;q=0', None),
+    ('', None),
+])
+def test_accept_encoding_negotiation(app, accept_encoding, expected):
+    rendered = render({'events': EVENTS})
+    with app.test_request_context(headers={'Accept-Encoding': accept_encoding}):
+        response = send_rendered(rendered)
+
+    assert response.headers.get('Content-Encoding') == expected
+    assert response.get_data() == rendered['bodies'][expected or 'identity']
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert response.headers['Cache-Control'] == f"public, max-age={responses.RESPONSE_MAX_AGE}"
+
+def test_matching_etag_gets_304(app):
+    """A polling client with the current ETag only costs a header check"""
+    rendered = render({'events': EVENTS})
+    with app.test_request_context():
+        etag = send_rendered(rendered).headers['ETag']
+    with app.test_request_context(headers={'If-None-Match': etag}):
+        response = send_rendered(rendered)
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+    with app.test_request_context(headers={'If-None-Match': 'W/"outdated"'}):
+        assert send_rendered(rendered).status_code == 200
+
+def test_small_bodies_are_not_compressed():
+    rendered = render({'events': []})
+    assert list(rendered['bodies']) == ['identity']
+
+def test_ndjson_streams_one_projected_event_per_line(mocker):
+    """Events are serialized lazily, in chunks, as the response is consumed"""
+    mocker.patch.object(responses, 'NDJSON_CHUNK_EVENTS', 4)
+    consumed = []
+    def events():
+        for event in EVENTS:
+            consumed.append(event)
+            yield event
+
+    response = stream_ndjson(events(), BASIC_FIELDS)
+    assert consumed == []
+    chunks = list(response.response)
+
+    assert len(chunks) == 3
+    lines = b''.join(chunks).decode('utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [{f: e[f] for f in BASIC_FIELDS} for e in EVENTS]
+    assert response.mimetype == 'application/x-ndjson'
+
+@pytest.mark.parametrize('query, accept, expected', [
+    ('', 'application/x-ndjson', True),
+    ('', 'application/json', False),
+    ('', '*/*', False),
+    ('', '', False),
+    ('?format=ndjson', 'application/json', True),
+    ('?format=json', 'application/x-ndjson', False),
+])
+def test_ndjson_negotiation(app, query, accept, expected):
+    with app.test_request_context(f'/api/events{query}', headers={'Accept': accept}):
+        assert wants_ndjson() == expected
+
+def test_unknown_format_is_rejected(app):
+    with app.test_request_context('/api/events?format=xml'):
+        with pytest.raises(InvalidQueryError):
+            wants_ndjson()
@@ -30,7 +30,7 @@ def test_get_event_date_from_detail_page(mocker):
     mock_response = mocker.Mock()
     mock_response.text = mock_html
     mock_response.status_code = 200
-    mocker.patch('requests.get', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
     
     date = get_event_date_from_detail_page("http://example.com/event")
     assert date == "February 08, 2025"
@@ -47,7 +47,7 @@ def test_get_fight_night_number_from_wiki_url(mocker):
     mock_response = mocker.Mock()
     mock_response.text = mock_html
     mock_response.status_code = 200
-    mocker.patch('requests.get', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
     
     number = get_fight_night_number_from_wiki_url("http://example.com/wiki/Event")
     assert number == "267"
@@ -58,7 +58,7 @@ def test_get_fight_night_number_not_found(mocker):
     mock_response = mocker.Mock()
     mock_response.text = mock_html
     mock_response.status_code = 200
-    mocker.patch('requests.get', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
     
     number = get_fight_night_number_from_wiki_url("http://example.com/wiki/Event")
     assert number is None
@@ -81,7 +81,7 @@ def test_get_event_mapping_from_wikipedia(mocker):
     mock_response = mocker.Mock()
     mock_response.text = mock_html
     mock_response.status_code = 200
-    mocker.patch('requests.get', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
     # Mock get_fight_night_number_from_wiki_url to avoid sub-request
     mocker.patch('scrapers.ufc_scraper.get_fight_night_number_from_wiki_url', return_value="236")
     
@@ -91,6 +91,75 @@ def test_get_event_mapping_from_wikipedia(mocker):
     assert "February 10, 2024" in mapping
     assert mapping["February 10, 2024"] == "UFC Fight Night 236"
 
+def test_get_event_mapping_uses_resolved_number_store(mocker):
+    """Known Fight Nights are resolved from the store without fetching their article"""
+    from scrapers.ufc_scraper import number_store as store
+    store.set("link:/wiki/UFC_Fight_Night_236", "236")
+
+    mock_html = """
+    <table class="wikitable">
+        <tr><th>Event</th><th>Date</th></tr>
+        <tr>
+            <td><a href="/wiki/UFC_Fight_Night_236">UFC Fight Night: Hermansson vs. Pyfer</a></td>
+            <td>February 10, 2024</td>
+        </tr>
+        <tr>
+            <td><a href="/wiki/UFC_Fight_Night_237">UFC Fight Night: Moreno vs. Royval</a></td>
+            <td>February 24, 2024</td>
+        </tr>
+    </table>
+    """
+    mock_response = mocker.Mock()
+    mock_response.text = mock_html
+    mock_response.status_code = 200
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+    article = mocker.patch('scrapers.ufc_scraper.get_fight_night_number_from_wiki_url', return_value="237")
+
+    from scrapers.ufc_scraper import get_event_mapping_from_wikipedia
+    mapping = get_event_mapping_from_wikipedia()
+
+    assert mapping["February 10, 2024"] == "UFC Fight Night 236"
+    assert mapping["February 24, 2024"] == "UFC Fight Night 237"
+    article.assert_called_once_with("https://en.wikipedia.org/wiki/UFC_Fight_Night_237")
+    assert store.get("link:/wiki/UFC_Fight_Night_237") == "237"
+    assert store.get("date:February 24, 2024") == "237"
+
+    # A second scrape makes no article requests at all
+    get_event_mapping_from_wikipedia()
+    assert article.call_count == 1
+
+def test_get_event_mapping_falls_back_to_last_good(mocker):
+    """When Wikipedia fails the last mapping scraped successfully is used instead of none"""
+    from scrapers import ufc_scraper
+    mocker.patch('scrapers.ufc_scraper.fetch', side_effect=Exception("Circuit open for en.wikipedia.org"))
+    assert ufc_scraper.get_event_mapping_from_wikipedia() == {}
+    assert ufc_scraper.wiki_mapping_state['fallback'] is True
+
+    ufc_scraper.mapping_store.set('last_good', {'mapping': {"2024-02-10": "UFC Fight Night 236"}, 'fetched_at': 1.0})
+    assert ufc_scraper.get_event_mapping_from_wikipedia() == {"2024-02-10": "UFC Fight Night 236"}
+    assert ufc_scraper.wiki_mapping_state == {'fallback': True, 'fetched_at': 1.0}
+
+def test_get_event_mapping_survives_store_write_errors(mocker):
+    """A mapping that can't be saved as the fallback copy is still returned as the current one"""
+    from scrapers import ufc_scraper
+    mock_response = mocker.Mock()
+    mock_response.text = """
+    <table class="wikitable">
+        <tr><th>Event</th><th>Date</th></tr>
+        <tr><td><a href="/wiki/UFC_Fight_Night_236">UFC Fight Night: Hermansson vs. Pyfer</a></td><td>February 10, 2024</td></tr>
+    </table>
+    """
+    mock_response.status_code = 200
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.get_fight_night_number_from_wiki_url', return_value="236")
+    ufc_scraper.mapping_store.set('last_good', {'mapping': {"2020-01-01": "UFC Fight Night 1"}, 'fetched_at': 1.0})
+    mocker.patch.object(ufc_scraper.mapping_store, 'set', side_effect=OSError("No space left on device"))
+
+    mapping = ufc_scraper.get_event_mapping_from_wikipedia()
+
+    assert mapping["February 10, 2024"] == "UFC Fight Night 236"
+    assert ufc_scraper.wiki_mapping_state['fallback'] is False
+
 def test_get_upcoming_ufc_schedule(mocker):
     """Test the full scraper orchestration with everything mocked"""
     mock_stats_html = """
@@ -108,7 +177,7 @@ def test_get_upcoming_ufc_schedule(mocker):
     mock_response = mocker.Mock()
     mock_response.text = mock_stats_html
     mock_response.status_code = 200
-    mocker.patch('requests.get', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
     
     # Mock helpers
     mocker.patch('scrapers.ufc_scraper.get_event_mapping_from_wikipedia', return_value={})
@@ -122,3 +191,202 @@ def test_get_upcoming_ufc_schedule(mocker):
     assert events[0]['event_type'] == "UFC"
     assert events[0]['event_number'] == "325"
     assert events[0]['location'] == "Las Vegas, Nevada, USA"
+    assert events[0]['event_id'] == "123"
+
+def test_get_upcoming_ufc_schedule_fetches_details_concurrently(mocker):
+    """Detail pages are fetched in parallel, rows keep their order and failures fall back to Date TBA"""
+    import time
+    mock_stats_html = """
+    <table class="b-statistics__table-events">
+        <tbody>
+            <tr><td><a href="http://ufcstats.com/event-details/1">UFC 325: Event</a></td><td>Sydney, Australia</td></tr>
+            <tr><td><a href="http://ufcstats.com/event-details/2">UFC Fight Night: A vs. B</a></td><td>Las Vegas, Nevada, USA</td></tr>
+            <tr><td><a href="http://ufcstats.com/event-details/3">UFC 326: Event</a></td><td>Paris, France</td></tr>
+        </tbody>
+    </table>
+    """
+    mock_response = mocker.Mock()
+    mock_response.text = mock_stats_html
+    mock_response.status_code = 200
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.get_event_mapping_from_wikipedia', return_value={"March 07, 2026": "UFC Fight Night 270"})
+
+    dates = {
+        "http://ufcstats.com/event-details/1": "February 21, 2026",
+        "http://ufcstats.com/event-details/2": "March 07, 2026",
+        "http://ufcstats.com/event-details/3": "Date TBA",
+    }
+
+    def slow_detail_page(url):
+        time.sleep(0.2)
+        return dates[url]
+
+    mocker.patch('scrapers.ufc_scraper.get_event_date_from_detail_page', side_effect=slow_detail_page)
+
+    from scrapers.ufc_scraper import get_upcoming_ufc_schedule
+    start = time.perf_counter()
+    events = get_upcoming_ufc_schedule(max_workers=3)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert [e['event_name'] for e in events] == ["UFC 325: Event", "UFC Fight Night: A vs. B", "UFC 326: Event"]
+    assert [e['event_date'] for e in events] == ["February 21, 2026", "March 07, 2026", "Date TBA"]
+    assert events[1]['event_number'] == "270"
+
+def test_get_upcoming_ufc_schedule_is_incremental(mocker):
+    """Known event links are reused from the store; only new or expired ones are fetched, keeping their number"""
+    import time
+    from scrapers import ufc_scraper
+    mock_stats_html = """
+    <table class="b-statistics__table-events">
+        <tbody>
+            <tr><td><a href="http://ufcstats.com/event-details/1">UFC 325: Event</a></td><td>Sydney, Australia</td></tr>
+            <tr><td><a href="http://ufcstats.com/event-details/2">UFC Fight Night: A vs. B</a></td><td>Las Vegas, Nevada, USA</td></tr>
+            <tr><td><a href="http://ufcstats.com/event-details/3">UFC Fight Night: C vs. D</a></td><td>Paris, France</td></tr>
+        </tbody>
+    </table>
+    """
+    mock_response = mocker.Mock()
+    mock_response.text = mock_stats_html
+    mock_response.status_code = 200
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+    wiki = mocker.patch('scrapers.ufc_scraper.get_event_mapping_from_wikipedia', return_value={"March 07, 2026": "UFC Fight Night 270"})
+    detail = mocker.patch('scrapers.ufc_scraper.get_event_date_from_detail_page', side_effect=lambda url: {
+        "http://ufcstats.com/event-details/1": "February 21, 2026",
+        "http://ufcstats.com/event-details/2": "March 07, 2026",
+        "http://ufcstats.com/event-details/3": "March 14, 2026",
+    }[url])
+
+    ufc_scraper.event_store.set("http://ufcstats.com/event-details/1", {
+        'event_date': "February 21, 2026", 'event_number': "325", 'location': "Sydney, Australia", 'fetched_at': time.time()
+    })
+    ufc_scraper.event_store.set("http://ufcstats.com/event-details/3", {
+        'event_date': "March 14, 2026", 'event_number': "271", 'location': "Paris, France",
+        'fetched_at': time.time() - ufc_scraper.SCRAPER_EVENT_MAX_AGE - 1
+    })
+
+    events = ufc_scraper.get_upcoming_ufc_schedule()
+
+    assert [call.args[0] for call in detail.call_args_list] == ["http://ufcstats.com/event-details/2", "http://ufcstats.com/event-details/3"]
+    assert [e['event_number'] for e in events] == ["325", "270", "271"]
+    assert ufc_scraper.last_scrape_stats == {'reused': 1, 'fetched': 2}
+    assert ufc_scraper.event_store.get("http://ufcstats.com/event-details/2")['event_number'] == "270"
+    refreshed = ufc_scraper.event_store.get("http://ufcstats.com/event-details/3")
+    assert refreshed['event_number'] == "271"
+    assert time.time() - refreshed['fetched_at'] < ufc_scraper.SCRAPER_EVENT_MAX_AGE
+
+    # Steady state: nothing is fetched and every Fight Night is numbered, so Wikipedia isn't needed
+    detail.reset_mock()
+    wiki.reset_mock()
+    ufc_scraper.get_upcoming_ufc_schedule()
+    assert detail.call_count == 0
+    assert wiki.call_count == 0
+    assert ufc_scraper.last_scrape_stats == {'reused': 3, 'fetched': 0}
+
+def test_get_upcoming_ufc_schedule_survives_store_write_errors(mocker):
+    """A store that can't be written only costs the reuse on the next scrape"""
+    from scrapers import ufc_scraper
+    mock_response = mocker.Mock()
+    mock_response.text = """
+    <table class="b-statistics__table-events"><tbody>
+        <tr><td><a href="http://ufcstats.com/event-details/1">UFC 325: Event</a></td><td>Sydney, Australia</td></tr>
+    </tbody></table>
+    """
+    mock_response.status_code = 200
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+    mocker.patch('scrapers.ufc_scraper.get_event_date_from_detail_page', return_value="February 21, 2026")
+    mocker.patch.object(ufc_scraper.event_store, 'set', side_effect=OSError("No space left on device"))
+
+    events = ufc_scraper.get_upcoming_ufc_schedule()
+
+    assert [e['event_date'] for e in events] == ["February 21, 2026"]
+
+WIKI_LIST_PAGE = """
+<html><body>
+<table class="infobox"><tr><th>Event</th><td>not a schedule</td></tr></table>
+<h2 id="Scheduled_events">Scheduled events</h2>
+<table class="wikitable sortable">
+    <tr><th>Event</th><th>Date</th><th>Venue</th><th>Location</th><th>Ref.</th></tr>
+    <tr>
+        <td><a href="/wiki/UFC_Fight_Night_270">UFC Fight Night: A vs. B</a></td>
+        <td>Mar 7, 2026<sup>[1]</sup></td>
+        <td><table><tr><td>nested</td></tr></table>UFC Apex</td>
+        <td>Las Vegas, Nevada, U.S.</td>
+        <td></td>
+    </tr>
+    <tr>
+        <td><a href="/wiki/UFC_326">UFC 326: C vs. D</a></td>
+        <td>March 14, 2026</td>
+        <td>T-Mobile Arena</td>
+        <td>Las Vegas, Nevada, U.S.</td>
+        <td></td>
+    </tr>
+</table>
+<h2 id="Past_events">Past events</h2>
+<table class="wikitable sortable">
+    <tr><th>#</th><th>Event</th><th>Date</th><th>Venue</th><th>Location</th></tr>
+    <tr><td>700</td><td><a href="/wiki/UFC_325">UFC 325</a></td><td>Feb 21, 2026</td><td>Arena</td><td>Sydney</td></tr>
+</table>
+</body></html>
+"""
+
+def test_targeted_wiki_parse_matches_full_parse(mocker):
+    """Only the scheduled table is parsed in targeted mode, with the same result as a full parse"""
+    from scrapers import ufc_scraper
+    fragment = ufc_scraper.find_scheduled_table_html(WIKI_LIST_PAGE)
+    assert fragment is not None
+    assert 'UFC Fight Night: A vs. B' in fragment and 'Past events' not in fragment
+
+    targeted = ufc_scraper.parse_wiki_scheduled_events(WIKI_LIST_PAGE)
+    mocker.patch('scrapers.ufc_scraper.WIKI_PARSE_MODE', 'full')
+    full = ufc_scraper.parse_wiki_scheduled_events(WIKI_LIST_PAGE)
+
+    assert targeted == full == [
+        ("UFC Fight Night: A vs. B", "Mar 7, 2026", "/wiki/UFC_Fight_Night_270"),
+        ("UFC 326: C vs. D", "March 14, 2026", "/wiki/UFC_326"),
+    ]
+
+def test_find_scheduled_table_without_schedule():
+    from scrapers.ufc_scraper import find_scheduled_table_html
+    assert find_scheduled_table_html("<table class='wikitable'><tr><th>#</th></tr></table>") is None
+
+def test_wiki_mapping_matches_zero_padded_ufcstats_dates(mocker):
+    """Wikipedia's "Feb 7, 2026" resolves UFCStats' "February 07, 2026" and the ISO date"""
+    mock_html = """
+    <table class="wikitable">
+        <tr><th>Event</th><th>Date</th></tr>
+        <tr><td><a href="/wiki/UFC_Fight_Night_267">UFC Fight Night 267: Bautista vs. Oliveira</a></td><td>Feb 7, 2026</td></tr>
+    </table>
+    """
+    mock_response = mocker.Mock()
+    mock_response.text = mock_html
+    mock_response.status_code = 200
+    mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+
+    from scrapers.ufc_scraper import get_event_mapping_from_wikipedia
+    mapping = get_event_mapping_from_wikipedia()
+
+    for key in ("Feb 7, 2026", "February 07, 2026", "February 7, 2026", "2026-02-07"):
+        assert mapping[key] == "UFC Fight Night 267: Bautista vs. Oliveira"
+
+def test_get_completed_events_page(mocker):
+    """A completed list page yields classified events with their id and date, without detail fetches"""
+    fixture = os.path.join(os.path.dirname(__file__), 'fixtures', 'ufcstats_completed.html')
+    mock_response = mocker.Mock()
+    with open(fixture, encoding='utf-8') as f:
+        mock_response.text = f.read()
+    mock_fetch = mocker.patch('scrapers.ufc_scraper.fetch', return_value=mock_response)
+
+    from scrapers.ufc_scraper import get_completed_events_page
+    events = get_completed_events_page(2)
+
+    mock_fetch.assert_called_once_with("http://ufcstats.com/statistics/events/completed?page=2")
+    assert len(events) == 7
+    assert events[1] == {
+        'event_id': '4f1c2a9be07d3e58',
+        'event_date': 'January 24, 2026',
+        'event_type': 'UFC',
+        'event_name': 'UFC 324: Gaethje vs. Pimblett',
+        'event_number': '324',
+        'location': 'Las Vegas, Nevada, USA'
+    }
@@ -0,0 +1,177 @@
+import pytest
+import sys
+import os
+from cachelib import SimpleCache
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from snapshot import SnapshotStore, BackgroundRefresher, SnapshotUnavailableError, get_current_snapshot
+
+EVENTS = [{'event_name': 'UFC 325: Event', 'event_date': 'February 21, 2026'}]
+
+def test_refresh_swaps_in_new_snapshot():
+    """A refresh publishes a new versioned snapshot under the single key"""
+    store = SnapshotStore(SimpleCache(), lambda: EVENTS)
+    assert store.read() is None
+
+    first = store.refresh()
+    second = store.refresh()
+
+    assert store.read()['version'] == second['version'] != first['version']
+    assert store.read()['events'] == EVENTS
+
+def test_stale_snapshot_is_served_while_refresh_is_requested(mocker):
+    """Requests get the stale snapshot immediately and only wake the refresher"""
+    builder = mocker.Mock(return_value=EVENTS)
+    store = SnapshotStore(SimpleCache(), builder, refresh_after=0)
+    stale = store.refresh()
+    refresher = mocker.Mock(spec=BackgroundRefresher)
+
+    snapshot = get_current_snapshot(store, refresher)
+
+    assert snapshot['version'] == stale['version']
+    assert builder.call_count == 1
+    refresher.request_refresh.assert_called_once()
+
+def test_refresher_only_rebuilds_stale_snapshots(mocker):
+    """The background refresher leaves a fresh snapshot alone and survives scrape errors"""
+    builder = mocker.Mock(return_value=EVENTS)
+    store = SnapshotStore(SimpleCache(), builder, refresh_after=3600)
+    refresher = BackgroundRefresher(store)
+
+    refresher.refresh_if_stale()
+    refresher.refresh_if_stale()
+    assert builder.call_count == 1
+
+    store.refresh_after = 0
+    builder.side_effect = Exception("ufcstats.com is down")
+    refresher.refresh_if_stale()
+    assert store.read()['events'] == EVENTS
+
+def test_missing_snapshot_without_refresher_is_built_inline():
+    """Without a background refresher the first request builds the snapshot itself"""
+    store = SnapshotStore(SimpleCache(), lambda: EVENTS)
+    assert get_current_snapshot(store, None)['events'] == EVENTS
+
+def test_stale_snapshot_without_refresher_is_rebuilt_inline(mocker):
+    """With background refresh disabled a stale snapshot is rebuilt by the request, or kept if that fails"""
+    builder = mocker.Mock(return_value=EVENTS)
+    store = SnapshotStore(SimpleCache(), builder, refresh_after=0)
+    first = get_current_snapshot(store, None)
+
+    second = get_current_snapshot(store, None)
+    assert second['version'] != first['version']
+    assert builder.call_count == 2
+
+    builder.side_effect = Exception("ufcstats.com is down")
+    third = get_current_snapshot(store, None)
+    assert third['version'] == second['version']
+    assert third['stale_since']
+
+def test_missing_snapshot_times_out(mocker):
+    """When the refresher can't publish in time the request gets a clear error"""
+    store = SnapshotStore(SimpleCache(), lambda: EVENTS)
+    refresher = mocker.Mock(spec=BackgroundRefresher)
+
+    with pytest.raises(SnapshotUnavailableError):
+        get_current_snapshot(store, refresher, wait_timeout=0.2)
+    refresher.request_refresh.assert_called_once()
+
+def test_concurrent_rebuilds_are_single_flight():
+    """Only one caller scrapes; the rest wait on the lease and are counted as coalesced"""
+    import threading
+    import time
+    calls = []
+
+    def slow_builder():
+        calls.append(1)
+        time.sleep(0.3)
+        return EVENTS
+
+    store = SnapshotStore(SimpleCache(), slow_builder)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.refresh_single_flight(wait_timeout=2))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r['events'] == EVENTS for r in results)
+    assert store.stats() == {'rebuilds': 1, 'coalesced': 4, 'failures': 0}
+    assert store.cache.get(store.lease_key) is None
+
+def test_held_lease_returns_last_good_snapshot(mocker):
+    """While another worker holds the lease the previous snapshot is returned without scraping"""
+    builder = mocker.Mock(return_value=EVENTS)
+    store = SnapshotStore(SimpleCache(), builder)
+    previous = store.refresh()
+    store.cache.add(store.lease_key, 'other-worker', timeout=60)
+
+    snapshot = store.refresh_single_flight(wait_timeout=0)
+
+    assert snapshot['version'] == previous['version']
+    assert builder.call_count == 1
+    assert store.stats()['coalesced'] == 1
+
+def test_failed_rebuild_releases_lease():
+    """A failing scrape frees the lease and is counted"""
+    def failing_builder():
+        raise Exception("ufcstats.com is down")
+
+    store = SnapshotStore(SimpleCache(), failing_builder)
+    with pytest.raises(Exception):
+        store.refresh_single_flight()
+
+    assert store.cache.get(store.lease_key) is None
+    assert store.stats()['failures'] == 1
+
+def test_failed_rebuild_marks_last_good_snapshot_stale(mocker):
+    """The previous snapshot keeps being served, flagged with when the failures started"""
+    builder = mocker.Mock(return_value=EVENTS)
+    store = SnapshotStore(SimpleCache(), builder)
+    previous = store.refresh()
+
+    builder.side_effect = Exception("ufcstats.com is down")
+    for _ in range(2):
+        with pytest.raises(Exception):
+            store.refresh_single_flight()
+
+    snapshot = store.read()
+    assert snapshot['version'] == previous['version']
+    assert snapshot['events'] == EVENTS
+    assert snapshot['last_error'] == "ufcstats.com is down"
+    assert snapshot['stale_since'] <= snapshot['failed_at']
+
+    builder.side_effect = None
+    assert 'stale_since' not in store.refresh_single_flight()
+
+def test_failed_inline_build_is_unavailable():
+    """Without any snapshot a failing scrape is reported as a 503, not a server error"""
+    def failing_builder():
+        raise Exception("ufcstats.com is down")
+
+    with pytest.raises(SnapshotUnavailableError):
+        get_current_snapshot(SnapshotStore(SimpleCache(), failing_builder), None)
+
+def test_describer_fields_are_stored_with_the_snapshot():
+    """Whatever the describer reports right after the build is kept next to the events"""
+    state = {'fallback': False}
+    def builder():
+        state['fallback'] = True
+        return EVENTS
+
+    store = SnapshotStore(SimpleCache(), builder, describer=lambda: {'wiki_mapping': dict(state)})
+    store.refresh()
+    assert store.read()['wiki_mapping'] == {'fallback': True}
+
+def test_refresher_runs_background_tasks_after_the_snapshot_check():
+    """A failing task is logged and doesn't stop the others"""
+    done = []
+    def failing_task():
+        raise Exception("ufcstats.com is down")
+
+    refresher = BackgroundRefresher(SnapshotStore(SimpleCache(), lambda: EVENTS), tasks=[failing_task, lambda: done.append(1)])
+    refresher.run_tasks()
+    assert done == [1]
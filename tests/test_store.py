@@ -0,0 +1,32 @@
+import sys
+import os
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from scrapers.store import FileStore, RedisStore
+
+def test_file_store_persists_across_instances(tmp_path):
+    """Values written by one worker are visible to another reading the same file"""
+    path = str(tmp_path / 'store' / 'numbers.json')
+    writer = FileStore(path)
+    reader = FileStore(path)
+
+    assert reader.get("link:/wiki/UFC_Fight_Night_236") is None
+    writer.set("link:/wiki/UFC_Fight_Night_236", "236")
+    reader.set("date:February 10, 2024", "236")
+
+    assert reader.get("link:/wiki/UFC_Fight_Night_236") == "236"
+    assert writer.get("date:February 10, 2024") == "236"
+
+    writer.delete("link:/wiki/UFC_Fight_Night_236")
+    assert FileStore(path).get("link:/wiki/UFC_Fight_Night_236") is None
+
+def test_redis_store_encodes_values_in_a_hash(mocker):
+    client = mocker.Mock()
+    client.hget.return_value = b'{"date": "February 10, 2024"}'
+    store = RedisStore(client, 'ufc:store:events')
+
+    store.set('http://ufcstats.com/event-details/1', {'date': 'February 10, 2024'})
+    client.hset.assert_called_once_with('ufc:store:events', 'http://ufcstats.com/event-details/1', '{"date": "February 10, 2024"}')
+    assert store.get('http://ufcstats.com/event-details/1') == {'date': 'February 10, 2024'}
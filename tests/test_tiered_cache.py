@@ -0,0 +1,102 @@
+import sys
+import os
+from cachelib import SimpleCache
+
+# Add src to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from tiered_cache import TieredCache
+
+def is_local(key):
+    return key.startswith('hot:')
+
+def test_local_keys_are_served_from_memory(mocker):
+    backend = SimpleCache()
+    backend.set('hot:snapshot', {'version': 'v1'})
+    get_spy = mocker.spy(backend, 'get')
+    cache = TieredCache(backend, local=is_local)
+
+    for _ in range(5):
+        assert cache.get('hot:snapshot') == {'version': 'v1'}
+    assert cache.get('hot:missing') is None
+
+    assert get_spy.call_count == 2
+    stats = cache.stats()
+    assert (stats['l1_hits'], stats['l2_hits'], stats['misses']) == (4, 1, 1)
+    assert stats['l1_hit_rate'] == round(4 / 6, 4)
+
+def test_other_keys_always_go_to_the_backend(mocker):
+    backend = SimpleCache()
+    cache = TieredCache(backend, local=is_local)
+    cache.set('lease', 'token')
+    get_spy = mocker.spy(backend, 'get')
+
+    assert cache.get('lease') == 'token'
+    assert cache.get('lease') == 'token'
+    assert get_spy.call_count == 2
+    assert cache.add('lease', 'other') is False
+    cache.inc('counter')
+    assert backend.get('counter') == 1
+
+def test_writes_publish_and_other_workers_drop_their_copy(mocker):
+    backend = SimpleCache()
+    client = mocker.Mock()
+    writer = TieredCache(backend, local=is_local, client=client)
+    reader = TieredCache(backend, local=is_local, client=client)
+    writer.subscribed = reader.subscribed = True
+
+    writer.set('hot:snapshot', 'v1')
+    assert reader.get('hot:snapshot') == 'v1'
+    writer.set('hot:snapshot', 'v2')
+
+    channel, message = client.publish.call_args[0]
+    assert message == f"{writer.sender} hot:snapshot"
+    # Until the message arrives the reader still has its copy
+    assert reader.get('hot:snapshot') == 'v1'
+    reader.handle_message(message.encode('utf-8'))
+    assert reader.get('hot:snapshot') == 'v2'
+
+    # A worker ignores its own messages; its L1 was updated by the write itself
+    writer.handle_message(message)
+    assert writer.stats()['entries'] == 1
+
+def test_memory_is_not_trusted_without_a_subscription(mocker):
+    backend = SimpleCache()
+    backend.set('hot:snapshot', 'v1')
+    cache = TieredCache(backend, local=is_local, client=mocker.Mock())
+
+    cache.get('hot:snapshot')
+    backend.set('hot:snapshot', 'v2')
+    assert cache.get('hot:snapshot') == 'v2'
+    assert cache.stats()['l1_hits'] == 0
+
+def test_entries_expire_and_are_bounded(mocker):
+    backend = SimpleCache()
+    for name in 'abc':
+        backend.set(f"hot:{name}", name)
+    clock = mocker.patch('tiered_cache.time.monotonic', return_value=1000.0)
+    cache = TieredCache(backend, local=is_local, max_entries=2, ttl=10)
+
+    cache.get('hot:a')
+    cache.get('hot:b')
+    cache.get('hot:c')
+    assert cache.stats()['entries'] == 2
+
+    cache.get('hot:c')
+    clock.return_value = 1011.0
+    cache.get('hot:c')
+    assert (cache.stats()['l1_hits'], cache.stats()['l2_hits']) == (1, 4)
+
+def test_read_racing_an_invalidation_is_not_kept(mocker):
+    backend = SimpleCache()
+    backend.set('hot:snapshot', 'v1')
+    cache = TieredCache(backend, local=is_local)
+
+    def get_then_invalidate(key):
+        value = SimpleCache.get(backend, key)
+        cache.invalidate(key)
+        return value
+
+    mocker.patch.object(backend, 'get', side_effect=get_then_invalidate)
+    assert cache.get('hot:snapshot') == 'v1'
+    assert cache.stats()['entries'] == 0